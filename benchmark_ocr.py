@@ -0,0 +1,80 @@
+# benchmark_ocr.py
+import argparse
+import statistics
+import sys
+import time
+import cv2
+
+from config import OCR_BACKENDS, DEFAULT_SOURCE_LANG
+from services.ocr import get_ocr_backend, is_backend_available, crop_text_region
+
+def benchmark_backend(name, lang, images, repeat):
+    """OCR 백엔드 하나의 초기화/검출/인식 시간 측정"""
+    start = time.perf_counter()
+    backend = get_ocr_backend(name, lang)
+    init_time = time.perf_counter() - start
+
+    detect_times, recognize_times, total_times = [], [], []
+    region_count = 0
+    for _ in range(repeat):
+        for image in images:
+            start = time.perf_counter()
+            boxes = backend.detect(image)
+            detect_times.append(time.perf_counter() - start)
+
+            crops = [crop_text_region(image, box) for box in boxes]
+            start = time.perf_counter()
+            backend.recognize(crops)
+            recognize_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            region_count += len(backend.ocr(image))
+            total_times.append(time.perf_counter() - start)
+
+    # 여러 이미지 조각을 모아 인식하는 배치 OCR (이미지당 평균)
+    batch_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        backend.ocr_batch(images)
+        batch_times.append((time.perf_counter() - start) / len(images))
+
+    backend.close()
+    return {
+        'init': init_time,
+        'detect': statistics.mean(detect_times),
+        'recognize': statistics.mean(recognize_times),
+        'ocr': statistics.mean(total_times),
+        'batch': statistics.mean(batch_times),
+        'regions': region_count / max(1, repeat)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 백엔드 비교 벤치마크")
+    parser.add_argument("images", nargs="+", help="테스트 이미지 경로")
+    parser.add_argument("--backends", default=",".join(OCR_BACKENDS), help="비교할 백엔드 (쉼표 구분)")
+    parser.add_argument("--lang", default=DEFAULT_SOURCE_LANG, help="원본 언어")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    images = [cv2.imread(path) for path in args.images]
+    if any(image is None for image in images):
+        print("이미지를 불러올 수 없습니다.")
+        sys.exit(1)
+
+    print(f"이미지 {len(images)}개, 반복 {args.repeat}회, 언어: {args.lang}\n")
+    print(f"{'백엔드':<12}{'초기화(s)':>12}{'검출(ms)':>12}{'인식(ms)':>12}{'전체(ms)':>12}{'배치(ms)':>12}{'영역 수':>10}")
+
+    for name in args.backends.split(","):
+        name = name.strip()
+        if not is_backend_available(name, args.lang):
+            print(f"{name:<12}사용 불가 (패키지 또는 모델 없음)")
+            continue
+        try:
+            result = benchmark_backend(name, args.lang, images, args.repeat)
+            print(f"{name:<12}{result['init']:>12.2f}{result['detect'] * 1000:>12.1f}"
+                  f"{result['recognize'] * 1000:>12.1f}{result['ocr'] * 1000:>12.1f}{result['batch'] * 1000:>12.1f}{result['regions']:>10.0f}")
+        except Exception as e:
+            print(f"{name:<12}오류: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,25 @@ APP_TITLE = "Powerpoint Image Translator"
 APP_VERSION = "1.0.0"
 DEFAULT_WINDOW_SIZE = "800x1000"
 DEFAULT_PADDING = 10
+UI_REFRESH_MS = 100  # 번역 프로세스 메시지(진행률, 상태, 로그)를 화면에 반영하는 주기
+ENGINE_CANCEL_GRACE_SECONDS = 10  # 번역 중지 요청 후 번역 프로세스를 강제 종료하기까지 기다리는 시간
 
 # 언어 설정
 SUPPORTED_LANGUAGES = ["한국어", "일본어", "영어", "중국어번체", "중국어간체", "태국어", "스페인어", "프랑스어"]
 DEFAULT_SOURCE_LANG = "일본어"
 DEFAULT_TARGET_LANG = "한국어"
 DEFAULT_MODEL = "gemma3:12b"
+NO_SPACE_LANGUAGES = ["일본어", "중국어간체", "중국어번체"]  # 단어 사이 띄어쓰기가 없는 언어
+LANGUAGE_CODES = {  # 다국어 번역 시 출력 파일 이름에 붙는 언어 코드
+    "한국어": "ko",
+    "일본어": "ja",
+    "영어": "en",
+    "중국어번체": "zh-TW",
+    "중국어간체": "zh-CN",
+    "태국어": "th",
+    "스페인어": "es",
+    "프랑스어": "fr"
+}
 
 # OCR 설정
 OCR_LANG_MAPPING = {
@@ -25,14 +38,128 @@ OCR_LANG_MAPPING = {
     '프랑스어': ['fra', 'eng']
 }
 
+# OCR 백엔드 설정
+OCR_BACKENDS = ["paddle", "onnx", "tesseract"]
+DEFAULT_OCR_BACKEND = "paddle"
+ONNX_OCR_MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "ppocr_onnx")
+ONNX_OCR_THREADS = 0  # 0이면 ONNX Runtime 기본값 (물리 코어 수)
+OCR_REC_BATCH_SIZE = 16  # 인식 모델 1회 실행당 텍스트 조각 수
+OCR_SCHEDULER_BATCH_SIZE = 128  # 여러 이미지에서 모아 한 번에 인식기로 넘기는 조각 수
+OCR_DETECT_WORKERS = max(1, (os.cpu_count() or 2) // 2)  # 검출 병렬 처리 스레드 수
+TESSERACT_WORKERS = os.cpu_count() or 1  # 언어 조합별 상주 Tesseract 엔진 수
+OCR_WORKER_PROCESSES = 0  # OCR 전용 워커 프로세스 수 (0이면 번역 프로세스 안에서 실행)
+OCR_WORKER_MAX_IMAGES = 200  # 워커 교체 전 최대 처리 이미지 수
+OCR_WORKER_RSS_LIMIT_MB = 3072  # 워커 교체 메모리 기준 (RSS)
+OCR_WORKER_CHUNK_SIZE = 8  # 워커에 한 번에 넘기는 이미지 수
+OCR_WORKER_MAX_ATTEMPTS = 3  # 워커 비정상 종료 시 같은 작업 재시도 횟수
+
+# 용어집 설정 (첫 행에 언어 이름을 열 제목으로 쓰는 CSV, 예: 일본어,한국어,영어)
+GLOSSARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "glossary.csv")
+GLOSSARY_MAX_PROMPT_TERMS = 30  # 문장 하나의 프롬프트에 넣는 최대 용어 수
+
+# 번역 제외 분류 설정 (규칙에 해당하는 텍스트는 LLM 호출 없이 원문 그대로 사용)
+LANGUAGE_SCRIPTS = {  # 언어별 문자 체계 (이미 대상 언어로 된 텍스트 판별용)
+    "한국어": ["hangul"],
+    "일본어": ["kana", "han"],
+    "영어": ["latin"],
+    "중국어번체": ["han"],
+    "중국어간체": ["han"],
+    "태국어": ["thai"],
+    "스페인어": ["latin"],
+    "프랑스어": ["latin"]
+}
+SEGMENT_SKIP_RULES = ["numeric", "date", "url", "email", "part_number", "code", "symbol", "target_script"]
+SEGMENT_SKIP_RULES_BY_PAIR = {  # (원본 언어, 대상 언어)별 규칙 (없으면 SEGMENT_SKIP_RULES 사용)
+    # 예: 영어 제품 코드도 번역해야 하는 경우 ("일본어", "영어"): ["numeric", "url", "email", "symbol"]
+}
+
+# 번역 백엔드 설정
+TRANSLATION_BACKENDS = ["ollama", "openai"]  # openai: llama.cpp server, vLLM 등 OpenAI 호환 API 서버
+TRANSLATION_BACKEND = "ollama"
+OPENAI_COMPAT_URL = "http://localhost:8080/v1"  # OpenAI 호환 서버 주소 (/v1까지)
+OPENAI_COMPAT_API_KEY = ""  # 서버가 요구할 때만 설정
+OPENAI_COMPAT_CONCURRENCY = 16  # 동시에 보내는 요청 수 (연속 배칭을 지원하는 서버는 크게)
+OPENAI_COMPAT_JSON_MODE = True  # response_format json_object 지원 여부 (아니면 이미지 영역을 하나씩 번역)
+
 # Ollama 설정
 DEFAULT_OLLAMA_URL = "http://localhost:11434"
+OLLAMA_URLS = [DEFAULT_OLLAMA_URL]  # 번역 요청을 나눠 보낼 Ollama 서버 목록 (2개 이상이면 서버 풀 사용)
+OLLAMA_HEALTH_INTERVAL = 10  # 서버 풀의 상태 확인 주기(초)
+OLLAMA_DRAIN_FAILURES = 3  # 서버 하나가 연속으로 이 횟수만큼 실패하면 요청 대상에서 제외
+OLLAMA_DRAIN_SECONDS = 60  # 제외한 서버를 다시 사용하기 전 대기 시간(초)
+OLLAMA_COLD_START_SECONDS = 10  # 모델이 로드되지 않은 서버로 보낼 때 더하는 예상 로드 시간(초)
 OLLAMA_CONNECT_TIMEOUT = 5
 OLLAMA_READ_TIMEOUT = 60
+OLLAMA_REGION_MAX_RETRIES = 2  # 이미지 영역 번역 시 누락된 ID 재시도 횟수
+TEXT_TRANSLATION_WORKERS = 4  # 동시에 보내는 텍스트 번역 요청 수 (Ollama의 OLLAMA_NUM_PARALLEL에 맞춤)
+OLLAMA_KEEP_ALIVE = "30m"  # 번역 작업 중 요청마다 연장하는 모델 상주 시간 (OCR 등으로 요청이 뜸해도 언로드 방지)
+OLLAMA_RELEASE_AFTER_JOB = True  # 작업이 끝나면 모델을 바로 언로드해 메모리 반환
+OLLAMA_PRELOAD_JOIN_SECONDS = 3  # 작업 종료(중지, 오류 포함) 시 진행 중인 모델 미리 로드를 기다리는 최대 시간(초)
+OLLAMA_TIMEOUT_BASE = 15  # 첫 응답 이후 생성에 허용하는 기본 시간(초)
+OLLAMA_TIMEOUT_MIN_RATE = 5.0  # 생성 속도를 아직 관측하지 못했을 때 가정하는 초당 토큰 수
+OLLAMA_TIMEOUT_FACTOR = 3.0  # 예상 생성 시간(최대 생성 토큰 ÷ 관측 속도) 대비 허용 배수
+OLLAMA_RETRY_ATTEMPTS = 3  # 실패한 번역 요청의 최대 시도 횟수
+OLLAMA_RETRY_BACKOFF = 2.0  # 첫 재시도까지 대기 시간(초), 이후 두 배씩 증가
+OLLAMA_RETRY_BACKOFF_MAX = 30.0
+CONCURRENCY_ADAPTIVE = True  # 동시 요청 수를 처리량과 응답 시간에 따라 자동 조절 (AIMD, 끄면 백엔드의 고정 동시 요청 수 사용)
+CONCURRENCY_MAX_PER_SERVER = 16  # 자동 조절 시 서버 하나당 최대 동시 요청 수 (고정 병렬 수보다 큰 값도 탐색)
+CONCURRENCY_INITIAL = 2  # 자동 조절 시작 시 동시 요청 수
+CONCURRENCY_DECREASE = 0.7  # 과부하로 판단되면 동시 요청 수에 곱하는 비율
+CONCURRENCY_LATENCY_FACTOR = 2.5  # p90 응답 시간이 가장 빨랐던 중앙값의 이 배수를 넘으면 과부하로 판단
+CONCURRENCY_MIN_ROUND = 4  # 조절 판단 전에 모으는 최소 응답 수
+CIRCUIT_FAILURE_THRESHOLD = 5  # 연속 실패가 이 횟수에 이르면 요청 일시 중지
+CIRCUIT_RESET_SECONDS = 20  # 일시 중지 후 시험 요청까지 대기 시간(초)
+CIRCUIT_GIVE_UP_SECONDS = 180  # 장애가 이 시간 이상 계속되면 남은 요청은 바로 원문으로 대체
+ROUTING_SMALL_MODEL = ""  # 짧고 단순한 문장에 쓸 작은 모델 (비우면 모든 문장을 선택한 모델로 번역)
+ROUTING_SHORT_MAX_TOKENS = 16  # 이 토큰 수 이하인 한 줄 문장을 짧은 문장으로 봄
+ROUTING_SHORT_MAX_SENTENCES = 1  # 짧은 문장으로 보는 최대 문장 수
+ROUTING_GLOSSARY_PIN_TERMS = 2  # 용어집 용어가 이 개수 이상 들어 있으면 용어 번역이 흔들리지 않도록 고정 모델 사용
+ROUTING_GLOSSARY_MODEL = ""  # 용어집 용어가 많은 문장의 고정 모델 (비우면 선택한 모델)
+NUM_PREDICT_RATIO = 2.0  # 원문 추정 토큰 수 대비 최대 생성 토큰 수 (언어 쌍별 값이 없을 때)
+NUM_PREDICT_RATIOS = {  # (원본 언어, 대상 언어)별 최대 생성 토큰 비율 (번역문이 길어지는 언어 쌍은 크게)
+    ("영어", "한국어"): 2.5,
+    ("영어", "일본어"): 2.5,
+    ("영어", "태국어"): 3.0,
+    ("일본어", "영어"): 1.5,
+    ("중국어간체", "영어"): 1.5,
+    ("중국어번체", "영어"): 1.5
+}
+SEGMENT_TOKEN_BUDGET = 400  # 한 번에 번역 요청하는 최대 원문 토큰 수 (넘으면 문장 경계에서 나눠 병렬 번역)
+NUM_PREDICT_MIN = 32  # 짧은 문장의 최소 생성 토큰 수
+NUM_PREDICT_STRICT_FACTOR = 0.7  # 생성 중단 후 재시도할 때 한도에 곱하는 비율
+RUNAWAY_REPEAT_COUNT = 4  # 같은 조각이 이 횟수 이상 연속 반복되면 생성 중단
+RUNAWAY_SYMBOL_MIN_SPAN = 40  # 숫자/기호만으로 된 조각(예: ",000", "...")은 원문에 없을 때 이 글자 수 이상 반복되어야 생성 중단
+TRANSLATION_EXAMPLES = {  # (원본 언어, 대상 언어)별 고정 번역 예시 (모든 요청의 앞부분이 같아 서버의 프롬프트 캐시 재사용)
+    ("일본어", "한국어"): [
+        ("四半期業績の概要", "분기 실적 개요"),
+        ("詳細は担当者までお問い合わせください。", "자세한 내용은 담당자에게 문의해 주세요.")
+    ],
+    ("일본어", "영어"): [
+        ("四半期業績の概要", "Quarterly Results Overview"),
+        ("詳細は担当者までお問い合わせください。", "Please contact the person in charge for details.")
+    ],
+    ("한국어", "일본어"): [
+        ("분기 실적 개요", "四半期業績の概要"),
+        ("자세한 내용은 담당자에게 문의해 주세요.", "詳細は担当者までお問い合わせください。")
+    ],
+    ("한국어", "영어"): [
+        ("분기 실적 개요", "Quarterly Results Overview"),
+        ("자세한 내용은 담당자에게 문의해 주세요.", "Please contact the person in charge for details.")
+    ],
+    ("영어", "한국어"): [
+        ("Quarterly Results Overview", "분기 실적 개요"),
+        ("Please contact the person in charge for details.", "자세한 내용은 담당자에게 문의해 주세요.")
+    ],
+    ("영어", "일본어"): [
+        ("Quarterly Results Overview", "四半期業績の概要"),
+        ("Please contact the person in charge for details.", "詳細は担当者までお問い合わせください。")
+    ]
+}
 
 # 이미지 처리 설정
 MAX_IMAGE_SIZE = 600  # 픽셀
 MAX_IMAGE_FILESIZE = 2 * 1024 * 1024  # 2MB
+RENDER_POOL_SIZE = max(0, (os.cpu_count() or 1) - 1)  # 렌더링 프로세스 수 (0이면 현재 스레드에서 렌더링)
 
 # 임시 디렉토리
 TEMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
@@ -5,16 +5,15 @@ import logging
 import sys
 from ui.app import PowerPointTranslatorApp
 from utils.logging_utils import setup_logging
+from services.ocr import available_backends
 
-# PaddleOCR 의존성 체크
-try:
-    import paddle
-    import paddleocr
-    from paddleocr import PaddleOCR
-    logging.info(f"PaddleOCR 확인 성공: paddle v{paddle.__version__}, paddleocr v{paddleocr.__version__}")
-except ImportError as e:
+# OCR 백엔드 의존성 체크 (엔진은 import하지 않고 설치 여부만 확인)
+ocr_backends = available_backends()
+if ocr_backends:
+    logging.info(f"사용 가능한 OCR 백엔드: {', '.join(ocr_backends)}")
+else:
     print("\n========================================================================")
-    print("오류: 필수 패키지 PaddleOCR이 설치되지 않았습니다.")
+    print("오류: 사용 가능한 OCR 엔진(PaddleOCR, ONNX Runtime, Tesseract)이 없습니다.")
     print("다음 명령어로 필요한 패키지를 설치하세요:")
     print("    pip install paddlepaddle -U")
     print("    pip install paddleocr -U")
@@ -1,3 +1,4 @@
 from services.ollama_service import OllamaService
+from services.ollama_pool import OllamaPool
 from services.document_analyzer import DocumentAnalyzer
-from services.translation import TranslationService
\ No newline at end of file
+from services.translation import TranslationService, TranslationCancelled
\ No newline at end of file
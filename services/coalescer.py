@@ -0,0 +1,69 @@
+# services/coalescer.py
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import TEXT_TRANSLATION_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_INLINE_SPACE = re.compile(r"[ \t]+")
+
+def normalize_segment(text):
+    """중복 판별용 문장 정규화 (앞뒤 공백 제거, 연속 공백을 하나로; 줄바꿈은 유지)"""
+    return _INLINE_SPACE.sub(" ", text.strip())
+
+class RequestCoalescer:
+    """작업 안에서 같은 요청은 한 번만 실행하고 결과를 공유 (실행 중인 요청에도 합류)
+
+    요청은 스레드 풀(또는 submit/shutdown을 가진 executor)에서 병렬로 실행되며,
+    같은 key의 요청은 처음 만든 Future를 돌려받는다.
+    """
+    def __init__(self, max_workers=TEXT_TRANSLATION_WORKERS, executor=None):
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="translate")
+        self.executor = executor
+        self.futures = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def _future(self, key, func, args, kwargs):
+        future = self.futures.get(key)
+        if future is None:
+            future = self.executor.submit(func, *args, **kwargs)
+            self.futures[key] = future
+        return future
+
+    def prefetch(self, key, func, *args, **kwargs):
+        """결과가 필요해지기 전에 미리 요청 시작 (요청 수 집계에는 포함하지 않음)"""
+        with self.lock:
+            return self._future(key, func, args, kwargs)
+
+    def submit(self, key, func, *args, **kwargs):
+        """요청 실행 또는 이미 시작된 같은 요청의 Future 반환"""
+        with self.lock:
+            self.requests += 1
+            return self._future(key, func, args, kwargs)
+
+    def stats(self):
+        """요청 수, 실제 실행 수, 중복으로 생략한 수"""
+        with self.lock:
+            unique = len(self.futures)
+            duplicates = max(0, self.requests - unique)
+            return {
+                'requests': self.requests,
+                'unique': unique,
+                'duplicates': duplicates,
+                'ratio': duplicates / self.requests if self.requests else 0.0
+            }
+
+    def close(self, cancel=False):
+        """실행기 종료 (cancel이면 아직 시작하지 않은 요청 취소)"""
+        self.executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel=exc_type is not None)
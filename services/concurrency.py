@@ -0,0 +1,111 @@
+# services/concurrency.py
+import logging
+import threading
+import time
+
+from config import (CONCURRENCY_INITIAL, CONCURRENCY_DECREASE, CONCURRENCY_LATENCY_FACTOR, CONCURRENCY_MIN_ROUND)
+
+logger = logging.getLogger(__name__)
+
+def _percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+class AIMDController:
+    """처리량과 응답 시간으로 동시 요청 수(창)를 조절하는 AIMD 조절기
+
+    창 크기만큼 응답이 모일 때마다(한 라운드) 판단한다. 실패가 있거나 p90 응답 시간이 가장 빨랐던 라운드의
+    중앙값보다 크게 늘었거나, 창을 늘렸는데 처리량(초당 출력 토큰)이 줄었으면 창을 곱셈으로 줄이고
+    그 외에는 1씩 늘린다. 응답 시간은 요청 토큰 수로 나눈 토큰당 시간으로 비교해 짧은 라벨과 긴 문단이
+    섞여 있어도 긴 요청이 몰린 라운드를 서버 포화로 보지 않는다.
+    """
+    def __init__(self, max_window, min_window=1, initial=CONCURRENCY_INITIAL, token_counter=None,
+                 decrease=CONCURRENCY_DECREASE, latency_factor=CONCURRENCY_LATENCY_FACTOR,
+                 min_round=CONCURRENCY_MIN_ROUND):
+        self.max_window = max(1, max_window)
+        self.min_window = max(1, min(min_window, self.max_window))
+        self.window = float(min(self.max_window, max(self.min_window, initial)))
+        self.token_counter = token_counter  # 누적 출력 토큰 수를 돌려주는 함수 (없으면 초당 응답 수로 판단)
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.min_round = min_round
+        self.in_flight = 0
+        self.cond = threading.Condition()
+        self.baseline_latency = None  # 가장 빨랐던 라운드의 토큰당 응답 시간 중앙값
+        self.history = []  # 라운드별 {'window', 'throughput', 'p50', 'p90', 'action'}
+        self._start_round()
+
+    def _start_round(self):
+        self.round_started = time.monotonic()
+        self.round_tokens = self.token_counter() if self.token_counter else 0
+        self.round_latencies = []
+        self.round_failures = 0
+
+    def acquire(self):
+        """요청 전에 호출 (창이 가득 차면 자리가 날 때까지 대기)"""
+        with self.cond:
+            while self.in_flight >= int(self.window):
+                self.cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency, failed=False, tokens=1):
+        """응답(또는 실패) 후 호출 (tokens: 요청 크기, 원문 추정 토큰 수), 라운드가 끝나면 창 크기 조절"""
+        with self.cond:
+            self.in_flight -= 1
+            if failed:
+                self.round_failures += 1
+            else:
+                self.round_latencies.append(latency / max(1, tokens))
+            if len(self.round_latencies) + self.round_failures >= max(int(self.window), self.min_round):
+                self._adjust()
+            self.cond.notify_all()
+
+    def _adjust(self):
+        """라운드 결과로 창 크기 조절 (잠금을 잡은 상태에서 호출)"""
+        elapsed = max(1e-6, time.monotonic() - self.round_started)
+        if self.token_counter:
+            throughput = (self.token_counter() - self.round_tokens) / elapsed
+        else:
+            throughput = len(self.round_latencies) / elapsed
+        p50 = _percentile(self.round_latencies, 0.5) if self.round_latencies else 0.0
+        p90 = _percentile(self.round_latencies, 0.9) if self.round_latencies else 0.0
+        if self.round_latencies and (self.baseline_latency is None or p50 < self.baseline_latency):
+            self.baseline_latency = p50
+
+        previous = self.history[-1] if self.history else None
+        window = int(self.window)
+        if self.round_failures:
+            action = 'decrease'
+        elif self.baseline_latency and p90 > self.baseline_latency * self.latency_factor:
+            action = 'decrease'
+        elif previous and window > previous['window'] and throughput < previous['throughput'] * 0.9:
+            action = 'decrease'
+        else:
+            action = 'increase'
+
+        if action == 'decrease':
+            self.window = max(self.min_window, self.window * self.decrease)
+        else:
+            self.window = min(self.max_window, self.window + 1)
+        self.history.append({'window': window, 'throughput': throughput, 'p50': p50, 'p90': p90, 'action': action})
+        if int(self.window) != window:
+            logger.debug(f"동시 요청 수 {window} → {int(self.window)} (처리량 {throughput:.1f}/초, "
+                         f"토큰당 p90 {p90 * 1000:.0f}ms, 실패 {self.round_failures})")
+        self._start_round()
+
+    def stats(self):
+        """현재 창 크기와 창 크기별 평균 처리량(처리량 곡선)"""
+        with self.cond:
+            history = list(self.history)
+            window = int(self.window)
+        curve = {}
+        for record in history:
+            curve.setdefault(record['window'], []).append(record['throughput'])
+        return {
+            'window': window,
+            'max_window': self.max_window,
+            'rounds': len(history),
+            'unit': 'tokens' if self.token_counter else 'requests',
+            'curve': {size: sum(values) / len(values) for size, values in sorted(curve.items())},
+            'decreases': sum(1 for record in history if record['action'] == 'decrease')
+        }
@@ -1,20 +1,35 @@
 # services/document_analyzer.py
+import hashlib
 import os
 import logging
 from pptx import Presentation
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 
 logger = logging.getLogger(__name__)
 
+# 마스터/레이아웃 자리표시자 중 슬라이드에 실제로 표시되는 종류 (제목/본문은 편집용 안내 문구)
+TEMPLATE_PLACEHOLDER_TYPES = {PP_PLACEHOLDER.FOOTER, PP_PLACEHOLDER.HEADER,
+                              PP_PLACEHOLDER.DATE, PP_PLACEHOLDER.SLIDE_NUMBER}
+
+def get_element_part(ppt, element):
+    """요소가 속한 슬라이드, 레이아웃 또는 마스터"""
+    part = element.get('part', 'slide')
+    if part == 'master':
+        return ppt.slide_masters[element['master_idx']]
+    if part == 'layout':
+        return ppt.slide_masters[element['master_idx']].slide_layouts[element['layout_idx']]
+    return ppt.slides[element['slide_idx']]
+
 class DocumentAnalyzer:
-    def analyze_ppt(self, file_path):
-        """PPT 파일 분석 (텍스트 요소를 문단 단위로 추출)"""
+    def analyze_ppt(self, file_path, ppt=None):
+        """PPT 파일 분석 (텍스트 요소를 문단 단위로 추출, 이미 연 Presentation이 있으면 재사용)"""
         logger.info(f"문서 분석 시작: {file_path}")
         
         try:
             # 분석 작업 시작
             file_name = os.path.basename(file_path)
-            ppt = Presentation(file_path)
+            if ppt is None:
+                ppt = Presentation(file_path)
             slide_count = len(ppt.slides)
             
             # 요소 초기화
@@ -25,11 +40,16 @@ class DocumentAnalyzer:
             total_image_count = 0
             total_table_cells = 0
             
+            # 슬라이드가 사용하는 마스터/레이아웃의 텍스트는 슬라이드보다 먼저 한 번씩만 분석
+            layout_placeholders = self._analyze_templates(ppt, text_elements)
+            template_count = len(text_elements)
+            
             # 각 슬라이드 분석
             for slide_idx, slide in enumerate(ppt.slides):
                 logger.debug(f"슬라이드 {slide_idx+1} 분석 중")
                 self._analyze_slide(slide, slide_idx, text_elements, image_elements, 
-                                   total_text_count, total_image_count, total_table_cells)
+                                   total_text_count, total_image_count, total_table_cells,
+                                   layout_placeholders)
             
             # 총 요소 수 계산
             total_elements = len(text_elements) + len(image_elements)
@@ -45,25 +65,98 @@ class DocumentAnalyzer:
                 'total_text_count': total_text_count,
                 'total_image_count': total_image_count,
                 'total_table_cells': total_table_cells,
-                'total_elements': total_elements
+                'total_elements': total_elements,
+                'template_text_count': template_count,
+                'inherited_text_count': sum(1 for element in text_elements if 'inherits' in element)
             }
             
-            logger.info(f"문서 분석 완료: 슬라이드 {slide_count}개, 텍스트 요소 {total_text_count}개, 이미지 {total_image_count}개")
+            logger.info(f"문서 분석 완료: 슬라이드 {slide_count}개, 텍스트 요소 {total_text_count}개 "
+                        f"(마스터/레이아웃 {template_count}개, 상속 {result['inherited_text_count']}개), "
+                        f"이미지 {total_image_count}개")
             return result
             
         except Exception as e:
             logger.exception(f"문서 분석 오류: {str(e)}")
             raise
             
+    def _analyze_templates(self, ppt, text_elements):
+        """사용 중인 마스터와 레이아웃의 고정 텍스트 분석 → {레이아웃 경로: {자리표시자 idx: {문단 번호: 요소}}}"""
+        used_layouts = {str(slide.slide_layout.part.partname) for slide in ppt.slides}
+        layout_placeholders = {}
+        
+        for master_idx, master in enumerate(ppt.slide_masters):
+            layouts = [(layout_idx, layout) for layout_idx, layout in enumerate(master.slide_layouts)
+                       if str(layout.part.partname) in used_layouts]
+            if not layouts:
+                continue
+            
+            # 마스터 자리표시자는 종류로, 레이아웃 자리표시자는 idx로 하위 자리표시자와 대응
+            master_placeholders = self._analyze_template_part(
+                master, {'part': 'master', 'master_idx': master_idx}, text_elements,
+                key=lambda shape: shape.placeholder_format.type
+            )
+            for layout_idx, layout in layouts:
+                layout_placeholders[str(layout.part.partname)] = self._analyze_template_part(
+                    layout, {'part': 'layout', 'master_idx': master_idx, 'layout_idx': layout_idx}, text_elements,
+                    key=lambda shape: shape.placeholder_format.idx,
+                    parent=master_placeholders, parent_key=lambda shape: shape.placeholder_format.type
+                )
+        
+        logger.debug(f"마스터/레이아웃 분석: 레이아웃 {len(layout_placeholders)}개, 텍스트 요소 {len(text_elements)}개")
+        return layout_placeholders
+    
+    def _analyze_template_part(self, part, location, text_elements, key, parent=None, parent_key=None):
+        """마스터 또는 레이아웃 하나의 텍스트 요소 추가 → {자리표시자 키: {문단 번호: 요소}}"""
+        placeholders = {}
+        part_id = str(part.part.partname)
+        for shape_idx, shape in enumerate(part.shapes):
+            try:
+                if shape.is_placeholder and shape.placeholder_format.type not in TEMPLATE_PLACEHOLDER_TYPES:
+                    continue
+                if not (hasattr(shape, "text_frame") and shape.text.strip()):
+                    continue
+                
+                text_start = len(text_elements)
+                self._process_text_frame(shape, None, shape_idx, text_elements)
+                for element in text_elements[text_start:]:
+                    element.update(location, slide_id=part_id, shape_id=shape.shape_id)
+                
+                if shape.is_placeholder:
+                    paragraphs = {element['para_idx']: element for element in text_elements[text_start:]}
+                    placeholders[key(shape)] = paragraphs
+                    if parent is not None:
+                        self._link_inherited(paragraphs, parent.get(parent_key(shape)))
+            except Exception as e:
+                logger.error(f"마스터/레이아웃 요소 분석 오류 ({part_id}, 요소 {shape_idx}): {str(e)}")
+        return placeholders
+    
+    def _link_inherited(self, paragraphs, parent_paragraphs):
+        """상위(레이아웃/마스터) 자리표시자와 같은 텍스트인 문단에 상속 관계 기록 (번역은 상위 요소 결과 재사용)"""
+        if not parent_paragraphs:
+            return
+        for para_idx, element in paragraphs.items():
+            parent = parent_paragraphs.get(para_idx)
+            if parent is not None and parent['text'] == element['text']:
+                element['inherits'] = parent.get('inherits', parent)
+    
     def _analyze_slide(self, slide, slide_idx, text_elements, image_elements, 
-                      total_text_count, total_image_count, total_table_cells):
+                      total_text_count, total_image_count, total_table_cells, layout_placeholders=None):
         """개별 슬라이드 분석"""
+        if layout_placeholders:
+            placeholders = layout_placeholders.get(str(slide.slide_layout.part.partname), {})
+        else:
+            placeholders = {}
+        
         # 각 요소 분석
         for shape_idx, shape in enumerate(slide.shapes):
+            text_start, image_start = len(text_elements), len(image_elements)
             try:
-                # 텍스트 프레임 처리
+                # 텍스트 프레임 처리 (레이아웃 자리표시자 텍스트를 그대로 가진 문단은 상속 관계 기록)
                 if hasattr(shape, "text_frame") and shape.text.strip():
                     self._process_text_frame(shape, slide_idx, shape_idx, text_elements)
+                    if shape.is_placeholder and placeholders:
+                        paragraphs = {element['para_idx']: element for element in text_elements[text_start:]}
+                        self._link_inherited(paragraphs, placeholders.get(shape.placeholder_format.idx))
                 
                 # 테이블 처리
                 if hasattr(shape, "table"):
@@ -72,6 +165,11 @@ class DocumentAnalyzer:
                 # 이미지 처리
                 if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
                     self._process_image(shape, slide_idx, shape_idx, image_elements)
+                
+                # 증분 번역에서 요소를 식별할 수 있도록 슬라이드/도형 고유 ID 기록
+                for element in text_elements[text_start:] + image_elements[image_start:]:
+                    element['slide_id'] = slide.slide_id
+                    element['shape_id'] = shape.shape_id
                     
             except Exception as e:
                 logger.error(f"요소 분석 오류 (슬라이드 {slide_idx+1}, 요소 {shape_idx}): {str(e)}")
@@ -117,5 +215,6 @@ class DocumentAnalyzer:
             'shape_idx': shape_idx,
             'type': 'image',
             'size': image_size,
+            'hash': hashlib.sha1(image_bytes).hexdigest(),
             'translated': False
         })
\ No newline at end of file
@@ -0,0 +1,134 @@
+# services/engine_process.py
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+class _QueueLogHandler(logging.handlers.QueueHandler):
+    """번역 프로세스의 로그 레코드를 ('log', record) 메시지로 UI 프로세스에 전달"""
+    def enqueue(self, record):
+        self.queue.put(('log', record))
+
+def _engine_main(messages, cancel_event, job):
+    """번역 프로세스: 작업 하나를 실행하고 진행률, 상태, 로그, 결과를 메시지로 보냄
+
+    메시지는 ('progress', 현재, 전체), ('status', 문구), ('log', 레코드), ('done', 결과 파일),
+    ('cancelled',), ('error', 오류 문구) 중 하나이며 마지막 셋 중 하나로 끝난다.
+    """
+    debug = job.get('debug_mode', False)
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_QueueLogHandler(messages))
+    root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    # 엔진 모듈(OCR, 이미지 처리)은 UI 프로세스가 아닌 번역 프로세스에서만 로드
+    from config import TRANSLATION_BACKEND
+    from services.llm import get_translation_backend
+    from services.translation import TranslationService, TranslationCancelled
+
+    def progress_callback(current, total):
+        messages.put(('progress', current, total))
+
+    def status_callback(status_text):
+        messages.put(('status', status_text))
+
+    backend = None
+    try:
+        backend = get_translation_backend(TRANSLATION_BACKEND)
+        translation_service = TranslationService(backend)
+        options = {
+            "source_lang": job['source_lang'],
+            "ocr_backend": job['ocr_backend'],
+            "incremental": job.get('incremental', False),
+            "debug_mode": debug,
+            "cancel_event": cancel_event
+        }
+        target_langs = job['target_langs']
+        if len(target_langs) > 1:
+            # 여러 언어는 분석/OCR/텍스트 제거를 공유하고 언어별 파일 생성 (완료 후 첫 번째 언어 파일 열기)
+            output_paths = translation_service.translate_ppt_multi(
+                job['ppt_path'], job['source_lang'], target_langs, job['text_model'],
+                progress_callback, status_callback, options
+            )
+            output_path = output_paths[target_langs[0]]
+        else:
+            output_path = translation_service.translate_ppt(
+                job['ppt_path'], job['source_lang'], target_langs[0], job['text_model'],
+                progress_callback, status_callback, options
+            )
+        messages.put(('done', output_path))
+    except TranslationCancelled:
+        messages.put(('cancelled',))
+    except Exception as e:
+        logger.exception(f"번역 프로세스 오류: {str(e)}")
+        messages.put(('error', str(e)))
+    finally:
+        if hasattr(backend, 'close'):
+            backend.close()
+
+class EngineProcess:
+    """번역 엔진(OCR, 인페인팅, 렌더링, LLM 요청)을 UI와 분리된 프로세스에서 실행
+
+    UI는 poll()로 쌓인 메시지를 가져가 자기 이벤트 루프에서 반영하고, 중지는 cancel()로 요청한다.
+    번역 프로세스는 다음 확인 지점(텍스트 요소, 이미지, OCR 배치, 렌더링 결과마다)에서 OCR/렌더링 풀을
+    정리하고 ('cancelled',)를 보낸다.
+    """
+    def __init__(self):
+        # Tk와 스레드가 있는 프로세스를 fork하지 않도록 항상 spawn 사용
+        self.context = multiprocessing.get_context("spawn")
+        self.messages = self.context.Queue()
+        self.cancel_event = self.context.Event()
+        self.process = None
+
+    def start(self, job):
+        """작업 dict(ppt_path, source_lang, target_langs, text_model, ocr_backend, incremental, debug_mode)로 번역 시작"""
+        # 번역 프로세스는 OCR/렌더링 워커 프로세스를 직접 만들기 때문에 daemon으로 두지 않음
+        self.process = self.context.Process(
+            target=_engine_main, args=(self.messages, self.cancel_event, job), name="translation-engine"
+        )
+        self.process.start()
+        logger.info(f"번역 프로세스 시작 (PID {self.process.pid})")
+
+    def poll(self, max_messages=1000):
+        """쌓인 메시지를 기다리지 않고 최대 max_messages개 가져옴"""
+        messages = []
+        while len(messages) < max_messages:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def cancel(self):
+        """번역 중지 요청"""
+        self.cancel_event.set()
+
+    def terminate(self):
+        """번역 프로세스와 그 하위 프로세스(OCR/렌더링 워커) 강제 종료"""
+        if not self.is_alive():
+            return
+        try:
+            children = psutil.Process(self.process.pid).children(recursive=True)
+        except psutil.Error:
+            children = []
+        self.process.terminate()
+        for child in children:
+            try:
+                child.terminate()
+            except psutil.Error:
+                pass
+        self.process.join(timeout=5)
+        psutil.wait_procs(children, timeout=5)
+        logger.warning(f"번역 프로세스 강제 종료 (PID {self.process.pid})")
+
+    def join(self, timeout=None):
+        if self.process is not None:
+            self.process.join(timeout)
@@ -0,0 +1,157 @@
+# services/glossary.py
+import csv
+import logging
+import os
+import threading
+from collections import deque
+
+from config import GLOSSARY_PATH, GLOSSARY_MAX_PROMPT_TERMS
+
+logger = logging.getLogger(__name__)
+
+def _fold_char(char):
+    """대소문자 구분 없이 비교하기 위한 문자 정규화 (글자 수는 유지)"""
+    lowered = char.lower()
+    return lowered if len(lowered) == 1 else char
+
+def fold(text):
+    """용어 비교용 정규화 (문자 단위이므로 원문 위치가 그대로 대응됨)"""
+    return "".join(_fold_char(char) for char in text)
+
+def _is_word_char(char):
+    """띄어쓰기로 단어를 구분하는 문자(라틴 문자, 숫자 등)인지 확인"""
+    return char.isalnum() and ord(char) < 0x3000
+
+class AhoCorasick:
+    """여러 용어를 한 번에 찾는 Aho-Corasick 오토마톤 (검색 비용은 텍스트 길이에 비례)"""
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [-1]     # 이 상태에서 끝나는 패턴 번호
+        self.dict_link = [0]   # 실패 링크를 따라 가장 가까운, 패턴이 끝나는 상태
+
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(-1)
+                    self.dict_link.append(0)
+                    self.goto[state][char] = next_state
+                state = next_state
+            self.output[state] = idx
+
+        # 너비 우선으로 실패 링크와 출력 링크 계산
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                link = self.fail[next_state]
+                self.dict_link[next_state] = link if self.output[link] >= 0 else self.dict_link[link]
+                queue.append(next_state)
+
+    def iter_matches(self, text):
+        """텍스트에서 모든 패턴 등장 위치 (시작, 끝, 패턴 번호)"""
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+
+            match_state = state if self.output[state] >= 0 else self.dict_link[state]
+            while match_state:
+                idx = self.output[match_state]
+                yield pos + 1 - len(self.patterns[idx]), pos + 1, idx
+                match_state = self.dict_link[match_state]
+
+class Glossary:
+    """원문 용어 → 번역 용어 사전 (정확히 일치하는 문장과 문장 안의 용어 검색)"""
+    def __init__(self, entries):
+        self.entries = {}
+        for source, target in entries:
+            key = fold(source.strip())
+            if key and target.strip():
+                self.entries[key] = (source.strip(), target.strip())
+        self.automaton = AhoCorasick(self.entries.keys())
+        self.keys = self.automaton.patterns
+
+    def __len__(self):
+        return len(self.entries)
+
+    def exact(self, text):
+        """문장 전체가 용어와 일치하면 번역 용어 반환 (없으면 None)"""
+        entry = self.entries.get(fold(text.strip()))
+        return entry[1] if entry else None
+
+    def match(self, text, limit=GLOSSARY_MAX_PROMPT_TERMS):
+        """문장에 포함된 용어 목록 [(원문 용어, 번역 용어), ...] (겹치면 왼쪽부터 가장 긴 용어 우선)"""
+        folded = fold(text)
+        candidates = []
+        for start, end, idx in self.automaton.iter_matches(folded):
+            # 라틴 문자 용어는 단어 중간에서 일치한 경우 제외
+            if _is_word_char(folded[start]) and start > 0 and _is_word_char(folded[start - 1]):
+                continue
+            if _is_word_char(folded[end - 1]) and end < len(folded) and _is_word_char(folded[end]):
+                continue
+            candidates.append((start, -(end - start), idx))
+
+        terms = []
+        seen = set()
+        covered_until = 0
+        for start, negative_length, idx in sorted(candidates):
+            if start < covered_until:
+                continue
+            covered_until = start - negative_length
+            if idx not in seen:
+                seen.add(idx)
+                terms.append(self.entries[self.keys[idx]])
+                if len(terms) >= limit:
+                    break
+        return terms
+
+def read_glossary_entries(path, source_lang, target_lang):
+    """언어 이름을 열 제목으로 쓰는 CSV 용어집에서 (원문, 번역) 목록 읽기"""
+    entries = []
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or source_lang not in reader.fieldnames or target_lang not in reader.fieldnames:
+            return entries
+        for row in reader:
+            source, target = row.get(source_lang) or "", row.get(target_lang) or ""
+            if source.strip() and target.strip():
+                entries.append((source, target))
+    return entries
+
+_glossaries = {}
+_glossaries_lock = threading.Lock()
+
+def get_glossary(source_lang, target_lang, path=GLOSSARY_PATH):
+    """언어 쌍별로 컴파일된 용어집 반환 (파일이 바뀌면 다시 컴파일, 없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+
+    mtime = os.path.getmtime(path)
+    key = (path, source_lang, target_lang)
+    with _glossaries_lock:
+        cached = _glossaries.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            entries = read_glossary_entries(path, source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"용어집 읽기 오류: {path}, {e}")
+            return None
+        glossary = Glossary(entries) if entries else None
+        _glossaries[key] = (mtime, glossary)
+        logger.info(f"용어집 로드: {source_lang} → {target_lang}, {len(entries)}개 용어")
+        return glossary
@@ -0,0 +1,188 @@
+# services/incremental.py
+import hashlib
+import json
+import logging
+import os
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from services.document_analyzer import DocumentAnalyzer, get_element_part
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+def content_hash(content):
+    """텍스트 또는 바이트의 내용 해시"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha1(content).hexdigest()
+
+def manifest_path(output_path):
+    """번역 결과 파일 옆에 두는 매니페스트 경로"""
+    return os.path.splitext(output_path)[0] + MANIFEST_SUFFIX
+
+def unit_key(element):
+    """번역 단위의 위치 식별자 (슬라이드/도형 고유 ID 기반)"""
+    parts = [element.get('slide_id', element['slide_idx']), element.get('shape_id', element['shape_idx']),
+             element['type']]
+    if element['type'] == 'paragraph':
+        parts.append(element['para_idx'])
+    elif element['type'] == 'table_cell':
+        parts.extend([element['row_idx'], element['col_idx']])
+    return ":".join(str(part) for part in parts)
+
+def _element_text(ppt, element):
+    """요소 위치의 현재 텍스트 (이전 번역 결과 읽기용)"""
+    shape = get_element_part(ppt, element).shapes[element['shape_idx']]
+    if element['type'] == 'paragraph':
+        return shape.text_frame.paragraphs[element['para_idx']].text
+    if element['type'] == 'table_cell':
+        return shape.table.rows[element['row_idx']].cells[element['col_idx']].text
+    return None
+
+def _picture_blob(ppt, location):
+    """번역 결과 파일에서 교체된 이미지 바이트 읽기"""
+    shape = ppt.slides[location['slide_idx']].shapes[location['shape_idx']]
+    return shape.image.blob
+
+def write_manifest(output_path, source_path, source_lang, target_lang, text_model,
+                   text_elements, image_elements):
+    """번역 결과와 원문 해시를 매니페스트로 저장 (다음 증분 번역에서 사용)"""
+    text_units = []
+    for element in text_elements:
+        translated = element.get('translations', {}).get(target_lang)
+        if translated is None:
+            continue
+        text_units.append({
+            'key': unit_key(element),
+            'hash': content_hash(element['text']),
+            'translated': translated
+        })
+
+    # 이미지는 원본 해시 → 결과 파일의 교체 이미지 위치 (None이면 번역할 텍스트 없음)
+    images = {}
+    for element in image_elements:
+        outputs = element.get('outputs', {})
+        if 'hash' in element and target_lang in outputs:
+            images[element['hash']] = outputs[target_lang]
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'source': os.path.basename(source_path),
+        'source_lang': source_lang,
+        'target_lang': target_lang,
+        'model': text_model,
+        'text': text_units,
+        'images': images
+    }
+    path = manifest_path(output_path)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        logger.info(f"매니페스트 저장: {path} (텍스트 {len(text_units)}개, 이미지 {len(images)}개)")
+    except Exception as e:
+        logger.warning(f"매니페스트 저장 실패: {path}, 오류: {e}")
+    return path
+
+def _empty_memory():
+    return {'by_key': {}, 'by_hash': {}, 'images': {}}
+
+def load_memory_from_manifest(translated_path, source_lang=None, target_lang=None, text_model=None):
+    """이전 번역 결과 파일과 매니페스트에서 번역 메모리 구성 (조건이 다르면 None)"""
+    path = manifest_path(translated_path)
+    if not os.path.exists(path) or not os.path.exists(translated_path):
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f"매니페스트 읽기 실패: {path}, 오류: {e}")
+        return None
+
+    # 언어나 모델이 바뀌었으면 이전 번역을 재사용하지 않음
+    expected = {'version': MANIFEST_VERSION, 'source_lang': source_lang,
+                'target_lang': target_lang, 'model': text_model}
+    for field, value in expected.items():
+        if value is not None and manifest.get(field) != value:
+            logger.info(f"매니페스트 조건 불일치 ({field}: {manifest.get(field)} ≠ {value}), 전체 번역")
+            return None
+
+    memory = _empty_memory()
+    for unit in manifest.get('text', []):
+        memory['by_key'][unit['key']] = (unit['hash'], unit['translated'])
+        memory['by_hash'][unit['hash']] = unit['translated']
+
+    translated_ppt = Presentation(translated_path)
+    for image_hash, location in manifest.get('images', {}).items():
+        try:
+            memory['images'][image_hash] = _picture_blob(translated_ppt, location) if location else None
+        except Exception as e:
+            logger.warning(f"이전 번역 이미지 읽기 실패 ({location}): {e}")
+
+    logger.info(f"매니페스트에서 번역 메모리 로드: 텍스트 {len(memory['by_key'])}개, 이미지 {len(memory['images'])}개")
+    return memory
+
+def load_memory_from_pair(source_path, translated_path):
+    """이전 원본/번역 파일 쌍에서 번역 메모리 구성 (같은 위치의 요소끼리 대응)"""
+    source_ppt = Presentation(source_path)
+    translated_ppt = Presentation(translated_path)
+    result = DocumentAnalyzer().analyze_ppt(source_path, source_ppt)
+
+    memory = _empty_memory()
+    for element in result['text_elements']:
+        try:
+            translated = _element_text(translated_ppt, element)
+        except Exception:
+            continue
+        if translated is None or not translated.strip():
+            continue
+        source_hash = content_hash(element['text'])
+        memory['by_key'][unit_key(element)] = (source_hash, translated)
+        memory['by_hash'][source_hash] = translated
+
+    # 교체된 이미지는 원본 도형 뒤에 같은 위치/크기로 추가된 그림
+    for element in result['image_elements']:
+        try:
+            slide_idx = element['slide_idx']
+            original = source_ppt.slides[slide_idx].shapes[element['shape_idx']]
+            geometry = (original.left, original.top, original.width, original.height)
+            shapes = translated_ppt.slides[slide_idx].shapes
+            for shape_idx in range(len(source_ppt.slides[slide_idx].shapes), len(shapes)):
+                shape = shapes[shape_idx]
+                if (shape.shape_type == MSO_SHAPE_TYPE.PICTURE and
+                        (shape.left, shape.top, shape.width, shape.height) == geometry):
+                    memory['images'][element['hash']] = shape.image.blob
+                    break
+        except Exception as e:
+            logger.debug(f"이전 번역 이미지 대응 실패 (슬라이드 {element['slide_idx']+1}): {e}")
+
+    logger.info(f"원본/번역 파일 쌍에서 번역 메모리 로드: 텍스트 {len(memory['by_key'])}개, 이미지 {len(memory['images'])}개")
+    return memory
+
+def apply_memory(memory, text_elements, image_elements, target_lang):
+    """바뀌지 않은 텍스트와 이미지에 이전 번역을 연결 → (재사용 텍스트 수, 재사용 이미지 수)"""
+    reused_text = 0
+    for element in text_elements:
+        source_hash = content_hash(element['text'])
+        previous = memory['by_key'].get(unit_key(element))
+        if previous and previous[0] == source_hash:
+            translated = previous[1]
+        else:
+            # 위치가 바뀌었어도 같은 내용이면 재사용
+            translated = memory['by_hash'].get(source_hash)
+        if translated is not None:
+            element.setdefault('cached_translations', {})[target_lang] = translated
+            reused_text += 1
+
+    reused_images = 0
+    for element in image_elements:
+        if element.get('hash') in memory['images']:
+            element.setdefault('cached_images', {})[target_lang] = memory['images'][element['hash']]
+            reused_images += 1
+
+    logger.info(f"증분 번역 ({target_lang}): 텍스트 {reused_text}/{len(text_elements)}개, "
+                f"이미지 {reused_images}/{len(image_elements)}개 재사용")
+    return reused_text, reused_images
@@ -0,0 +1,24 @@
+# services/llm/__init__.py
+import logging
+
+from config import TRANSLATION_BACKEND, OLLAMA_URLS
+from services.llm.base import TranslationBackend, TranslationError
+
+logger = logging.getLogger(__name__)
+
+def get_translation_backend(name=None, url=None):
+    """이름으로 번역 백엔드 생성 (Ollama 서버가 여러 개면 서버 풀)"""
+    name = name or TRANSLATION_BACKEND
+    logger.info(f"번역 백엔드 생성: {name}")
+
+    if name == "ollama":
+        if url is None and len(OLLAMA_URLS) > 1:
+            from services.ollama_pool import OllamaPool
+            return OllamaPool(OLLAMA_URLS)
+        from services.ollama_service import OllamaService
+        return OllamaService(url or OLLAMA_URLS[0])
+    if name == "openai":
+        from services.llm.openai_backend import OpenAICompatibleBackend
+        return OpenAICompatibleBackend(url) if url else OpenAICompatibleBackend()
+
+    raise ValueError(f"알 수 없는 번역 백엔드: {name}")
@@ -0,0 +1,380 @@
+# services/llm/base.py
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from config import (OLLAMA_CONNECT_TIMEOUT, OLLAMA_READ_TIMEOUT, OLLAMA_REGION_MAX_RETRIES, TEXT_TRANSLATION_WORKERS,
+                    TRANSLATION_EXAMPLES, OLLAMA_TIMEOUT_BASE, OLLAMA_TIMEOUT_MIN_RATE, OLLAMA_TIMEOUT_FACTOR)
+from services.token_budget import num_predict_budget, find_repetition, find_trailer, strip_preamble
+
+logger = logging.getLogger(__name__)
+
+class TranslationError(Exception):
+    """번역 요청 실패 (시간 초과, HTTP 오류, 연결 오류 등 다시 시도할 수 있는 오류)"""
+
+class TranslationBackend:
+    """LLM 번역 백엔드 공통 인터페이스 (프롬프트 구성, 생성 중단 처리, 소요 시간 집계)
+
+    서버별 구현은 채팅 요청 전송(_post_chat)과 응답 해석(_stream_events, _response_content)만 담당한다.
+    소요 시간은 Ollama 응답과 같은 필드 이름(나노초, 토큰 수)으로 집계한다.
+    """
+    name = "base"
+    max_concurrency = TEXT_TRANSLATION_WORKERS  # 서버가 동시에 처리할 수 있는 요청 수 (번역 디스패처의 병렬 수)
+    batch_regions = True  # 여러 영역을 JSON 요청 하나로 번역할 수 있는지 여부 (아니면 영역마다 텍스트 요청)
+    server_count = 1  # 요청을 나눠 받는 서버 수 (동시 요청 수 자동 조절의 최대값 계산)
+
+    def __init__(self, url):
+        self.url = url
+        self.connect_timeout = OLLAMA_CONNECT_TIMEOUT
+        self.read_timeout = OLLAMA_READ_TIMEOUT
+        self._timings = Counter()
+        self._timings_lock = threading.Lock()
+        self._eval_rate = None  # 관측한 생성 속도 (초당 토큰, 지수 이동 평균)
+
+    # 서버별 구현
+
+    def _post_chat(self, model: str, messages: List[Dict[str, str]], num_predict: int,
+                   options: Optional[Dict] = None, stream: bool = False, json_format: bool = False,
+                   timeout=None) -> requests.Response:
+        """채팅 요청 전송 (options의 repeat_penalty는 서버 형식에 맞게 변환)"""
+        raise NotImplementedError
+
+    def _stream_events(self, response: requests.Response) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """스트리밍 응답 → (생성된 조각, 마지막이면 완료 정보 아니면 None) 반복"""
+        raise NotImplementedError
+
+    def _response_content(self, response: requests.Response) -> Tuple[str, Dict]:
+        """스트리밍이 아닌 응답 → (생성된 내용, 완료 정보)"""
+        raise NotImplementedError
+
+    def get_text_models(self) -> List[str]:
+        """서버에서 사용할 수 있는 모델 목록"""
+        return []
+
+    def preload_model(self, model: str, keep_alive: Optional[str] = None) -> Optional[float]:
+        """모델 미리 로드 → 로드 시간(초), 지원하지 않거나 실패하면 None"""
+        return None
+
+    def release_model(self, model: str) -> bool:
+        """모델 언로드 (지원하지 않으면 아무것도 하지 않음)"""
+        return True
+
+    # 소요 시간 집계
+
+    def _record_timings(self, data: Dict) -> None:
+        """응답의 소요 시간(나노초) 누적: 모델 로드, 프롬프트 처리, 생성"""
+        with self._timings_lock:
+            self._timings['requests'] += 1
+            for field in ('load_duration', 'prompt_eval_duration', 'eval_duration', 'total_duration',
+                          'prompt_eval_count', 'eval_count'):
+                self._timings[field] += data.get(field, 0) or 0
+            if data.get('eval_count') and data.get('eval_duration'):
+                rate = data['eval_count'] / (data['eval_duration'] / 1e9)
+                self._eval_rate = rate if self._eval_rate is None else 0.8 * self._eval_rate + 0.2 * rate
+
+    def generation_timeout(self, num_predict: int) -> float:
+        """최대 생성 토큰 수와 관측한 생성 속도로 정한 생성 제한 시간(초)"""
+        rate = self._eval_rate or OLLAMA_TIMEOUT_MIN_RATE
+        return OLLAMA_TIMEOUT_BASE + num_predict / rate * OLLAMA_TIMEOUT_FACTOR
+
+    def reset_timings(self) -> None:
+        """소요 시간 집계 초기화 (작업 시작 시)"""
+        with self._timings_lock:
+            self._timings.clear()
+
+    def get_timings(self) -> Dict[str, float]:
+        """누적 소요 시간(초)과 토큰 수: 로드 시간과 생성 시간을 분리해 보고"""
+        with self._timings_lock:
+            timings = dict(self._timings)
+        return {
+            'requests': timings.get('requests', 0),
+            'load': timings.get('load_duration', 0) / 1e9,
+            'prompt_eval': timings.get('prompt_eval_duration', 0) / 1e9,
+            'eval': timings.get('eval_duration', 0) / 1e9,
+            'generate': (timings.get('prompt_eval_duration', 0) + timings.get('eval_duration', 0)) / 1e9,
+            'total': timings.get('total_duration', 0) / 1e9,
+            'prompt_eval_count': timings.get('prompt_eval_count', 0),
+            'eval_count': timings.get('eval_count', 0),
+            # 생성 중단/정리 횟수 (반복, 생성 한도 도달, 설명 추가, 안내 문구, 재시도)
+            'runaway': {reason: timings.get(f'runaway_{reason}', 0)
+                        for reason in ('repetition', 'length', 'trailer', 'preamble', 'retried')}
+        }
+
+    def _count_runaway(self, reason: str) -> None:
+        """생성 중단/정리 횟수 기록"""
+        with self._timings_lock:
+            self._timings[f'runaway_{reason}'] += 1
+
+    # 번역
+
+    def translate_text(self, text: str, source_lang: str, target_lang: str, model: str,
+                       glossary_terms: Optional[List[Tuple[str, str]]] = None, raise_on_error: bool = False) -> str:
+        """텍스트 번역 (glossary_terms가 있으면 해당 용어의 고정 번역을 프롬프트에 포함)
+
+        요청이 실패하거나 번역 결과가 비어 있으면 원문을 반환하고, raise_on_error면 대신 TranslationError를 발생시킨다.
+        """
+        if not text or text.isspace():
+            return text
+
+        logger.debug(f"번역 시작: '{text[:50]}...' ({source_lang} → {target_lang})")
+
+        # 번역 메시지 (언어 쌍별로 고정된 앞부분 + 문장별 용어집 + 원문)
+        messages = self._text_prompt_prefix(source_lang, target_lang) + self._glossary_messages(glossary_terms)
+        messages.append({"role": "user", "content": text})
+
+        try:
+            # 원문 길이에 비례한 생성 한도로 요청
+            translated_text, cut = self._stream_chat(model, messages, text,
+                                                     num_predict_budget(text, source_lang, target_lang))
+
+            # 반복이나 한도 초과로 중단되면 더 엄격한 한도와 반복 억제로 한 번 재시도
+            if cut in ('repetition', 'length'):
+                self._count_runaway('retried')
+                logger.info(f"생성 중단({cut}), 엄격한 한도로 재시도: '{text[:30]}...'")
+                try:
+                    retry = self._stream_chat(model, messages, text,
+                                              num_predict_budget(text, source_lang, target_lang, strict=True),
+                                              {"repeat_penalty": 1.3})
+                    if retry[0].strip() and retry[1] not in ('repetition', 'length'):
+                        translated_text = retry[0]
+                except Exception as e:
+                    logger.warning(f"재시도 실패, 첫 결과 사용: {e}")
+
+            translated_text, stripped = strip_preamble(translated_text, text)
+            if stripped:
+                self._count_runaway('preamble')
+
+            translated_text = translated_text.strip()
+            if not translated_text:
+                # 빈 응답은 실패로 처리 (raise_on_error면 재시도 대기열과 실행 보고서에 기록되도록 TranslationError)
+                raise TranslationError("빈 번역 결과")
+
+            logger.info(f"번역 완료: '{text[:30]}...' → '{translated_text[:30]}...'")
+            return translated_text
+
+        except requests.exceptions.Timeout as e:
+            logger.error("번역 API 타임아웃")
+            if raise_on_error:
+                raise TranslationError(f"시간 초과: {e}") from e
+            return text
+        except Exception as e:
+            logger.error(f"번역 오류: {e}")
+            if raise_on_error:
+                raise TranslationError(str(e)) from e
+            return text
+
+    def _stream_chat(self, model: str, messages: List[Dict[str, str]], source_text: str,
+                     num_predict: int, options: Optional[Dict] = None) -> Tuple[str, Optional[str]]:
+        """스트리밍 번역 요청 1회 → (번역문, 중단 사유), HTTP 오류면 TranslationError
+
+        같은 조각이 반복되거나 한 줄 원문 뒤에 설명이 붙기 시작하면 그 자리에서 스트림을 끊는다.
+        첫 응답 이후 생성 시간이 generation_timeout을 넘으면 시간 초과로 처리한다.
+        """
+        response = None
+        try:
+            response = self._post_chat(model, messages, num_predict, options, stream=True,
+                                       timeout=(self.connect_timeout, self.read_timeout))
+
+            if response.status_code != 200:
+                logger.error(f"번역 API 오류 (HTTP {response.status_code})")
+                raise TranslationError(f"HTTP {response.status_code}")
+
+            # 스트리밍 응답 처리
+            translated_text = ""
+            cut = None
+            deadline = None
+            for piece, final in self._stream_events(response):
+                if deadline is None:
+                    deadline = time.perf_counter() + self.generation_timeout(num_predict)
+                elif time.perf_counter() > deadline:
+                    raise requests.exceptions.Timeout(f"생성 시간 {self.generation_timeout(num_predict):.0f}초 초과")
+                translated_text += piece
+
+                if final is not None:
+                    self._record_timings(final)
+                    if final.get('done_reason') == 'length':
+                        cut = 'length'
+                    break
+
+                repeat_at = find_repetition(translated_text, source_text)
+                if repeat_at >= 0:
+                    translated_text, cut = translated_text[:repeat_at], 'repetition'
+                    break
+                trailer_at = find_trailer(translated_text, source_text)
+                if trailer_at >= 0:
+                    translated_text, cut = translated_text[:trailer_at], 'trailer'
+                    break
+
+            if cut:
+                self._count_runaway(cut)
+                logger.debug(f"생성 중단 ({cut}, 한도 {num_predict}): '{translated_text[:50]}'")
+            return translated_text, cut
+        finally:
+            # 리소스 정리 (중간에 끊은 스트림도 연결 종료로 서버 생성 중단)
+            if response is not None:
+                response.close()
+
+    def _text_prompt_prefix(self, source_lang: str, target_lang: str) -> List[Dict[str, str]]:
+        """텍스트 번역의 고정 시스템 프롬프트와 예시 (요청마다 동일해야 서버가 앞부분의 KV 캐시를 재사용)"""
+        messages = [{
+            "role": "system",
+            "content": f"You are a translator. Accurately translate the {source_lang} text given by the user into "
+                       f"{target_lang}. Reply with the translated result only, without explanations, notes or quotes."
+        }]
+        for source, target in TRANSLATION_EXAMPLES.get((source_lang, target_lang), []):
+            messages.append({"role": "user", "content": source})
+            messages.append({"role": "assistant", "content": target})
+        return messages
+
+    def _region_prompt_prefix(self, source_lang: str, target_lang: str) -> List[Dict[str, str]]:
+        """영역(JSON) 번역의 고정 시스템 프롬프트와 예시"""
+        messages = [{
+            "role": "system",
+            "content": f"You are a translator. Translate every value of the JSON object given by the user from "
+                       f"{source_lang} into {target_lang}. Keep every key unchanged, do not merge, split or omit entries, "
+                       "and return only a JSON object with the same keys and the translated values."
+        }]
+        examples = TRANSLATION_EXAMPLES.get((source_lang, target_lang), [])
+        if examples:
+            source = {str(idx): pair[0] for idx, pair in enumerate(examples, 1)}
+            target = {str(idx): pair[1] for idx, pair in enumerate(examples, 1)}
+            messages.append({"role": "user", "content": json.dumps(source, ensure_ascii=False)})
+            messages.append({"role": "assistant", "content": json.dumps(target, ensure_ascii=False)})
+        return messages
+
+    def _glossary_messages(self, glossary_terms: Optional[List[Tuple[str, str]]]) -> List[Dict[str, str]]:
+        """용어집에서 찾은 용어의 고정 번역 지시 (고정 앞부분 뒤에 붙여 캐시를 깨지 않음, 용어가 없으면 빈 목록)"""
+        if not glossary_terms:
+            return []
+        terms = "; ".join(f"{source} => {target}" for source, target in glossary_terms)
+        return [{"role": "system", "content": f"Always translate these terms exactly as given: {terms}."}]
+
+    def translate_regions(self, regions: Dict[str, str], source_lang: str, target_lang: str,
+                          model: str, max_retries: int = OLLAMA_REGION_MAX_RETRIES,
+                          glossary_terms: Optional[List[Tuple[str, str]]] = None, raise_on_error: bool = False,
+                          failed: Optional[List[str]] = None) -> Dict[str, str]:
+        """ID가 붙은 텍스트 영역들을 한 번의 JSON 요청으로 번역 (누락된 ID만 재시도)
+
+        끝내 번역하지 못한 영역은 원문을 유지하고 ID를 failed에 추가한다.
+        raise_on_error면 아무 영역도 번역하지 못한 채 요청이 실패했을 때 TranslationError를 발생시킨다.
+        JSON 요청을 지원하지 않는 백엔드(batch_regions가 False)는 영역마다 텍스트 번역을 요청한다.
+        """
+        translations = {}
+        pending = {region_id: text for region_id, text in regions.items() if text and not text.isspace()}
+
+        # 빈 영역은 그대로 유지
+        for region_id, text in regions.items():
+            if region_id not in pending:
+                translations[region_id] = text
+
+        if not self.batch_regions:
+            return self._translate_regions_separately(pending, translations, source_lang, target_lang, model,
+                                                      glossary_terms, raise_on_error, failed)
+
+        attempt = 0
+        while pending and attempt <= max_retries:
+            if attempt > 0:
+                logger.info(f"누락된 영역 재번역 (시도 {attempt}/{max_retries}): {list(pending.keys())}")
+
+            try:
+                result = self._request_region_translation(pending, source_lang, target_lang, model, glossary_terms,
+                                                          raise_on_error)
+            except TranslationError:
+                if attempt == 0:
+                    raise
+                # 일부는 이미 번역됨 → 남은 영역만 원문 유지
+                break
+            for region_id, translated in result.items():
+                if region_id in pending:
+                    translations[region_id] = translated
+                    del pending[region_id]
+            attempt += 1
+
+        # 재시도 후에도 누락된 영역은 원문 유지
+        if pending:
+            logger.warning(f"영역 번역 실패, 원문 유지: {list(pending.keys())}")
+            translations.update(pending)
+            if failed is not None:
+                failed.extend(pending.keys())
+
+        return translations
+
+    def _translate_regions_separately(self, pending, translations, source_lang, target_lang, model,
+                                      glossary_terms, raise_on_error, failed):
+        """영역마다 텍스트 번역 요청 (JSON 요청을 지원하지 않는 백엔드용)"""
+        translated_any = False
+        for region_id, text in pending.items():
+            terms = [term for term in (glossary_terms or []) if term[0] in text] or None
+            try:
+                translations[region_id] = self.translate_text(text, source_lang, target_lang, model,
+                                                              glossary_terms=terms, raise_on_error=True)
+                translated_any = True
+            except TranslationError:
+                # 첫 요청부터 실패하면 재시도 대기열로, 일부라도 번역됐으면 남은 영역만 원문 유지
+                if raise_on_error and not translated_any:
+                    raise
+                translations[region_id] = text
+                if failed is not None:
+                    failed.append(region_id)
+        return translations
+
+    def _request_region_translation(self, regions: Dict[str, str], source_lang: str,
+                                    target_lang: str, model: str,
+                                    glossary_terms: Optional[List[Tuple[str, str]]] = None,
+                                    raise_on_error: bool = False) -> Dict[str, str]:
+        """영역 번역 요청 1회 실행 (JSON 입력, JSON 출력, raise_on_error면 통신 오류 시 TranslationError)"""
+        messages = self._region_prompt_prefix(source_lang, target_lang) + self._glossary_messages(glossary_terms)
+        messages.append({"role": "user", "content": json.dumps(regions, ensure_ascii=False)})
+
+        response = None
+        try:
+            # 생성 한도: 모든 영역 원문 기준 한도 + 키와 JSON 구문 여유분 (스트리밍이 아니므로 응답 대기 시간도 이 한도로 정함)
+            num_predict = sum(num_predict_budget(text, source_lang, target_lang) + 8 for text in regions.values())
+            response = self._post_chat(model, messages, num_predict, json_format=True,
+                                       timeout=(self.connect_timeout, self.generation_timeout(num_predict)))
+
+            if response.status_code != 200:
+                logger.error(f"영역 번역 API 오류 (HTTP {response.status_code})")
+                if raise_on_error:
+                    raise TranslationError(f"HTTP {response.status_code}")
+                return {}
+
+            content, final = self._response_content(response)
+            self._record_timings(final)
+            parsed = json.loads(content)
+            if not isinstance(parsed, dict):
+                logger.warning(f"영역 번역 응답 형식 오류: {content[:100]}")
+                return {}
+
+            # 문자열 값만 유효한 번역으로 인정
+            result = {str(key): value.strip() for key, value in parsed.items()
+                      if isinstance(value, str) and value.strip()}
+            logger.info(f"영역 번역 완료: {len(result)}/{len(regions)}개")
+            return result
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"영역 번역 JSON 파싱 오류: {e}")
+            return {}
+        except TranslationError:
+            raise
+        except requests.exceptions.Timeout as e:
+            logger.error("영역 번역 API 타임아웃")
+            if raise_on_error:
+                raise TranslationError(f"시간 초과: {e}") from e
+            return {}
+        except requests.exceptions.RequestException as e:
+            logger.error(f"영역 번역 오류: {e}")
+            if raise_on_error:
+                raise TranslationError(str(e)) from e
+            return {}
+        except Exception as e:
+            logger.error(f"영역 번역 오류: {e}")
+            return {}
+        finally:
+            if response is not None:
+                response.close()
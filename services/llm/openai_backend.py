@@ -0,0 +1,105 @@
+# services/llm/openai_backend.py
+import json
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from config import OPENAI_COMPAT_URL, OPENAI_COMPAT_API_KEY, OPENAI_COMPAT_CONCURRENCY, OPENAI_COMPAT_JSON_MODE
+from services.llm.base import TranslationBackend
+
+logger = logging.getLogger(__name__)
+
+class OpenAICompatibleBackend(TranslationBackend):
+    """OpenAI 호환 /chat/completions 번역 백엔드 (llama.cpp server, vLLM 등)
+
+    연속 배칭을 지원하는 서버가 많아 Ollama보다 많은 요청을 동시에 보낸다.
+    모델 로드/언로드는 서버 실행 시 정해지므로 preload_model과 release_model은 아무것도 하지 않는다.
+    """
+    name = "openai"
+    max_concurrency = OPENAI_COMPAT_CONCURRENCY
+    batch_regions = OPENAI_COMPAT_JSON_MODE
+
+    def __init__(self, url=OPENAI_COMPAT_URL, api_key=OPENAI_COMPAT_API_KEY):
+        super().__init__(url.rstrip('/'))
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+    def get_text_models(self) -> List[str]:
+        """/models의 모델 ID 목록"""
+        try:
+            response = requests.get(f"{self.url}/models", headers=self.headers, timeout=self.connect_timeout)
+            if response.status_code == 200:
+                return [model['id'] for model in response.json().get('data', [])]
+            logger.error(f"모델 목록 가져오기 오류: HTTP {response.status_code}")
+        except Exception as e:
+            logger.error(f"모델 목록 가져오기 오류: {e}")
+        return []
+
+    def _post_chat(self, model: str, messages: List[Dict[str, str]], num_predict: int,
+                   options: Optional[Dict] = None, stream: bool = False, json_format: bool = False,
+                   timeout=None) -> requests.Response:
+        """/chat/completions 요청 (반복 억제는 표준 frequency_penalty로 전달)"""
+        payload = {"model": model, "messages": messages, "max_tokens": num_predict, "stream": stream}
+        if stream:
+            payload["stream_options"] = {"include_usage": True}
+        if json_format:
+            payload["response_format"] = {"type": "json_object"}
+        if options and options.get("repeat_penalty"):
+            payload["frequency_penalty"] = round(min(2.0, (options["repeat_penalty"] - 1.0) * 2), 2)
+        return requests.post(f"{self.url}/chat/completions", json=payload, headers=self.headers,
+                             stream=stream, timeout=timeout)
+
+    def _stream_events(self, response: requests.Response) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """SSE 스트림 → (생성된 조각, 마지막이면 완료 정보)"""
+        start = time.perf_counter()
+        first = None
+        finish_reason = None
+        usage = {}
+        server_timings = None
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                yield "", None
+                continue
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                break
+            try:
+                chunk = json.loads(payload.decode('utf-8'))
+            except json.JSONDecodeError:
+                continue
+            usage = chunk.get('usage') or usage
+            server_timings = chunk.get('timings') or server_timings
+            piece = ""
+            for choice in chunk.get('choices') or []:
+                piece += (choice.get('delta') or {}).get('content') or ""
+                finish_reason = choice.get('finish_reason') or finish_reason
+            if piece and first is None:
+                first = time.perf_counter()
+            yield piece, None
+        end = time.perf_counter()
+        yield "", self._final(finish_reason, usage, server_timings, start, first or end, end)
+
+    def _response_content(self, response: requests.Response) -> Tuple[str, Dict]:
+        """스트리밍이 아닌 응답 → (생성된 내용, 완료 정보)"""
+        data = response.json()
+        choice = (data.get('choices') or [{}])[0]
+        elapsed = response.elapsed.total_seconds()
+        final = self._final(choice.get('finish_reason'), data.get('usage') or {}, data.get('timings'), 0.0, 0.0, elapsed)
+        return (choice.get('message') or {}).get('content') or "", final
+
+    def _final(self, finish_reason, usage, server_timings, start, first, end):
+        """완료 정보를 Ollama 응답 필드(나노초)로 변환 (llama.cpp가 보내는 timings가 있으면 사용, 없으면 측정값)"""
+        final = {
+            'done_reason': finish_reason or 'stop',
+            'prompt_eval_count': usage.get('prompt_tokens', 0),
+            'eval_count': usage.get('completion_tokens', 0),
+            'total_duration': int((end - start) * 1e9)
+        }
+        if server_timings:
+            final['prompt_eval_duration'] = int(server_timings.get('prompt_ms', 0) * 1e6)
+            final['eval_duration'] = int(server_timings.get('predicted_ms', 0) * 1e6)
+        else:
+            final['prompt_eval_duration'] = int((first - start) * 1e9)
+            final['eval_duration'] = int((end - first) * 1e9)
+        return final
@@ -0,0 +1,60 @@
+# services/model_router.py
+import logging
+import threading
+from collections import Counter
+
+from config import (ROUTING_SMALL_MODEL, ROUTING_SHORT_MAX_TOKENS, ROUTING_SHORT_MAX_SENTENCES,
+                    ROUTING_GLOSSARY_PIN_TERMS, ROUTING_GLOSSARY_MODEL)
+from services.token_budget import estimate_tokens, count_sentences
+
+logger = logging.getLogger(__name__)
+
+class ModelRouter:
+    """문장 길이와 복잡도로 번역 모델 선택 (짧고 단순한 문장은 작은 모델, 나머지는 선택한 모델)
+
+    용어집 용어가 많은 문장은 모델마다 용어 번역이 달라지지 않도록 한 모델에 고정한다.
+    """
+    def __init__(self, model, small_model=ROUTING_SMALL_MODEL, glossary_model=ROUTING_GLOSSARY_MODEL,
+                 short_max_tokens=ROUTING_SHORT_MAX_TOKENS, short_max_sentences=ROUTING_SHORT_MAX_SENTENCES,
+                 glossary_pin_terms=ROUTING_GLOSSARY_PIN_TERMS):
+        self.model = model
+        self.small_model = small_model if small_model and small_model != model else None
+        self.glossary_model = glossary_model or model
+        self.short_max_tokens = short_max_tokens
+        self.short_max_sentences = short_max_sentences
+        self.glossary_pin_terms = glossary_pin_terms
+        self.lock = threading.Lock()
+        self.routes = Counter()  # (모델, 사유)별 문장 수
+
+    @property
+    def enabled(self):
+        return self.small_model is not None
+
+    def models(self):
+        """이번 작업에서 쓸 수 있는 모델 목록 (미리 로드/언로드 대상)"""
+        return list(dict.fromkeys(model for model in (self.model, self.small_model, self.glossary_model) if model))
+
+    def route(self, text, glossary_terms=0, count=True):
+        """문장을 번역할 모델과 사유 → (모델, 'glossary'|'short'|'long'|'default') (count면 선택 횟수 집계)"""
+        if not self.enabled:
+            model, reason = self.model, 'default'
+        elif glossary_terms >= self.glossary_pin_terms:
+            model, reason = self.glossary_model, 'glossary'
+        elif (estimate_tokens(text) <= self.short_max_tokens
+              and count_sentences(text) <= self.short_max_sentences):
+            model, reason = self.small_model, 'short'
+        else:
+            model, reason = self.model, 'long'
+        if count:
+            with self.lock:
+                self.routes[(model, reason)] += 1
+        return model, reason
+
+    def log_summary(self):
+        """모델별로 보낸 문장 수 로그"""
+        with self.lock:
+            routes = dict(self.routes)
+        if self.enabled and routes:
+            logger.info("모델 선택: " + ", ".join(f"{model} ({reason}) {count}"
+                                                 for (model, reason), count in sorted(routes.items())))
+        return routes
@@ -0,0 +1,48 @@
+# services/ocr/__init__.py
+import importlib.util
+import logging
+import shutil
+
+from config import OCR_BACKENDS, DEFAULT_OCR_BACKEND
+from services.ocr.base import OCRBackend, crop_text_region
+from services.ocr.scheduler import OCRScheduler
+from services.ocr.worker_pool import OCRWorkerPool
+
+logger = logging.getLogger(__name__)
+
+def _module_available(name):
+    """패키지를 실제로 import하지 않고 설치 여부만 확인"""
+    return importlib.util.find_spec(name) is not None
+
+def is_backend_available(name, lang=None):
+    """OCR 백엔드 사용 가능 여부 확인 (무거운 엔진은 import하지 않음)"""
+    if name == "paddle":
+        return _module_available("paddle") and _module_available("paddleocr")
+    if name == "onnx":
+        from services.ocr.onnx_backend import models_available
+        return _module_available("onnxruntime") and (lang is None or models_available(lang))
+    if name == "tesseract":
+        return _module_available("tesserocr") or (
+            _module_available("pytesseract") and shutil.which("tesseract") is not None)
+    return False
+
+def available_backends(lang=None):
+    """사용 가능한 OCR 백엔드 이름 목록"""
+    return [name for name in OCR_BACKENDS if is_backend_available(name, lang)]
+
+def get_ocr_backend(name=None, lang=None):
+    """이름으로 OCR 백엔드 생성 (엔진 모듈은 필요할 때만 import)"""
+    name = name or DEFAULT_OCR_BACKEND
+    logger.info(f"OCR 백엔드 생성: {name} ({lang})")
+
+    if name == "paddle":
+        from services.ocr.paddle_backend import PaddleOCRBackend
+        return PaddleOCRBackend(lang)
+    if name == "onnx":
+        from services.ocr.onnx_backend import OnnxOCRBackend
+        return OnnxOCRBackend(lang)
+    if name == "tesseract":
+        from services.ocr.tesseract_backend import TesseractBackend
+        return TesseractBackend(lang)
+
+    raise ValueError(f"알 수 없는 OCR 백엔드: {name}")
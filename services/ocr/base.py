@@ -0,0 +1,74 @@
+# services/ocr/base.py
+import logging
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def crop_text_region(image, box):
+    """4점 상자 영역을 원근 변환으로 잘라 수평 텍스트 이미지로 반환"""
+    points = np.asarray(box, dtype=np.float32).reshape(4, 2)
+    width = int(max(np.linalg.norm(points[0] - points[1]), np.linalg.norm(points[2] - points[3])))
+    height = int(max(np.linalg.norm(points[0] - points[3]), np.linalg.norm(points[1] - points[2])))
+    width, height = max(width, 1), max(height, 1)
+
+    target = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(points, target)
+    crop = cv2.warpPerspective(image, matrix, (width, height),
+                               borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC)
+
+    # 세로로 긴 영역은 세로쓰기로 보고 회전
+    if height / width >= 1.5:
+        crop = np.rot90(crop)
+    return crop
+
+def sort_boxes(boxes):
+    """검출된 상자를 위→아래, 왼쪽→오른쪽 순서로 정렬"""
+    if len(boxes) == 0:
+        return np.zeros((0, 4, 2), dtype=np.float32)
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4, 2)
+    order = np.lexsort((boxes[:, 0, 0], np.round(boxes[:, 0, 1] / 10)))
+    return boxes[order]
+
+class OCRBackend:
+    """OCR 백엔드 공통 인터페이스 (검출, 인식, 일괄 처리)
+
+    결과는 PaddleOCR과 같은 [[상자 4점], (텍스트, 신뢰도 0~1)] 목록 형식을 사용한다.
+    """
+    name = "base"
+    thread_safe = False  # 여러 스레드에서 detect/recognize 동시 호출 가능 여부
+    split_stages = True  # 검출과 인식을 분리해 여러 이미지의 인식을 묶을 수 있는지 여부
+    max_workers = None  # 엔진이 권장하는 병렬 스레드 수 (None이면 스케줄러 기본값)
+
+    def __init__(self, lang):
+        self.lang = lang
+
+    def detect(self, image):
+        """이미지(BGR ndarray)에서 텍스트 상자 검출 → (N, 4, 2) 배열"""
+        raise NotImplementedError
+
+    def recognize(self, crops):
+        """잘라낸 텍스트 이미지 목록 인식 → [(텍스트, 신뢰도), ...]"""
+        raise NotImplementedError
+
+    def ocr(self, image):
+        """검출 + 인식 실행"""
+        boxes = self.detect(image)
+        if len(boxes) == 0:
+            return []
+        crops = [crop_text_region(image, box) for box in boxes]
+        results = self.recognize(crops)
+        return [[box.tolist(), (text, float(conf))] for box, (text, conf) in zip(boxes, results)]
+
+    def ocr_batch(self, images):
+        """여러 이미지 OCR 실행 (검출 후 조각을 모아 한꺼번에 인식)"""
+        from services.ocr.scheduler import OCRScheduler
+        scheduler = OCRScheduler(self)
+        for idx, image in enumerate(images):
+            scheduler.add(idx, image)
+        results = scheduler.run()
+        return [results[idx] for idx in range(len(images))]
+
+    def close(self):
+        """엔진 자원 해제"""
+        pass
@@ -0,0 +1,185 @@
+# services/ocr/onnx_backend.py
+import logging
+import math
+import os
+import threading
+import cv2
+import numpy as np
+
+from config import ONNX_OCR_MODEL_DIR, ONNX_OCR_THREADS, OCR_REC_BATCH_SIZE
+from services.ocr.base import OCRBackend, sort_boxes
+from utils.image_utils import map_language_to_paddle
+
+logger = logging.getLogger(__name__)
+
+# PP-OCR 검출(DB) 설정
+DET_LIMIT_SIDE = 960
+DET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+DET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+DET_THRESH = 0.3
+DET_BOX_THRESH = 0.6
+DET_UNCLIP_RATIO = 1.5
+DET_MAX_CANDIDATES = 1000
+DET_MIN_SIZE = 3
+
+# PP-OCR 인식(CTC) 설정
+REC_HEIGHT = 48
+REC_WIDTH = 320
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def model_paths(lang, model_dir=ONNX_OCR_MODEL_DIR):
+    """언어별 ONNX 모델 파일 경로 (검출, 인식, 문자 사전)"""
+    paddle_lang = map_language_to_paddle(lang)
+    return (os.path.join(model_dir, "det.onnx"),
+            os.path.join(model_dir, f"rec_{paddle_lang}.onnx"),
+            os.path.join(model_dir, f"dict_{paddle_lang}.txt"))
+
+def models_available(lang, model_dir=ONNX_OCR_MODEL_DIR):
+    """언어별 ONNX 모델 파일이 모두 있는지 확인"""
+    return all(os.path.exists(path) for path in model_paths(lang, model_dir))
+
+def _get_session(path):
+    """모델 경로별 ONNX Runtime 세션 반환 (CPU 전용, 최초 호출 시 생성)"""
+    with _sessions_lock:
+        if path not in _sessions:
+            import onnxruntime as ort
+            options = ort.SessionOptions()
+            if ONNX_OCR_THREADS:
+                options.intra_op_num_threads = ONNX_OCR_THREADS
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            logger.info(f"ONNX 모델 로드: {path}")
+            _sessions[path] = ort.InferenceSession(path, sess_options=options,
+                                                   providers=["CPUExecutionProvider"])
+        return _sessions[path]
+
+def _order_points(points):
+    """4점을 좌상, 우상, 우하, 좌하 순서로 정렬"""
+    points = sorted(points.tolist(), key=lambda p: p[0])
+    left = sorted(points[:2], key=lambda p: p[1])
+    right = sorted(points[2:], key=lambda p: p[1])
+    return np.array([left[0], right[0], right[1], left[1]], dtype=np.float32)
+
+def _mini_box(rect):
+    """최소 외접 사각형을 정렬된 4점과 짧은 변 길이로 변환"""
+    points = cv2.boxPoints(rect)
+    return _order_points(points), min(rect[1])
+
+def _box_score(prob_map, box):
+    """상자 내부의 평균 텍스트 확률"""
+    height, width = prob_map.shape
+    x_min = int(np.clip(np.floor(box[:, 0].min()), 0, width - 1))
+    x_max = int(np.clip(np.ceil(box[:, 0].max()), 0, width - 1))
+    y_min = int(np.clip(np.floor(box[:, 1].min()), 0, height - 1))
+    y_max = int(np.clip(np.ceil(box[:, 1].max()), 0, height - 1))
+
+    mask = np.zeros((y_max - y_min + 1, x_max - x_min + 1), dtype=np.uint8)
+    shifted = (box - np.array([x_min, y_min], dtype=np.float32)).astype(np.int32)
+    cv2.fillPoly(mask, [shifted], 1)
+    return cv2.mean(prob_map[y_min:y_max + 1, x_min:x_max + 1], mask)[0]
+
+def _unclip(box):
+    """DB 후처리: 검출 상자를 면적/둘레 비율만큼 바깥으로 확장"""
+    area = cv2.contourArea(box)
+    perimeter = cv2.arcLength(box, True)
+    distance = area * DET_UNCLIP_RATIO / max(perimeter, 1e-6)
+    (cx, cy), (w, h), angle = cv2.minAreaRect(box)
+    return ((cx, cy), (w + 2 * distance, h + 2 * distance), angle)
+
+class OnnxOCRBackend(OCRBackend):
+    """ONNX Runtime으로 내보낸 PP-OCR 모델을 실행하는 CPU 백엔드"""
+    name = "onnx"
+    thread_safe = True  # InferenceSession.run은 여러 스레드에서 동시 호출 가능
+
+    def __init__(self, lang, model_dir=ONNX_OCR_MODEL_DIR):
+        super().__init__(lang)
+        det_path, rec_path, dict_path = model_paths(lang, model_dir)
+        self.det_session = _get_session(det_path)
+        self.rec_session = _get_session(rec_path)
+        self.det_input = self.det_session.get_inputs()[0].name
+        self.rec_input = self.rec_session.get_inputs()[0].name
+
+        # CTC 문자 목록 (0번은 blank, 마지막은 공백)
+        with open(dict_path, encoding="utf-8") as f:
+            characters = [line.rstrip("\r\n") for line in f]
+        self.characters = ["blank"] + characters + [" "]
+
+    def _det_preprocess(self, image):
+        """검출 입력 전처리 (32배수 리사이즈, 정규화, CHW)"""
+        height, width = image.shape[:2]
+        ratio = min(1.0, DET_LIMIT_SIDE / max(height, width))
+        resize_h = max(int(round(height * ratio / 32) * 32), 32)
+        resize_w = max(int(round(width * ratio / 32) * 32), 32)
+        resized = cv2.resize(image, (resize_w, resize_h))
+        tensor = (resized.astype(np.float32) / 255.0 - DET_MEAN) / DET_STD
+        return tensor.transpose(2, 0, 1)[np.newaxis], (height / resize_h, width / resize_w)
+
+    def detect(self, image):
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        tensor, (scale_y, scale_x) = self._det_preprocess(image)
+        prob_map = self.det_session.run(None, {self.det_input: tensor})[0][0, 0]
+
+        bitmap = (prob_map > DET_THRESH).astype(np.uint8) * 255
+        contours, _ = cv2.findContours(bitmap, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        boxes = []
+        for contour in contours[:DET_MAX_CANDIDATES]:
+            box, short_side = _mini_box(cv2.minAreaRect(contour))
+            if short_side < DET_MIN_SIZE:
+                continue
+            if _box_score(prob_map, box) < DET_BOX_THRESH:
+                continue
+
+            box, short_side = _mini_box(_unclip(box))
+            if short_side < DET_MIN_SIZE + 2:
+                continue
+
+            # 원본 이미지 좌표로 환산
+            box[:, 0] = np.clip(box[:, 0] * scale_x, 0, image.shape[1] - 1)
+            box[:, 1] = np.clip(box[:, 1] * scale_y, 0, image.shape[0] - 1)
+            boxes.append(box)
+
+        return sort_boxes(boxes)
+
+    def _rec_batch(self, crops):
+        """같은 폭으로 패딩한 인식 배치 실행 후 CTC 디코딩"""
+        max_ratio = max(REC_WIDTH / REC_HEIGHT, max(c.shape[1] / max(c.shape[0], 1) for c in crops))
+        batch_width = int(math.ceil(REC_HEIGHT * max_ratio))
+        batch = np.zeros((len(crops), 3, REC_HEIGHT, batch_width), dtype=np.float32)
+
+        for i, crop in enumerate(crops):
+            if crop.ndim == 2:
+                crop = cv2.cvtColor(crop, cv2.COLOR_GRAY2BGR)
+            ratio = crop.shape[1] / max(crop.shape[0], 1)
+            resized_w = min(batch_width, int(math.ceil(REC_HEIGHT * ratio)))
+            resized = cv2.resize(crop, (max(resized_w, 1), REC_HEIGHT)).astype(np.float32)
+            batch[i, :, :, :resized.shape[1]] = ((resized / 255.0 - 0.5) / 0.5).transpose(2, 0, 1)
+
+        probs = self.rec_session.run(None, {self.rec_input: batch})[0]
+        indices = probs.argmax(axis=2)
+        scores = probs.max(axis=2)
+
+        results = []
+        for seq, seq_scores in zip(indices, scores):
+            # 연속 중복과 blank 제거
+            keep = np.ones(len(seq), dtype=bool)
+            keep[1:] = seq[1:] != seq[:-1]
+            keep &= seq != 0
+            text = "".join(self.characters[idx] for idx in seq[keep] if idx < len(self.characters))
+            results.append((text, float(seq_scores[keep].mean()) if keep.any() else 0.0))
+        return results
+
+    def recognize(self, crops):
+        if not crops:
+            return []
+
+        # 비슷한 가로세로 비율끼리 묶어 패딩 낭비 줄이기
+        order = sorted(range(len(crops)), key=lambda i: crops[i].shape[1] / max(crops[i].shape[0], 1))
+        results = [None] * len(crops)
+        for start in range(0, len(order), OCR_REC_BATCH_SIZE):
+            chunk = order[start:start + OCR_REC_BATCH_SIZE]
+            for idx, result in zip(chunk, self._rec_batch([crops[i] for i in chunk])):
+                results[idx] = result
+        return results
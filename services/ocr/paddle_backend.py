@@ -0,0 +1,55 @@
+# services/ocr/paddle_backend.py
+import logging
+import threading
+import numpy as np
+
+from config import OCR_REC_BATCH_SIZE
+from services.ocr.base import OCRBackend, sort_boxes
+from utils.image_utils import map_language_to_paddle
+
+logger = logging.getLogger(__name__)
+
+# PaddleOCR 엔진은 초기화 비용이 커서 언어별로 한 번만 생성
+_engines = {}
+_engines_lock = threading.Lock()
+
+def _get_engine(paddle_lang):
+    """언어별 PaddleOCR 엔진 반환 (최초 호출 시 생성)"""
+    with _engines_lock:
+        if paddle_lang not in _engines:
+            from paddleocr import PaddleOCR
+            logger.info(f"PaddleOCR 엔진 초기화: {paddle_lang}")
+            _engines[paddle_lang] = PaddleOCR(use_angle_cls=True, lang=paddle_lang, show_log=False,
+                                              rec_batch_num=OCR_REC_BATCH_SIZE,
+                                              cls_batch_num=OCR_REC_BATCH_SIZE)
+        return _engines[paddle_lang]
+
+class PaddleOCRBackend(OCRBackend):
+    """PaddleOCR(Paddle Inference) 백엔드"""
+    name = "paddle"
+
+    def __init__(self, lang):
+        super().__init__(lang)
+        self.engine = _get_engine(map_language_to_paddle(lang))
+
+    def detect(self, image):
+        dt_boxes, _ = self.engine.text_detector(image)
+        if dt_boxes is None:
+            return np.zeros((0, 4, 2), dtype=np.float32)
+        return sort_boxes(dt_boxes)
+
+    def recognize(self, crops):
+        if not crops:
+            return []
+        crops = list(crops)
+        # 방향 분류기로 뒤집힌 텍스트 보정
+        if self.engine.use_angle_cls and self.engine.text_classifier is not None:
+            crops, _, _ = self.engine.text_classifier(crops)
+        rec_res, _ = self.engine.text_recognizer(crops)
+        return [(text, float(score)) for text, score in rec_res]
+
+    def ocr(self, image):
+        result = self.engine.ocr(image, cls=True)
+        if not result or not result[0]:
+            return []
+        return result[0]
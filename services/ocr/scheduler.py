@@ -0,0 +1,125 @@
+# services/ocr/scheduler.py
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from config import OCR_SCHEDULER_BATCH_SIZE, OCR_DETECT_WORKERS
+from services.ocr.base import crop_text_region
+
+logger = logging.getLogger(__name__)
+
+def _aspect_ratio(crop):
+    """인식 입력 높이로 맞췄을 때의 폭 비율 (배치 패딩 크기 결정)"""
+    return crop.shape[1] / max(crop.shape[0], 1)
+
+class OCRScheduler:
+    """여러 이미지(슬라이드, 문서)의 텍스트 조각을 모아 큰 배치로 인식하는 스케줄러
+
+    이미지별로 검출만 먼저 수행하고, 잘라낸 조각 전체를 가로세로 비율 순으로 정렬해
+    비슷한 크기끼리 묶어 인식한 뒤 결과를 원래 이미지로 되돌린다.
+    """
+    def __init__(self, backend, batch_size=OCR_SCHEDULER_BATCH_SIZE, workers=OCR_DETECT_WORKERS):
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        # 동시 호출이 안전하지 않은 엔진은 단일 스레드로 실행
+        self.workers = (backend.max_workers or workers) if backend.thread_safe else 1
+        self.images = {}
+        self.check_cancelled = None
+
+    def add(self, key, image):
+        """OCR 대상 이미지 등록 (key는 결과를 돌려받을 식별자)"""
+        self.images[key] = image
+
+    def __len__(self):
+        return len(self.images)
+
+    def _map(self, func, keys):
+        """이미지별 작업을 병렬(가능한 경우) 실행"""
+        if self.workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(func, keys))
+        return [func(key) for key in keys]
+
+    def _detect(self, key):
+        """이미지 하나의 텍스트 상자 검출 및 조각 잘라내기"""
+        if self.check_cancelled:
+            self.check_cancelled()
+        image = self.images[key]
+        try:
+            boxes = self.backend.detect(image)
+            crops = [crop_text_region(image, box) for box in boxes]
+            return key, boxes, crops
+        except Exception as e:
+            logger.error(f"{self.backend.name} 텍스트 검출 오류 ({key}): {e}")
+            logger.debug(traceback.format_exc())
+            return key, [], []
+
+    def _ocr_whole(self, key):
+        """검출/인식을 분리할 수 없는 엔진은 이미지 단위로 실행"""
+        if self.check_cancelled:
+            self.check_cancelled()
+        try:
+            return key, self.backend.ocr(self.images[key])
+        except Exception as e:
+            logger.error(f"{self.backend.name} OCR 오류 ({key}): {e}")
+            logger.debug(traceback.format_exc())
+            return key, []
+
+    def run(self, check_cancelled=None):
+        """등록된 모든 이미지 OCR 실행 → {key: [[상자 4점], (텍스트, 신뢰도)], ...}
+
+        check_cancelled는 이미지 검출과 인식 배치 사이마다 호출되며, 예외를 발생시키면 OCR을 중단한다.
+        """
+        self.check_cancelled = check_cancelled
+        keys = list(self.images)
+        results = {key: [] for key in keys}
+        if not keys:
+            return results
+
+        start = time.perf_counter()
+        if not self.backend.split_stages:
+            results.update(self._map(self._ocr_whole, keys))
+            logger.info(f"{self.backend.name} OCR 완료: 이미지 {len(keys)}개, {time.perf_counter() - start:.2f}초")
+            self.images = {}
+            return results
+
+        # 1단계: 이미지별 검출 후 모든 조각을 한 목록으로 수집
+        detected = self._map(self._detect, keys)
+        detect_time = time.perf_counter() - start
+
+        pending = []  # (이미지 key, 상자 번호, 조각)
+        boxes_by_key = {}
+        for key, boxes, crops in detected:
+            boxes_by_key[key] = boxes
+            pending.extend((key, idx, crop) for idx, crop in enumerate(crops))
+
+        # 2단계: 비슷한 비율의 조각끼리 큰 배치로 인식
+        pending.sort(key=lambda item: _aspect_ratio(item[2]))
+        recognized = {key: [None] * len(boxes) for key, boxes in boxes_by_key.items()}
+        batch_count = 0
+        for offset in range(0, len(pending), self.batch_size):
+            batch = pending[offset:offset + self.batch_size]
+            batch_count += 1
+            if check_cancelled:
+                check_cancelled()
+            try:
+                outputs = self.backend.recognize([crop for _, _, crop in batch])
+            except Exception as e:
+                logger.error(f"{self.backend.name} 텍스트 인식 오류 (배치 {batch_count}): {e}")
+                logger.debug(traceback.format_exc())
+                continue
+            for (key, idx, _), output in zip(batch, outputs):
+                recognized[key][idx] = output
+
+        # 3단계: 인식 결과를 원래 이미지의 상자 순서로 되돌림
+        for key, boxes in boxes_by_key.items():
+            for box, output in zip(boxes, recognized[key]):
+                if output and output[0]:
+                    results[key].append([box.tolist(), (output[0], float(output[1]))])
+
+        total_time = time.perf_counter() - start
+        logger.info(f"{self.backend.name} OCR 완료: 이미지 {len(keys)}개, 조각 {len(pending)}개, "
+                    f"인식 배치 {batch_count}개 (검출 {detect_time:.2f}초, 인식 {total_time - detect_time:.2f}초)")
+        self.images = {}
+        return results
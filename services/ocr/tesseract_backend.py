@@ -0,0 +1,189 @@
+# services/ocr/tesseract_backend.py
+import importlib.util
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+import cv2
+import numpy as np
+from PIL import Image
+
+from config import OCR_LANG_MAPPING, TESSERACT_WORKERS
+from services.ocr.base import OCRBackend
+from utils.ocr_layout import rects_to_array
+
+logger = logging.getLogger(__name__)
+
+# 전체 페이지에서 흩어진 텍스트를 찾는 모드 / 한 줄 인식 모드
+PAGE_PSM = 11
+LINE_PSM = 7
+PAGE_CONFIG = f'--oem 3 --psm {PAGE_PSM}'
+LINE_CONFIG = f'--oem 3 --psm {LINE_PSM}'
+
+# tesserocr(C API 바인딩)가 있으면 프로세스 실행 없이 엔진을 재사용
+TESSEROCR_AVAILABLE = importlib.util.find_spec("tesserocr") is not None
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def tesseract_lang(lang):
+    """앱 언어 이름을 Tesseract 언어 조합 문자열로 변환"""
+    return '+'.join(OCR_LANG_MAPPING.get(lang, ['eng']))
+
+def _to_pil(image):
+    """BGR/그레이 ndarray를 메모리상의 PIL 이미지로 변환"""
+    if isinstance(image, Image.Image):
+        return image
+    if image.ndim == 2:
+        return Image.fromarray(image)
+    return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+class TesseractEnginePool:
+    """언어 조합별로 초기화된 tesserocr 엔진 풀 (traineddata는 엔진 생성 시 한 번만 로드)"""
+    def __init__(self, ocr_lang, size=TESSERACT_WORKERS):
+        self.ocr_lang = ocr_lang
+        self.size = max(1, size)
+        self.idle = queue.LifoQueue()
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def _create(self):
+        """새 엔진 생성 (TESSDATA_PREFIX가 설정되어 있으면 해당 경로 사용)"""
+        from tesserocr import PyTessBaseAPI, OEM
+        kwargs = {'lang': self.ocr_lang, 'oem': OEM.DEFAULT}
+        if os.environ.get('TESSDATA_PREFIX'):
+            kwargs['path'] = os.environ['TESSDATA_PREFIX']
+        logger.info(f"Tesseract 엔진 초기화: {self.ocr_lang} ({self.created}/{self.size})")
+        return PyTessBaseAPI(**kwargs)
+
+    @contextmanager
+    def engine(self):
+        """유휴 엔진을 빌려 쓰고 반환 (풀 크기까지는 필요할 때 생성)"""
+        try:
+            api = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                create = self.created < self.size
+                if create:
+                    self.created += 1
+            if create:
+                try:
+                    api = self._create()
+                except Exception:
+                    with self.lock:
+                        self.created -= 1
+                    raise
+            else:
+                api = self.idle.get()
+        try:
+            yield api
+        finally:
+            api.Clear()
+            self.idle.put(api)
+
+    def close(self):
+        """풀의 모든 엔진 종료"""
+        while True:
+            try:
+                api = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            api.End()
+            with self.lock:
+                self.created -= 1
+
+def get_engine_pool(ocr_lang):
+    """언어 조합별 엔진 풀 반환 (최초 호출 시 생성)"""
+    with _pools_lock:
+        if ocr_lang not in _pools:
+            _pools[ocr_lang] = TesseractEnginePool(ocr_lang)
+        return _pools[ocr_lang]
+
+def close_engine_pools():
+    """모든 언어의 Tesseract 엔진 종료"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+class TesseractBackend(OCRBackend):
+    """Tesseract 백엔드 (tesserocr 엔진 풀 우선, 없으면 pytesseract 프로세스 실행)"""
+    name = "tesseract"
+    thread_safe = True  # 스레드마다 별도 엔진(또는 프로세스) 사용
+    split_stages = False  # 검출과 인식을 나누면 오히려 느려짐
+    max_workers = TESSERACT_WORKERS
+
+    def __init__(self, lang):
+        super().__init__(lang)
+        self.ocr_lang = tesseract_lang(lang)
+        if TESSEROCR_AVAILABLE:
+            self.pool = get_engine_pool(self.ocr_lang)
+            self.pytesseract = None
+        else:
+            import pytesseract
+            self.pool = None
+            self.pytesseract = pytesseract
+            logger.warning("tesserocr가 설치되지 않아 이미지마다 tesseract 프로세스를 실행합니다 (느림). "
+                           "pip install -e \".[tesseract]\"로 설치하면 엔진을 상주시켜 재사용합니다.")
+
+    def _tesserocr_words(self, image, psm):
+        """엔진 풀로 단어 단위 인식 (left, top, width, height, 텍스트, 신뢰도 0~100)"""
+        from tesserocr import RIL, iterate_level
+        words = []
+        with self.pool.engine() as api:
+            api.SetPageSegMode(psm)
+            api.SetImage(_to_pil(image))
+            api.Recognize()
+            iterator = api.GetIterator()
+            if iterator is None:
+                return words
+            for word in iterate_level(iterator, RIL.WORD):
+                text = word.GetUTF8Text(RIL.WORD)
+                bbox = word.BoundingBox(RIL.WORD)
+                if not text or bbox is None:
+                    continue
+                x1, y1, x2, y2 = bbox
+                words.append((x1, y1, x2 - x1, y2 - y1, text, word.Confidence(RIL.WORD)))
+        return words
+
+    def _pytesseract_words(self, image, psm):
+        """pytesseract로 단어 단위 인식 (left, top, width, height, 텍스트, 신뢰도 0~100)"""
+        config = PAGE_CONFIG if psm == PAGE_PSM else LINE_CONFIG
+        data = self.pytesseract.image_to_data(
+            _to_pil(image), lang=self.ocr_lang, config=config, output_type=self.pytesseract.Output.DICT
+        )
+        return [(data['left'][i], data['top'][i], data['width'][i], data['height'][i],
+                 data['text'][i], float(data['conf'][i]))
+                for i in range(len(data['text']))]
+
+    def _words(self, image, psm):
+        """단어 단위 OCR 결과 (상자, 텍스트, 신뢰도 0~1)"""
+        if self.pool is not None:
+            words = self._tesserocr_words(image, psm)
+        else:
+            words = self._pytesseract_words(image, psm)
+
+        words = [word for word in words if word[4] and word[4].strip() and word[5] >= 0]
+        if not words:
+            return np.zeros((0, 4, 2), dtype=np.float32), [], []
+
+        lefts, tops, widths, heights, texts, confs = zip(*words)
+        boxes = rects_to_array(lefts, tops, widths, heights)
+        return boxes, [text.strip() for text in texts], [conf / 100 for conf in confs]
+
+    def detect(self, image):
+        boxes, _, _ = self._words(image, PAGE_PSM)
+        return boxes
+
+    def recognize(self, crops):
+        results = []
+        for crop in crops:
+            _, texts, confs = self._words(crop, LINE_PSM)
+            results.append((" ".join(texts), float(np.mean(confs)) if confs else 0.0))
+        return results
+
+    def ocr(self, image):
+        # Tesseract는 검출과 인식을 한 번에 수행하므로 단어 결과를 그대로 사용
+        boxes, texts, confs = self._words(image, PAGE_PSM)
+        return [[box.tolist(), (text, conf)] for box, text, conf in zip(boxes, texts, confs)]
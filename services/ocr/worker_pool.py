@@ -0,0 +1,232 @@
+# services/ocr/worker_pool.py
+import logging
+import multiprocessing
+import statistics
+from collections import deque
+from multiprocessing.connection import wait
+
+from config import (OCR_WORKER_PROCESSES, OCR_WORKER_MAX_IMAGES, OCR_WORKER_RSS_LIMIT_MB,
+                    OCR_WORKER_CHUNK_SIZE, OCR_WORKER_MAX_ATTEMPTS)
+from services.ocr.scheduler import OCRScheduler
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+CANCEL_CHECK_SECONDS = 0.5  # 작업 결과를 기다리는 동안 중지 요청을 확인하는 주기
+
+def _worker_main(conn, backend_name, lang, max_images, rss_limit):
+    """OCR 워커 프로세스: 이미지 묶음을 받아 OCR 후 결과와 메모리 사용량 반환"""
+    import psutil
+    from services.ocr import get_ocr_backend
+
+    backend = get_ocr_backend(backend_name, lang)
+
+    process = psutil.Process()
+    processed = 0
+    peak = 0
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        task_id, images = task
+        scheduler = OCRScheduler(backend)
+        for key, image in images.items():
+            scheduler.add(key, image)
+        results = scheduler.run()
+
+        processed += len(images)
+        rss = process.memory_info().rss
+        peak = max(peak, rss)
+        recycle = processed >= max_images or rss >= rss_limit
+        conn.send((task_id, results, {'rss': rss, 'peak': peak, 'images': processed, 'recycle': recycle}))
+        if recycle:
+            break
+    conn.close()
+
+class _Worker:
+    """워커 프로세스 하나의 연결, 진행 중 작업, 메모리 기록"""
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.task_id = None
+        self.rss_samples = []
+        self.peak = 0
+        self.images = 0
+
+    def stats(self):
+        """최대 메모리와 안정 상태(첫 묶음 이후 중앙값) 메모리"""
+        steady = self.rss_samples[1:] or self.rss_samples
+        return {
+            'pid': self.process.pid,
+            'images': self.images,
+            'peak_mb': self.peak / MB,
+            'steady_mb': statistics.median(steady) / MB if steady else 0.0
+        }
+
+class OCRWorkerPool:
+    """모델을 한 번 로드한 전용 OCR 워커 프로세스 풀
+
+    워커는 처리한 이미지 수가 max_images에 도달하거나 RSS가 rss_limit_mb를 넘으면 교체되고,
+    처리 중 종료된 워커의 작업은 새 워커에 다시 배정된다.
+    """
+    def __init__(self, backend, size=OCR_WORKER_PROCESSES, max_images=OCR_WORKER_MAX_IMAGES,
+                 rss_limit_mb=OCR_WORKER_RSS_LIMIT_MB, chunk_size=OCR_WORKER_CHUNK_SIZE):
+        self.backend_name = backend.name
+        self.lang = backend.lang
+        self.size = max(1, size)
+        self.max_images = max_images
+        self.rss_limit = rss_limit_mb * MB
+        self.chunk_size = max(1, chunk_size)
+
+        # 풀은 번역 스레드들이 실행 중인 프로세스에서 만들어지므로 fork는 쓰지 않음
+        # (상속된 로깅/HTTP 연결 풀 잠금으로 워커가 멈출 수 있음)
+        # forkserver면 엔진 모듈을 서버 프로세스에서 한 번만 import하고, 워커마다 엔진을 로드
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self.context = multiprocessing.get_context("forkserver")
+            self.context.set_forkserver_preload([type(backend).__module__])
+        else:
+            self.context = multiprocessing.get_context("spawn")
+
+        self.workers = []
+        self.retired = []
+        self.recycled = 0
+        self.crashed = 0
+
+    def _start_worker(self):
+        """새 워커 프로세스 시작"""
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(child_conn, self.backend_name, self.lang, self.max_images, self.rss_limit),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self.workers.append(worker)
+        logger.info(f"OCR 워커 시작: pid {process.pid} ({self.backend_name}, {self.lang})")
+        return worker
+
+    def _retire(self, worker):
+        """워커를 풀에서 제거하고 메모리 기록 보관"""
+        self.workers.remove(worker)
+        worker.conn.close()
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+        self.retired.append(worker.stats())
+
+    def run(self, images, check_cancelled=None):
+        """{key: 이미지}를 워커들에 나눠 OCR 실행 → {key: [[상자 4점], (텍스트, 신뢰도)], ...}
+
+        check_cancelled는 대기 중 주기적으로 호출되며, 예외를 발생시키면 OCR을 중단한다 (워커는 close에서 정리).
+        """
+        keys = list(images)
+        results = {key: [] for key in keys}
+
+        tasks = {}
+        for task_id, offset in enumerate(range(0, len(keys), self.chunk_size)):
+            tasks[task_id] = {key: images[key] for key in keys[offset:offset + self.chunk_size]}
+        pending = deque(tasks)
+        attempts = {task_id: 0 for task_id in tasks}
+
+        while pending or any(worker.task_id is not None for worker in self.workers):
+            # 유휴 워커(부족하면 새로 시작)에 작업 배정
+            while pending:
+                idle = [worker for worker in self.workers if worker.task_id is None]
+                if idle:
+                    worker = idle[0]
+                elif len(self.workers) < self.size:
+                    worker = self._start_worker()
+                else:
+                    break
+                task_id = pending.popleft()
+                attempts[task_id] += 1
+                try:
+                    worker.conn.send((task_id, tasks[task_id]))
+                    worker.task_id = task_id
+                except (OSError, EOFError) as e:
+                    logger.warning(f"OCR 워커 전송 실패 (pid {worker.process.pid}): {e}")
+                    pending.appendleft(task_id)
+                    attempts[task_id] -= 1
+                    self.crashed += 1
+                    self._retire(worker)
+
+            busy = [worker for worker in self.workers if worker.task_id is not None]
+            if not busy:
+                continue
+            wait([worker.conn for worker in busy] + [worker.process.sentinel for worker in busy],
+                 timeout=CANCEL_CHECK_SECONDS if check_cancelled else None)
+            if check_cancelled:
+                check_cancelled()
+
+            for worker in busy:
+                task_id = worker.task_id
+                message = None
+                if worker.conn.poll():
+                    try:
+                        message = worker.conn.recv()
+                    except (EOFError, OSError):
+                        message = None
+                elif worker.process.is_alive():
+                    continue
+
+                if message is None:
+                    # 처리 중 종료(OOM 등) → 같은 작업을 다른 워커에 재배정
+                    self.crashed += 1
+                    logger.warning(f"OCR 워커 비정상 종료: pid {worker.process.pid}, "
+                                   f"종료 코드 {worker.process.exitcode} (작업 {task_id}, 시도 {attempts[task_id]})")
+                    worker.task_id = None
+                    self._retire(worker)
+                    if attempts[task_id] < OCR_WORKER_MAX_ATTEMPTS:
+                        pending.append(task_id)
+                    else:
+                        logger.error(f"OCR 작업 {task_id} 포기: {len(tasks[task_id])}개 이미지")
+                    continue
+
+                _, task_results, info = message
+                results.update(task_results)
+                worker.task_id = None
+                worker.images = info['images']
+                worker.peak = info['peak']
+                worker.rss_samples.append(info['rss'])
+                logger.debug(f"OCR 워커 pid {worker.process.pid}: 이미지 {info['images']}개, "
+                             f"RSS {info['rss'] / MB:.0f}MB")
+
+                if info['recycle']:
+                    self.recycled += 1
+                    logger.info(f"OCR 워커 교체: pid {worker.process.pid} "
+                                f"(이미지 {info['images']}개, RSS {info['rss'] / MB:.0f}MB)")
+                    self._retire(worker)
+
+        return results
+
+    def memory_report(self):
+        """워커별 최대/안정 상태 메모리 보고"""
+        return self.retired + [worker.stats() for worker in self.workers]
+
+    def close(self, cancel=False):
+        """모든 워커 종료 후 메모리 사용량 기록 (cancel이면 처리 중인 워커는 기다리지 않고 종료)"""
+        for worker in list(self.workers):
+            if cancel and worker.task_id is not None:
+                worker.process.terminate()
+            try:
+                worker.conn.send(None)
+            except (OSError, EOFError):
+                pass
+            self._retire(worker)
+
+        for stats in self.retired:
+            logger.info(f"OCR 워커 pid {stats['pid']}: 이미지 {stats['images']}개, "
+                        f"최대 {stats['peak_mb']:.0f}MB, 안정 상태 {stats['steady_mb']:.0f}MB")
+        logger.info(f"OCR 워커 풀 종료: 교체 {self.recycled}회, 비정상 종료 {self.crashed}회")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel=exc_type is not None)
@@ -0,0 +1,255 @@
+# services/ollama_pool.py
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from config import (OLLAMA_URLS, OLLAMA_HEALTH_INTERVAL, OLLAMA_DRAIN_FAILURES, OLLAMA_DRAIN_SECONDS,
+                    OLLAMA_COLD_START_SECONDS, OLLAMA_REGION_MAX_RETRIES)
+from services.llm.base import TranslationBackend, TranslationError
+from services.ollama_service import OllamaService
+from services.token_budget import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SECONDS_PER_TOKEN = 0.05  # 아직 응답 시간을 관측하지 못한 서버의 토큰당 예상 처리 시간
+
+class OllamaPool(TranslationBackend):
+    """여러 Ollama 서버에 번역 요청을 나눠 보내는 서버 풀 (TranslationBackend로 단일 서버 대신 사용)
+
+    요청은 모델이 설치된 정상 서버 중 (처리 중인 토큰 수 + 요청 토큰 수) × 토큰당 응답 시간이 가장 작은
+    서버로 보내고, 모델이 로드되지 않은 서버에는 예상 로드 시간을 더한다.
+    연속으로 실패한 서버는 일정 시간 제외했다가 상태 확인에 응답하면 다시 사용한다.
+    """
+    name = "ollama_pool"
+    batch_regions = True
+
+    def __init__(self, urls=None, health_interval=OLLAMA_HEALTH_INTERVAL):
+        urls = list(urls or OLLAMA_URLS)
+        super().__init__(urls[0])  # 대표 주소 (요청은 서버별 OllamaService가 보냄)
+        self.endpoints = [{
+            'url': url,
+            'service': OllamaService(url),
+            'healthy': False,
+            'available': set(),     # 설치된 모델
+            'loaded': set(),        # 메모리에 로드된 모델
+            'outstanding': 0,       # 처리 중인 요청의 추정 원문 토큰 수
+            'seconds_per_token': None,
+            'failures': 0,          # 연속 실패 수
+            'drained_until': 0.0,
+            'requests': 0,
+            'errors': 0,
+            'busy_seconds': 0.0
+        } for url in urls]
+        self.lock = threading.Lock()
+        self.check_health()
+        self.stop_event = threading.Event()
+        self.health_thread = None
+        if health_interval > 0:
+            self.health_thread = threading.Thread(target=self._health_loop, args=(health_interval,), daemon=True)
+            self.health_thread.start()
+
+    @property
+    def max_concurrency(self):
+        """모든 서버의 동시 처리 요청 수 합계"""
+        return sum(endpoint['service'].max_concurrency for endpoint in self.endpoints)
+
+    @property
+    def server_count(self):
+        return len(self.endpoints)
+
+    def generation_timeout(self, num_predict: int) -> float:
+        """가장 느린 서버 기준 생성 제한 시간(초)"""
+        return max(endpoint['service'].generation_timeout(num_predict) for endpoint in self.endpoints)
+
+    def close(self):
+        """상태 확인 스레드 종료"""
+        self.stop_event.set()
+        if self.health_thread is not None:
+            self.health_thread.join(timeout=1)
+
+    def check_health(self):
+        """모든 서버의 응답 여부와 설치/로드된 모델 갱신"""
+        for endpoint in self.endpoints:
+            status = endpoint['service'].get_model_status()
+            with self.lock:
+                was_healthy = endpoint['healthy']
+                endpoint['healthy'] = status is not None
+                if status is not None:
+                    endpoint['available'] = set(status['available'])
+                    endpoint['loaded'] = set(status['loaded'])
+                    if time.monotonic() >= endpoint['drained_until']:
+                        endpoint['failures'] = 0
+            if was_healthy != endpoint['healthy']:
+                logger.info(f"Ollama 서버 {'정상' if endpoint['healthy'] else '응답 없음'}: {endpoint['url']}")
+
+    def get_text_models(self) -> List[str]:
+        """정상 서버 중 하나 이상에 설치된 모델 목록"""
+        with self.lock:
+            return sorted({model for endpoint in self.endpoints if endpoint['healthy']
+                           for model in endpoint['available']})
+
+    def _health_loop(self, interval):
+        while not self.stop_event.wait(interval):
+            self.check_health()
+
+    def _acquire(self, model, tokens, exclude=()):
+        """요청을 보낼 서버 선택 (처리 중 토큰 수에 요청 토큰 수를 더해 둠)"""
+        with self.lock:
+            now = time.monotonic()
+            with_model = [endpoint for endpoint in self.endpoints if model in endpoint['available']]
+            if not with_model:
+                raise TranslationError(f"모델 {model}이 설치된 Ollama 서버 없음")
+            candidates = [endpoint for endpoint in with_model
+                          if endpoint['healthy'] and endpoint['drained_until'] <= now and endpoint not in exclude]
+            if not candidates:
+                raise TranslationError(f"모델 {model}을 사용할 수 있는 정상 Ollama 서버 없음")
+
+            observed = [endpoint['seconds_per_token'] for endpoint in self.endpoints if endpoint['seconds_per_token']]
+            default_rate = sum(observed) / len(observed) if observed else DEFAULT_SECONDS_PER_TOKEN
+
+            def expected_seconds(endpoint):
+                rate = endpoint['seconds_per_token'] or default_rate
+                cold_start = 0 if model in endpoint['loaded'] else OLLAMA_COLD_START_SECONDS
+                return (endpoint['outstanding'] + tokens) * rate + cold_start
+
+            endpoint = min(candidates, key=expected_seconds)
+            endpoint['outstanding'] += tokens
+            endpoint['requests'] += 1
+            return endpoint
+
+    def _release(self, endpoint, model, tokens, elapsed, error=None):
+        """요청 결과 기록 (성공하면 토큰당 응답 시간 갱신, 연속 실패가 쌓이면 서버 제외)"""
+        with self.lock:
+            endpoint['outstanding'] -= tokens
+            endpoint['busy_seconds'] += elapsed
+            if error is None:
+                rate = elapsed / max(1, tokens)
+                previous = endpoint['seconds_per_token']
+                endpoint['seconds_per_token'] = rate if previous is None else 0.8 * previous + 0.2 * rate
+                endpoint['failures'] = 0
+                endpoint['loaded'].add(model)
+                return
+            endpoint['errors'] += 1
+            endpoint['failures'] += 1
+            if endpoint['failures'] >= OLLAMA_DRAIN_FAILURES and endpoint['drained_until'] <= time.monotonic():
+                endpoint['drained_until'] = time.monotonic() + OLLAMA_DRAIN_SECONDS
+                logger.warning(f"Ollama 서버 연속 실패 {endpoint['failures']}회, "
+                               f"{OLLAMA_DRAIN_SECONDS}초 동안 제외: {endpoint['url']} ({error})")
+
+    def _call(self, model, tokens, method, *args, **kwargs):
+        """서버를 골라 요청 실행 (실패하면 다른 서버로 한 번 더 시도)"""
+        tried = []
+        while True:
+            try:
+                endpoint = self._acquire(model, tokens, exclude=tried)
+            except TranslationError:
+                if tried:
+                    raise last_error
+                raise
+            start = time.perf_counter()
+            try:
+                result = getattr(endpoint['service'], method)(*args, **kwargs)
+            except TranslationError as e:
+                self._release(endpoint, model, tokens, time.perf_counter() - start, error=e)
+                tried.append(endpoint)
+                last_error = e
+                if len(tried) >= 2:
+                    raise
+                continue
+            self._release(endpoint, model, tokens, time.perf_counter() - start)
+            return result
+
+    def translate_text(self, text: str, source_lang: str, target_lang: str, model: str,
+                       glossary_terms: Optional[List[Tuple[str, str]]] = None, raise_on_error: bool = False) -> str:
+        """텍스트 번역 (OllamaService.translate_text와 같음)"""
+        if not text or text.isspace():
+            return text
+        try:
+            return self._call(model, estimate_tokens(text), 'translate_text', text, source_lang, target_lang, model,
+                              glossary_terms=glossary_terms, raise_on_error=True)
+        except TranslationError:
+            if raise_on_error:
+                raise
+            return text
+
+    def translate_regions(self, regions: Dict[str, str], source_lang: str, target_lang: str,
+                          model: str, max_retries: int = OLLAMA_REGION_MAX_RETRIES,
+                          glossary_terms: Optional[List[Tuple[str, str]]] = None, raise_on_error: bool = False,
+                          failed: Optional[List[str]] = None) -> Dict[str, str]:
+        """영역 번역 (OllamaService.translate_regions와 같음)"""
+        tokens = sum(estimate_tokens(text) for text in regions.values() if text)
+        try:
+            return self._call(model, tokens, 'translate_regions', regions, source_lang, target_lang, model,
+                              max_retries=max_retries, glossary_terms=glossary_terms, raise_on_error=True,
+                              failed=failed)
+        except TranslationError:
+            if raise_on_error:
+                raise
+            if failed is not None:
+                failed.extend(region_id for region_id, text in regions.items() if text and not text.isspace())
+            return dict(regions)
+
+    def preload_model(self, model: str, keep_alive: Optional[str] = None) -> Optional[float]:
+        """모델이 설치된 정상 서버 모두에 모델을 미리 로드 → 가장 긴 로드 시간(초), 모두 실패하면 None"""
+        with self.lock:
+            targets = [endpoint for endpoint in self.endpoints
+                       if endpoint['healthy'] and model in endpoint['available']]
+        results = {}
+
+        def preload(endpoint):
+            results[endpoint['url']] = endpoint['service'].preload_model(model, keep_alive)
+            if results[endpoint['url']] is not None:
+                with self.lock:
+                    endpoint['loaded'].add(model)
+
+        threads = [threading.Thread(target=preload, args=(endpoint,), daemon=True) for endpoint in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        load_times = [load_time for load_time in results.values() if load_time is not None]
+        if not load_times:
+            logger.warning(f"모델 {model}을 미리 로드한 Ollama 서버 없음")
+            return None
+        return max(load_times)
+
+    def release_model(self, model: str) -> bool:
+        """모델이 로드된 모든 서버에서 모델 언로드"""
+        with self.lock:
+            targets = [endpoint for endpoint in self.endpoints if endpoint['healthy'] and model in endpoint['loaded']]
+        released = True
+        for endpoint in targets:
+            if endpoint['service'].release_model(model):
+                with self.lock:
+                    endpoint['loaded'].discard(model)
+            else:
+                released = False
+        return released
+
+    def reset_timings(self) -> None:
+        """모든 서버의 소요 시간 집계와 서버별 요청 통계 초기화"""
+        with self.lock:
+            for endpoint in self.endpoints:
+                endpoint['service'].reset_timings()
+                endpoint['requests'] = 0
+                endpoint['errors'] = 0
+                endpoint['busy_seconds'] = 0.0
+
+    def get_timings(self) -> Dict[str, float]:
+        """모든 서버의 소요 시간 합계와 서버별 요청 수, 실패 수, 평균 응답 시간"""
+        totals = Counter()
+        runaway = Counter()
+        for endpoint in self.endpoints:
+            timings = endpoint['service'].get_timings()
+            runaway.update(timings.pop('runaway', {}))
+            totals.update(timings)
+        with self.lock:
+            endpoints = {endpoint['url']: {
+                'requests': endpoint['requests'],
+                'errors': endpoint['errors'],
+                'latency': endpoint['busy_seconds'] / endpoint['requests'] if endpoint['requests'] else 0.0,
+                'drained': endpoint['drained_until'] > time.monotonic()
+            } for endpoint in self.endpoints}
+        return dict(totals, runaway=dict(runaway), endpoints=endpoints)
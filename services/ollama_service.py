@@ -8,17 +8,20 @@ import psutil
 import json
 import logging
 import shutil
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict, Iterator
 
-from config import DEFAULT_OLLAMA_URL, OLLAMA_CONNECT_TIMEOUT, OLLAMA_READ_TIMEOUT
+from config import DEFAULT_OLLAMA_URL, OLLAMA_KEEP_ALIVE
+from services.llm.base import TranslationBackend
 
 logger = logging.getLogger(__name__)
 
-class OllamaService:
+class OllamaService(TranslationBackend):
+    """Ollama 서버 관리(설치, 실행, 모델)와 /api/chat 번역 백엔드"""
+    name = "ollama"
+    
     def __init__(self, url: str = DEFAULT_OLLAMA_URL):
-        self.url = url
-        self.connect_timeout = OLLAMA_CONNECT_TIMEOUT
-        self.read_timeout = OLLAMA_READ_TIMEOUT
+        super().__init__(url)
+        self.keep_alive = OLLAMA_KEEP_ALIVE
         
     def is_installed(self) -> bool:
         """Ollama 설치 여부 확인"""
@@ -134,60 +137,91 @@ class OllamaService:
             logger.error(f"모델 목록 가져오기 오류: {e}")
             return []
     
-    def translate_text(self, text: str, source_lang: str, target_lang: str, model: str) -> str:
-        """텍스트 번역"""
-        if not text or text.isspace():
-            return text
-        
-        logger.debug(f"번역 시작: '{text[:50]}...' ({source_lang} → {target_lang})")
-        
-        # 번역 프롬프트
-        prompt = f"You are a translator. Your role is to accurately translate the given {source_lang} text into {target_lang}. Do not provide any explanations, only the translated result. : {text}"
-        
-        response = None
+    def get_model_status(self) -> Optional[Dict[str, List[str]]]:
+        """설치된 모델과 메모리에 로드된 모델 {'available': [...], 'loaded': [...]} (서버가 응답하지 않으면 None)"""
+        try:
+            status = {}
+            for key, path in (('available', '/api/tags'), ('loaded', '/api/ps')):
+                response = requests.get(f"{self.url}{path}", timeout=self.connect_timeout)
+                if response.status_code != 200:
+                    return None
+                status[key] = [model['name'] for model in response.json().get('models', [])]
+            return status
+        except Exception as e:
+            logger.debug(f"모델 상태 확인 실패 ({self.url}): {e}")
+            return None
+    
+    def preload_model(self, model: str, keep_alive: Optional[str] = None) -> Optional[float]:
+        """빈 generate 요청으로 모델을 미리 로드하고 keep_alive 동안 상주시킴 → 로드 시간(초), 실패 시 None"""
+        start = time.perf_counter()
         try:
-            # API 호출
             response = requests.post(
                 f"{self.url}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": True
-                },
-                timeout=(self.connect_timeout, self.read_timeout)
+                json={"model": model, "keep_alive": keep_alive or self.keep_alive, "stream": False},
+                timeout=(self.connect_timeout, max(self.read_timeout, 300))
             )
+            if response.status_code != 200:
+                logger.warning(f"모델 미리 로드 실패 ({model}): HTTP {response.status_code}")
+                return None
             
+            data = response.json()
+            self._record_timings(data)
+            load_time = data.get('load_duration', 0) / 1e9
+            logger.info(f"모델 미리 로드 완료: {model} (로드 {load_time:.2f}초, "
+                        f"전체 {time.perf_counter() - start:.2f}초, 상주 {keep_alive or self.keep_alive})")
+            return load_time
+        except Exception as e:
+            logger.warning(f"모델 미리 로드 오류 ({model}): {e}")
+            return None
+    
+    def release_model(self, model: str) -> bool:
+        """keep_alive 0 요청으로 모델을 바로 언로드"""
+        try:
+            response = requests.post(
+                f"{self.url}/api/generate",
+                json={"model": model, "keep_alive": 0, "stream": False},
+                timeout=(self.connect_timeout, self.read_timeout)
+            )
             if response.status_code == 200:
-                # 스트리밍 응답 처리
-                translated_text = ""
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            line_data = json.loads(line.decode('utf-8'))
-                            if 'response' in line_data:
-                                translated_text += line_data['response']
-                            
-                            if line_data.get('done', False):
-                                break
-                        except json.JSONDecodeError:
-                            continue
-                
-                logger.info(f"번역 완료: '{text[:30]}...' → '{translated_text[:30]}...'")
-                return translated_text.strip()
-            else:
-                logger.error(f"번역 API 오류 (HTTP {response.status_code})")
-                return text
-                
-        except requests.exceptions.Timeout:
-            logger.error("번역 API 타임아웃")
-            return text
+                logger.info(f"모델 언로드: {model}")
+                return True
+            logger.warning(f"모델 언로드 실패 ({model}): HTTP {response.status_code}")
+            return False
         except Exception as e:
-            logger.error(f"번역 오류: {e}")
-            return text
-        finally:
-            # 리소스 정리
-            if response is not None:
-                response.close()
+            logger.warning(f"모델 언로드 오류 ({model}): {e}")
+            return False
+    
+    def _post_chat(self, model: str, messages: List[Dict[str, str]], num_predict: int,
+                   options: Optional[Dict] = None, stream: bool = False, json_format: bool = False,
+                   timeout=None) -> requests.Response:
+        """/api/chat 요청 (요청마다 keep_alive로 모델 상주 시간 연장)"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "keep_alive": self.keep_alive,
+            "options": dict(options or {}, num_predict=num_predict),
+            "stream": stream
+        }
+        if json_format:
+            payload["format"] = "json"
+        return requests.post(f"{self.url}/api/chat", json=payload, stream=stream, timeout=timeout)
+    
+    def _stream_events(self, response: requests.Response) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """NDJSON 스트림 → (생성된 조각, 마지막 줄이면 완료 정보)"""
+        for line in response.iter_lines():
+            if not line:
+                yield "", None
+                continue
+            try:
+                line_data = json.loads(line.decode('utf-8'))
+            except json.JSONDecodeError:
+                continue
+            yield line_data.get('message', {}).get('content', ''), line_data if line_data.get('done', False) else None
+    
+    def _response_content(self, response: requests.Response) -> Tuple[str, Dict]:
+        """스트리밍이 아닌 /api/chat 응답 → (생성된 내용, 완료 정보)"""
+        data = response.json()
+        return data.get('message', {}).get('content', ''), data
     
     def install_model(self, model_name: str) -> bool:
         """모델 설치"""
@@ -0,0 +1,253 @@
+# services/resilience.py
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+
+from config import (TEXT_TRANSLATION_WORKERS, OLLAMA_RETRY_ATTEMPTS, OLLAMA_RETRY_BACKOFF, OLLAMA_RETRY_BACKOFF_MAX,
+                    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS, CIRCUIT_GIVE_UP_SECONDS)
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """서버가 오랫동안 회복되지 않아 요청을 보내지 않고 포기함"""
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 요청을 일시 중지하고, 대기 후 시험 요청 하나로 서버 회복을 확인하는 차단기"""
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_seconds=CIRCUIT_RESET_SECONDS,
+                 give_up_seconds=CIRCUIT_GIVE_UP_SECONDS):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.give_up_seconds = give_up_seconds
+        self.state = 'closed'        # closed(정상), open(일시 중지), half_open(시험 요청 중)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.unhealthy_since = None  # 이번 장애가 시작된 시각 (정상 응답을 받으면 초기화)
+        self.probe_in_flight = False
+        self.trips = 0
+        self.closed = False  # 실행기가 취소로 종료되어 더 이상 요청을 보내지 않음
+        self.cond = threading.Condition()
+
+    def before_call(self):
+        """요청 전에 호출 (일시 중지 중이면 대기, 장애가 너무 길면 CircuitOpenError) → 시험 요청이면 True"""
+        with self.cond:
+            while True:
+                if self.closed:
+                    raise CircuitOpenError("요청 실행기 종료")
+                if self.state == 'closed':
+                    return False
+                now = time.monotonic()
+                if now - self.unhealthy_since > self.give_up_seconds:
+                    raise CircuitOpenError(f"번역 서버가 {self.give_up_seconds}초 이상 응답하지 않음")
+                if self.state == 'open':
+                    remaining = self.opened_at + self.reset_seconds - now
+                    if remaining > 0:
+                        self.cond.wait(remaining)
+                        continue
+                    self.state = 'half_open'
+                if not self.probe_in_flight:
+                    self.probe_in_flight = True
+                    return True
+                self.cond.wait(self.reset_seconds)
+
+    def record_success(self):
+        """정상 응답 기록 (차단 해제)"""
+        with self.cond:
+            if self.state != 'closed':
+                logger.info("번역 서버 회복, 요청 재개")
+            self.state = 'closed'
+            self.failures = 0
+            self.unhealthy_since = None
+            self.probe_in_flight = False
+            self.cond.notify_all()
+
+    def close(self):
+        """대기 중인 요청을 깨워 포기시킴 (실행기를 취소로 종료할 때)"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def release_probe(self):
+        """서버 상태와 무관한 오류로 끝난 시험 요청 반납 (다음 요청이 다시 시험 요청이 됨)"""
+        with self.cond:
+            self.probe_in_flight = False
+            self.cond.notify_all()
+
+    def record_failure(self):
+        """실패 기록 (연속 실패가 기준을 넘거나 시험 요청이 실패하면 일시 중지)"""
+        with self.cond:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.trips += 1
+                    logger.warning(f"번역 서버 연속 실패 {self.failures}회, {self.reset_seconds}초 동안 요청 일시 중지")
+                if self.unhealthy_since is None:
+                    self.unhealthy_since = time.monotonic()
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+            self.cond.notify_all()
+
+def _resolve(future, result=None, error=None):
+    """Future에 결과 또는 예외 설정 (이미 취소된 Future는 무시)"""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+class RetryDispatcher:
+    """지연 재시도 대기열과 서킷 브레이커를 갖춘 요청 실행기 (ThreadPoolExecutor처럼 submit/shutdown 사용)
+
+    retry_on 예외로 실패한 요청은 스레드를 점유하지 않고 대기열에서 백오프 시간을 기다린 뒤 다시 실행되며,
+    max_attempts번 모두 실패하면 Future에 마지막 예외가 설정된다.
+    controller(AIMDController)가 있으면 동시에 실행하는 요청 수를 조절기의 창 크기로 제한하고,
+    request_tokens(args, kwargs → 요청 토큰 수)가 있으면 응답 시간을 요청 크기와 함께 조절기에 알린다.
+    """
+    def __init__(self, max_workers=TEXT_TRANSLATION_WORKERS, retry_on=(Exception,), breaker=None,
+                 max_attempts=OLLAMA_RETRY_ATTEMPTS, backoff=OLLAMA_RETRY_BACKOFF, backoff_max=OLLAMA_RETRY_BACKOFF_MAX,
+                 controller=None, request_tokens=None):
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="translate")
+        self.retry_on = retry_on
+        self.breaker = breaker or CircuitBreaker()
+        self.controller = controller
+        self.request_tokens = request_tokens
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.queue = []  # (실행 시각, 순번, 작업)
+        self.sequence = itertools.count()
+        self.pending = {}  # 아직 결과가 정해지지 않은 작업
+        self.cond = threading.Condition()
+        self.closed = False
+        self.retries = 0
+        self.failures = 0
+        self.timer = threading.Thread(target=self._timer_loop, daemon=True)
+        self.timer.start()
+
+    def submit(self, func, *args, **kwargs):
+        """요청 실행 → Future"""
+        task = {'func': func, 'args': args, 'kwargs': kwargs, 'future': Future(), 'attempts': 0,
+                'tokens': self.request_tokens(args, kwargs) if self.request_tokens else 1}
+        with self.cond:
+            self.pending[id(task)] = task
+        self.executor.submit(self._run, task)
+        return task['future']
+
+    def call(self, func, *args, **kwargs):
+        """요청을 실행하고 결과를 기다림 (재시도 포함)"""
+        return self.submit(func, *args, **kwargs).result()
+
+    def _finish(self, task, result=None, error=None):
+        with self.cond:
+            self.pending.pop(id(task), None)
+        _resolve(task['future'], result, error)
+
+    def _run(self, task):
+        """작업 1회 실행 (실패하면 백오프 후 재실행 예약)"""
+        if task['future'].cancelled():
+            self._finish(task)
+            return
+        try:
+            probe = self.breaker.before_call()
+        except CircuitOpenError as e:
+            if self.closed:
+                # 취소로 종료되어 차단기 대기를 멈춘 요청
+                task['future'].cancel()
+            self._finish(task, error=e)
+            return
+
+        task['attempts'] += 1
+        recorded = False  # 차단기에 요청 결과를 기록했는지 (기록하지 않은 시험 요청은 finally에서 반납)
+        try:
+            if self.controller is not None:
+                self.controller.acquire()
+            start = time.monotonic()
+            try:
+                result = task['func'](*task['args'], **task['kwargs'])
+            except self.retry_on as e:
+                if self.controller is not None:
+                    self.controller.release(time.monotonic() - start, failed=True)
+                self.breaker.record_failure()
+                recorded = True
+                if task['attempts'] < self.max_attempts and not self.closed:
+                    delay = min(self.backoff_max, self.backoff * 2 ** (task['attempts'] - 1)) * random.uniform(0.8, 1.2)
+                    logger.info(f"요청 실패, {delay:.1f}초 후 재시도 ({task['attempts']}/{self.max_attempts}): {e}")
+                    with self.cond:
+                        self.retries += 1
+                        heapq.heappush(self.queue, (time.monotonic() + delay, next(self.sequence), task))
+                        self.cond.notify_all()
+                else:
+                    with self.cond:
+                        self.failures += 1
+                    self._finish(task, error=e)
+                return
+            except Exception as e:
+                # 재시도 대상이 아닌 오류는 서버 장애로 보지 않음
+                if self.controller is not None:
+                    self.controller.release(time.monotonic() - start, tokens=task['tokens'])
+                self._finish(task, error=e)
+                return
+            if self.controller is not None:
+                self.controller.release(time.monotonic() - start, tokens=task['tokens'])
+            self.breaker.record_success()
+            recorded = True
+            self._finish(task, result)
+        finally:
+            if probe and not recorded:
+                self.breaker.release_probe()
+
+    def _timer_loop(self):
+        """재시도 시각이 된 작업을 실행 스레드에 다시 넣음"""
+        with self.cond:
+            while not self.closed:
+                if not self.queue:
+                    self.cond.wait()
+                    continue
+                due = self.queue[0][0]
+                now = time.monotonic()
+                if due > now:
+                    self.cond.wait(due - now)
+                    continue
+                task = heapq.heappop(self.queue)[2]
+                self.executor.submit(self._run, task)
+
+    def stats(self):
+        """재시도 수, 최종 실패 수, 일시 중지 횟수"""
+        with self.cond:
+            return {'retries': self.retries, 'failures': self.failures, 'circuit_trips': self.breaker.trips}
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """실행기 종료 (cancel_futures면 대기 중인 요청과 재시도 취소)"""
+        with self.cond:
+            self.closed = True
+            queued = [task for _, _, task in self.queue]
+            self.queue.clear()
+            self.cond.notify_all()
+        if cancel_futures:
+            # 차단기가 열려 대기 중인 실행 스레드가 종료를 막지 않도록 깨움
+            self.breaker.close()
+        for task in queued:
+            if cancel_futures:
+                task['future'].cancel()
+            else:
+                # 재시도를 기다리던 작업은 마지막 시도로 바로 실행
+                self.executor.submit(self._run, task)
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        self.timer.join(timeout=1)
+        if cancel_futures:
+            # 실행되지 못하고 취소된 작업의 Future도 취소 상태로 정리
+            with self.cond:
+                leftover = list(self.pending.values())
+                self.pending.clear()
+            for task in leftover:
+                task['future'].cancel()
+        stats = self.stats()
+        if stats['retries'] or stats['failures'] or stats['circuit_trips']:
+            logger.info(f"요청 재시도 {stats['retries']}회, 최종 실패 {stats['failures']}회, "
+                        f"일시 중지 {stats['circuit_trips']}회")
@@ -0,0 +1,114 @@
+# services/run_report.py
+import logging
+import threading
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+def _model_summary(stats):
+    """모델별 기록 → 요청 수, 토큰 수, 평균/p90 응답 시간"""
+    latencies = sorted(stats['latencies'])
+    return {
+        'requests': stats['requests'],
+        'tokens': stats['tokens'],
+        'latency_avg': sum(latencies) / len(latencies) if latencies else 0.0,
+        'latency_p90': latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))] if latencies else 0.0
+    }
+
+class RunReport:
+    """번역 작업 하나의 LLM 호출 수와 생략한 호출 수 집계"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.llm_calls = Counter()    # 요청 종류별 실제 호출 수 (text, regions)
+        self.saved_calls = Counter()  # 생략 사유별 호출 수 (분류 규칙, glossary, incremental)
+        self.timings = {}             # 번역 서버 소요 시간 (모델 로드, 생성)
+        self.fallbacks = []           # 재시도 후에도 번역하지 못해 원문을 그대로 쓴 위치
+        self.models = {}              # 모델별 요청 수, 원문 토큰 수, 응답 시간 목록
+        self.concurrency = {}         # 동시 요청 수 조절 결과 (최종 창 크기, 창 크기별 처리량)
+
+    def record_call(self, kind, count=1):
+        """LLM 호출 기록"""
+        with self.lock:
+            self.llm_calls[kind] += count
+
+    def record_saved(self, reason, count=1):
+        """LLM 호출 없이 처리한 기록"""
+        with self.lock:
+            self.saved_calls[reason] += count
+
+    def record_fallback(self, kind, location, text, error):
+        """번역 실패로 원문을 그대로 사용한 기록 (kind: text, regions)"""
+        with self.lock:
+            self.fallbacks.append({'kind': kind, 'location': location, 'text': text, 'error': str(error)})
+
+    def record_model(self, model, seconds, tokens):
+        """모델별 요청 1회의 응답 시간(초)과 원문 추정 토큰 수 기록"""
+        with self.lock:
+            stats = self.models.setdefault(model, {'requests': 0, 'tokens': 0, 'latencies': []})
+            stats['requests'] += 1
+            stats['tokens'] += tokens
+            stats['latencies'].append(seconds)
+
+    def record_concurrency(self, stats):
+        """동시 요청 수 조절기의 최종 상태 기록"""
+        with self.lock:
+            self.concurrency = dict(stats)
+
+    def record_timings(self, timings):
+        """번역 서버가 보고한 소요 시간 기록"""
+        with self.lock:
+            self.timings = dict(timings)
+
+    def summary(self):
+        """집계 결과 (호출/생략 수, 소요 시간, 원문 유지 위치, 모델별 통계, 동시 요청 수 조절 결과)"""
+        with self.lock:
+            return {
+                'llm_calls': dict(self.llm_calls),
+                'saved_calls': dict(self.saved_calls),
+                'total_calls': sum(self.llm_calls.values()),
+                'total_saved': sum(self.saved_calls.values()),
+                'timings': dict(self.timings),
+                'fallbacks': list(self.fallbacks),
+                'models': {model: _model_summary(stats) for model, stats in self.models.items()},
+                'concurrency': dict(self.concurrency)
+            }
+
+    def log_summary(self):
+        """집계 결과를 로그로 출력"""
+        summary = self.summary()
+        total = summary['total_calls'] + summary['total_saved']
+        ratio = summary['total_saved'] / total * 100 if total else 0.0
+        saved = ", ".join(f"{reason} {count}" for reason, count in sorted(summary['saved_calls'].items()))
+        logger.info(f"LLM 호출 {summary['total_calls']}회, 생략 {summary['total_saved']}회 ({ratio:.1f}%)"
+                    + (f" - {saved}" if saved else ""))
+        timings = summary['timings']
+        if timings.get('requests'):
+            logger.info(f"모델 로드 {timings['load']:.2f}초, 생성 {timings['generate']:.2f}초 "
+                        f"(프롬프트 처리 {timings['prompt_eval']:.2f}초, 출력 {timings['eval']:.2f}초)")
+            # 프롬프트 캐시가 재사용되면 요청당 새로 처리한 프롬프트 토큰 수가 줄어듦
+            logger.info(f"프롬프트 토큰 {timings['prompt_eval_count']}개 "
+                        f"(요청당 {timings['prompt_eval_count'] / timings['requests']:.1f}개), "
+                        f"출력 토큰 {timings['eval_count']}개")
+            runaway = {reason: count for reason, count in timings.get('runaway', {}).items() if count}
+            if runaway:
+                logger.info("생성 중단/정리: " + ", ".join(f"{reason} {count}" for reason, count in runaway.items()))
+        for url, endpoint in timings.get('endpoints', {}).items():
+            logger.info(f"서버 {url}: 요청 {endpoint['requests']}회, 실패 {endpoint['errors']}회, "
+                        f"평균 응답 {endpoint['latency']:.2f}초" + (" (제외됨)" if endpoint['drained'] else ""))
+        for model, stats in sorted(summary['models'].items()):
+            logger.info(f"모델 {model}: 요청 {stats['requests']}회, 원문 {stats['tokens']}토큰, "
+                        f"응답 평균 {stats['latency_avg']:.2f}초 / p90 {stats['latency_p90']:.2f}초")
+        concurrency = summary['concurrency']
+        if concurrency.get('rounds'):
+            unit = "토큰/초" if concurrency['unit'] == 'tokens' else "요청/초"
+            curve = ", ".join(f"{size}개 {throughput:.1f}" for size, throughput in concurrency['curve'].items())
+            logger.info(f"동시 요청 수 {concurrency['window']}/{concurrency['max_window']} "
+                        f"(감소 {concurrency['decreases']}회) - 처리량({unit}) {curve}")
+        fallbacks = summary['fallbacks']
+        if fallbacks:
+            logger.warning(f"번역 실패로 원문 유지 {len(fallbacks)}건 (다시 번역하면 이 위치만 새로 요청)")
+            for fallback in fallbacks[:10]:
+                logger.warning(f"  {fallback['location']}: '{fallback['text'][:40]}' ({fallback['error']})")
+            if len(fallbacks) > 10:
+                logger.warning(f"  ... 외 {len(fallbacks) - 10}건")
+        return summary
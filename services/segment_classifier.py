@@ -0,0 +1,111 @@
+# services/segment_classifier.py
+import logging
+import re
+import threading
+
+from config import LANGUAGE_SCRIPTS, SEGMENT_SKIP_RULES, SEGMENT_SKIP_RULES_BY_PAIR
+from utils.image_utils import is_numeric_text
+
+logger = logging.getLogger(__name__)
+
+_URL_PATTERN = re.compile(
+    r"^(https?://|ftp://|www\.)\S+$|^[\w-]+(\.[\w-]+)*\.(com|net|org|io|dev|ai|co|jp|kr|cn|tw|th|fr|es)(/\S*)?$",
+    re.IGNORECASE
+)
+_EMAIL_PATTERN = re.compile(r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$")
+# 대문자/숫자 조합 중 구분 기호(-_/.#+)가 있거나 글자와 숫자가 각각 3개 이상인 것 (예: ABC-1234, SKU_12A/B, ABC1234)
+# (Q3, FY2024, 4K처럼 짧은 약어는 번역 대상)
+_PART_NUMBER_PATTERN = re.compile(
+    r"^(?=\S*[A-Z])(?=\S*\d)(?=\S*[\-_/.#+]|(\S*[A-Z]){3})(?=(\S*\d){3}|\S*[\-_/.#+])"
+    r"[A-Z0-9][A-Z0-9\-_/.#+]*[A-Z0-9]$"
+)
+# 코드 표시(괄호 호출, _, ., ::, 옵션/경로/태그 기호)가 있어야 코드로 판단 (iPhone, YouTube 같은 이름은 번역 대상)
+_CODE_PATTERNS = [
+    re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)+(\(.*\))?$", re.ASCII),  # obj.method(), package.module
+    re.compile(r"^[A-Za-z_]\w*(::[A-Za-z_]\w*)+(\(.*\))?$", re.ASCII),  # std::vector, Class::method()
+    re.compile(r"^[a-z_]\w*\(([^()]*[,=\"'][^()]*|[a-z_]\w*)?\)$", re.ASCII),  # func(), func(a, b), func(x)
+    re.compile(r"^[a-z][a-z0-9]*(_[a-z0-9]+)+$"),  # snake_case
+    re.compile(r"^[a-z]+(?=([a-z0-9]*[A-Z]){2})(?=\w*\d)[A-Za-z0-9]+$", re.ASCII),  # camelCase (대문자 2개 이상 + 숫자)
+    re.compile(r"^--?[a-z][\w-]*(=\S+)?$"),  # --option=value
+    re.compile(r"^([A-Za-z]:\\|\.{0,2}/)\S+$"),  # 파일 경로
+    re.compile(r"^</?[A-Za-z][^<>]*>$"),  # <tag>
+]
+# 연도가 있는 날짜와 시각만 제외 (1/2, 3.15처럼 분수나 버전일 수 있는 형식은 번역 대상)
+_DATE_PATTERNS = [
+    re.compile(r"^\d{4}[./-]\d{1,2}([./-]\d{1,2})?\.?$"),  # 2024-03-01, 2024.03
+    re.compile(r"^\d{1,2}[./-]\d{1,2}[./-](\d{2}|\d{4})$"),  # 03/15/2024, 15.03.24
+    re.compile(r"^([01]?\d|2[0-3]):[0-5]\d(:[0-5]\d)?$"),  # 14:30
+    re.compile(r"^\d{4}[./-]\d{1,2}[./-]\d{1,2}\s+\d{1,2}:\d{2}(:\d{2})?$"),
+]
+
+def char_script(char):
+    """문자의 문자 체계 (hangul, kana, han, thai, latin, 그 외 None)"""
+    code = ord(char)
+    if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return "hangul"
+    if 0x3040 <= code <= 0x30FF or 0x31F0 <= code <= 0x31FF or 0xFF66 <= code <= 0xFF9F:
+        return "kana"
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF or 0xF900 <= code <= 0xFAFF or 0x20000 <= code <= 0x2FA1F:
+        return "han"
+    if 0x0E00 <= code <= 0x0E7F:
+        return "thai"
+    if char.isalpha() and (code < 0x0250 or 0xFF21 <= code <= 0xFF5A):
+        return "latin"
+    return None
+
+def text_scripts(text):
+    """텍스트에 쓰인 문자 체계 집합 (숫자, 기호는 제외)"""
+    return {script for script in map(char_script, text) if script}
+
+class SegmentClassifier:
+    """번역할 필요가 없는 텍스트(URL, 코드, 날짜, 이미 대상 언어인 문장 등)를 걸러내는 분류기"""
+    def __init__(self, source_lang, target_lang, rules=None):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        if rules is None:
+            rules = SEGMENT_SKIP_RULES_BY_PAIR.get((source_lang, target_lang), SEGMENT_SKIP_RULES)
+        self.rules = list(rules)
+        self.source_scripts = set(LANGUAGE_SCRIPTS.get(source_lang, []))
+        self.target_scripts = set(LANGUAGE_SCRIPTS.get(target_lang, []))
+        self.checks = {
+            'numeric': is_numeric_text,
+            'url': lambda text: bool(_URL_PATTERN.match(text)),
+            'email': lambda text: bool(_EMAIL_PATTERN.match(text)),
+            'part_number': lambda text: bool(_PART_NUMBER_PATTERN.match(text)),
+            'code': lambda text: any(pattern.match(text) for pattern in _CODE_PATTERNS),
+            'date': lambda text: any(pattern.match(text) for pattern in _DATE_PATTERNS),
+            'symbol': lambda text: not any(char.isalnum() for char in text),
+            'target_script': self._is_target_script,
+        }
+        unknown = [rule for rule in self.rules if rule not in self.checks]
+        if unknown:
+            logger.warning(f"알 수 없는 번역 제외 규칙 무시: {', '.join(unknown)}")
+            self.rules = [rule for rule in self.rules if rule in self.checks]
+
+    def _is_target_script(self, text):
+        """원본 언어의 문자 없이 대상 언어의 문자로만 쓰인 텍스트인지 확인 (같은 문자 체계 언어 쌍은 판별 불가)"""
+        if not self.target_scripts or self.target_scripts & self.source_scripts:
+            return False
+        scripts = text_scripts(text)
+        return bool(scripts) and scripts <= self.target_scripts
+
+    def classify(self, text):
+        """번역 제외 사유 반환 (번역해야 하면 None)"""
+        text = text.strip()
+        if not text:
+            return 'empty'
+        for rule in self.rules:
+            if self.checks[rule](text):
+                return rule
+        return None
+
+_classifiers = {}
+_classifiers_lock = threading.Lock()
+
+def get_classifier(source_lang, target_lang):
+    """언어 쌍별 분류기 반환 (한 번 만들면 재사용)"""
+    key = (source_lang, target_lang)
+    with _classifiers_lock:
+        if key not in _classifiers:
+            _classifiers[key] = SegmentClassifier(source_lang, target_lang)
+        return _classifiers[key]
@@ -0,0 +1,171 @@
+# services/token_budget.py
+import math
+import re
+
+from config import NUM_PREDICT_RATIO, NUM_PREDICT_RATIOS, NUM_PREDICT_MIN, NUM_PREDICT_STRICT_FACTOR
+from config import RUNAWAY_REPEAT_COUNT, RUNAWAY_SYMBOL_MIN_SPAN, NO_SPACE_LANGUAGES
+from utils.text_fitter import split_graphemes
+
+# 번역 뒤에 붙는 설명/주석 줄 (한 줄짜리 원문인데 이런 줄이 나오면 번역이 끝난 것으로 판단)
+_TRAILER_PATTERN = re.compile(
+    r"\n\s*(\(?\s*(note|notes|explanation|translation note|translator'?s note)\b|※|참고\s*[:：]|설명\s*[:：]|注\s*[:：]|注意\s*[:：]|说明\s*[:：])",
+    re.IGNORECASE
+)
+# 번역 앞에 붙는 안내 문구 줄 (예: "Here is the translation:")
+_PREAMBLE_PATTERN = re.compile(
+    r"^\s*(sure|okay|ok|certainly|here\s+(is|are|'s)|translation|translated text|번역|翻訳|翻译|以下)[^\n]{0,80}[:：]\s*\n",
+    re.IGNORECASE
+)
+
+def estimate_tokens(text):
+    """토큰 수 추정 (CJK/한글/태국 문자는 글자당 1개, 그 외는 4글자당 1개)"""
+    wide = sum(1 for char in text if ord(char) >= 0x0E00 and not char.isspace())
+    return wide + math.ceil((len(text) - wide) / 4)
+
+def num_predict_budget(text, source_lang, target_lang, strict=False):
+    """원문 길이와 언어 쌍의 확장 비율로 정한 최대 생성 토큰 수 (strict면 재시도용으로 더 작게)"""
+    ratio = NUM_PREDICT_RATIOS.get((source_lang, target_lang), NUM_PREDICT_RATIO)
+    if strict:
+        ratio *= NUM_PREDICT_STRICT_FACTOR
+    return max(NUM_PREDICT_MIN, math.ceil(estimate_tokens(text) * ratio))
+
+# 문장 끝 (마침표류 뒤 닫는 괄호/따옴표 포함, 숫자 안의 마침표 제외) 또는 줄바꿈
+_SENTENCE_END = re.compile(r"([。！？!?]+[」』）)\"']*|\.(?=\s|$)|[\n\v]+)\s*")
+_CLAUSE_END = re.compile(r"([、，,;；:：]+)\s*")
+
+def _split_at(pattern, text):
+    """구분 패턴 뒤에서 텍스트를 나눔 (구분 문자와 뒤따르는 공백은 앞 조각에 포함)"""
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        if match.end() > start:
+            pieces.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+def count_sentences(text):
+    """문장 수 (문장 끝 문자와 줄바꿈 기준)"""
+    return len(_split_at(_SENTENCE_END, text.strip()))
+
+_WORD_END = re.compile(r"\s+")
+
+def _is_wide(char):
+    """estimate_tokens에서 글자당 토큰 1개로 세는 문자"""
+    return ord(char) >= 0x0E00 and not char.isspace()
+
+def _split_clusters(text, budget):
+    """자소 클러스터 경계에서 추정 토큰 수가 한도 이내가 되도록 자름"""
+    pieces = []
+    current = ""
+    wide = narrow = 0
+    for cluster in split_graphemes(text):
+        cluster_wide = sum(_is_wide(char) for char in cluster)
+        cluster_narrow = len(cluster) - cluster_wide
+        if current and wide + cluster_wide + math.ceil((narrow + cluster_narrow) / 4) > budget:
+            pieces.append(current)
+            current = ""
+            wide = narrow = 0
+        current += cluster
+        wide += cluster_wide
+        narrow += cluster_narrow
+    pieces.append(current)
+    return pieces
+
+def _fit_pieces(text, budget):
+    """한도를 넘는 문장을 구절, 단어 순으로 나누고, 그래도 넘으면 글자(자소 클러스터) 경계에서 나눔"""
+    if estimate_tokens(text) <= budget:
+        return [text]
+    for pattern in (_CLAUSE_END, _WORD_END):
+        parts = _split_at(pattern, text)
+        if len(parts) > 1:
+            return [piece for part in parts for piece in _fit_pieces(part, budget)]
+    # 구분 문자가 없는 긴 단어(띄어쓰기 없는 CJK 문장, URL 등)
+    return _split_clusters(text, max(1, budget))
+
+def split_for_budget(text, budget):
+    """토큰 한도에 맞게 문장 경계에서 나눈 조각 목록 [(조각, 뒤따르는 구분 공백)] (한도 이내면 조각 1개)"""
+    if estimate_tokens(text) <= budget:
+        return [(text, "")]
+    
+    pieces = [piece for sentence in _split_at(_SENTENCE_END, text) for piece in _fit_pieces(sentence, budget)]
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and estimate_tokens(current + piece) > budget:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current:
+        chunks.append(current)
+    
+    result = []
+    for chunk in chunks:
+        content = chunk.rstrip()
+        if content:
+            result.append((content, chunk[len(content):]))
+        elif result:
+            result[-1] = (result[-1][0], result[-1][1] + chunk)
+    return result
+
+def join_chunks(parts, target_lang):
+    """번역된 조각을 원래 구분 문자로 다시 연결 (줄바꿈은 유지, 문장 사이 공백은 대상 언어의 띄어쓰기에 맞춤)"""
+    text = ""
+    for idx, (translated, separator) in enumerate(parts):
+        text += translated.strip()
+        if idx == len(parts) - 1:
+            break
+        if separator.strip(" \t\u3000"):
+            text += separator
+        else:
+            text += "" if target_lang in NO_SPACE_LANGUAGES else " "
+    return text
+
+def _longest_run(text, unit):
+    """text에서 unit이 연속으로 반복되는 최대 횟수"""
+    runs = re.findall(f"(?:{re.escape(unit)})+", text)
+    return max((len(run) // len(unit) for run in runs), default=0)
+
+def find_repetition(text, source_text="", min_repeats=RUNAWAY_REPEAT_COUNT, min_span=12, max_unit=50,
+                    symbol_min_span=RUNAWAY_SYMBOL_MIN_SPAN):
+    """끝부분에서 같은 조각이 연속 반복되기 시작한 위치 (첫 번째 조각 뒤, 반복이 없으면 -1)
+
+    원문에도 있는 반복(큰 숫자의 ",000", 목차의 "....")은 원문의 반복 횟수의 두 배를 넘을 때만,
+    원문에 없는 숫자/기호 조각은 symbol_min_span 글자 이상일 때만 폭주로 본다.
+    """
+    for unit in range(1, max_unit + 1):
+        repeats = max(min_repeats, math.ceil(min_span / unit))
+        span = unit * repeats
+        if span > len(text):
+            break
+        tail = text[-unit:]
+        if text[-span:] != tail * repeats:
+            continue
+        start = len(text) - span
+        while start >= unit and text[start - unit:start] == tail:
+            start -= unit
+        count = (len(text) - start) // unit
+        source_count = _longest_run(source_text, tail) if source_text else 0
+        if source_count and count <= 2 * source_count:
+            continue
+        if not source_count and not any(char.isalpha() for char in tail) and count * unit < symbol_min_span:
+            continue
+        return start + unit
+    return -1
+
+def find_trailer(text, source_text):
+    """한 줄짜리 원문의 번역 뒤에 붙은 설명이 시작되는 위치 (없으면 -1)"""
+    if "\n" in source_text.strip() or "\v" in source_text:
+        return -1
+    match = _TRAILER_PATTERN.search(text)
+    return match.start() if match else -1
+
+def strip_preamble(text, source_text):
+    """한 줄짜리 원문의 번역 앞에 붙은 안내 문구 제거 → (정리된 텍스트, 제거 여부)"""
+    if "\n" in source_text.strip() or "\v" in source_text:
+        return text, False
+    match = _PREAMBLE_PATTERN.match(text)
+    if match and text[match.end():].strip():
+        return text[match.end():], True
+    return text, False
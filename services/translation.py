@@ -1,32 +1,94 @@
 # services/translation.py
+import io
 import os
 import tempfile
 import time
 import logging
+import threading
 import traceback
-from paddleocr import PaddleOCR
+from collections import Counter
+import cv2
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from config import DEFAULT_OCR_BACKEND, OCR_WORKER_PROCESSES, LANGUAGE_CODES
+from config import GLOSSARY_PATH, GLOSSARY_MAX_PROMPT_TERMS, OLLAMA_RELEASE_AFTER_JOB, SEGMENT_TOKEN_BUDGET
+from config import OLLAMA_PRELOAD_JOIN_SECONDS
+from config import ROUTING_SMALL_MODEL, CONCURRENCY_ADAPTIVE, CONCURRENCY_MAX_PER_SERVER
+from services.ocr import get_ocr_backend, OCRScheduler, OCRWorkerPool
+from services.glossary import get_glossary
+from services.incremental import load_memory_from_manifest, load_memory_from_pair, apply_memory, write_manifest
+from services.segment_classifier import get_classifier
+from services.document_analyzer import get_element_part
+from services.run_report import RunReport
+from services.model_router import ModelRouter
+from services.coalescer import RequestCoalescer, normalize_segment
+from services.llm import TranslationError
+from services.resilience import RetryDispatcher, CircuitOpenError
+from services.concurrency import AIMDController
+from services.token_budget import estimate_tokens, split_for_budget, join_chunks
 from utils.image_utils import resize_image_if_needed, overlay_text_on_image, enhanced_overlay_text, map_language_to_paddle
-from utils.image_utils import is_numeric_text
+from utils.image_utils import extract_ocr_blocks
+from utils.render_pool import RenderPool
 from utils.paddle_ocr_utils import check_paddleocr
 
 logger = logging.getLogger(__name__)
 
+class TranslationCancelled(Exception):
+    """사용자가 번역을 중지함 (options의 cancel_event가 설정되면 다음 확인 지점에서 작업을 정리하고 중단)"""
+
 class TranslationService:
-    def __init__(self, ollama_service):
-        self.ollama_service = ollama_service
+    def __init__(self, backend, glossary_path=GLOSSARY_PATH):
+        self.backend = backend  # TranslationBackend (OllamaService, OllamaPool, OpenAICompatibleBackend)
+        self.glossary_path = glossary_path
+        self.report = RunReport()
+        self.coalescer = None
+        self.dispatcher = None
+        self.router = None
+        self.cancel_event = None
 
     def translate_ppt(self, ppt_path, source_lang, target_lang, text_model, 
                     progress_callback=None, status_callback=None, options=None):
         """파워포인트 파일 번역 실행"""
+        return self.translate_ppt_batch(
+            [ppt_path], source_lang, target_lang, text_model,
+            progress_callback, status_callback, options
+        )[0]
+    
+    def translate_ppt_batch(self, ppt_paths, source_lang, target_lang, text_model,
+                            progress_callback=None, status_callback=None, options=None):
+        """여러 파워포인트 파일 번역 실행 (이미지 OCR은 모든 문서의 이미지를 모아 한 번에 처리)"""
+        results = self._translate_decks(
+            ppt_paths, source_lang, [target_lang], text_model,
+            progress_callback, status_callback, options
+        )
+        return [outputs[target_lang] for outputs in results]
+    
+    def translate_ppt_multi(self, ppt_path, source_lang, target_langs, text_model,
+                            progress_callback=None, status_callback=None, options=None):
+        """파워포인트 파일을 여러 언어로 번역 (분석, OCR, 텍스트 제거는 한 번만 수행) → {언어: 출력 경로}"""
+        return self._translate_decks(
+            [ppt_path], source_lang, target_langs, text_model,
+            progress_callback, status_callback, options
+        )[0]
+    
+    def _translate_decks(self, ppt_paths, source_lang, target_langs, text_model,
+                         progress_callback=None, status_callback=None, options=None):
+        """문서들을 대상 언어별로 번역하고 문서마다 {언어: 출력 경로} 반환"""
         if options is None:
             options = {}
         
         debug_mode = options.get('debug_mode', False)
+        target_langs = list(dict.fromkeys(target_langs))
+        multi_target = len(target_langs) > 1
+        self.report = RunReport()
+        # 중지 요청 (threading/multiprocessing Event, 요소/이미지/OCR 배치마다 확인)
+        self.cancel_event = options.get('cancel_event')
+        # 짧은 문장은 작은 모델로 보내는 모델 선택 (작은 모델을 설정하지 않으면 모두 text_model)
+        self.router = ModelRouter(text_model, options.get('small_model', ROUTING_SMALL_MODEL))
         
         # 임시 파일 추적 리스트
         temp_files = []
+        preload = None
         
         if debug_mode:
             original_level = logger.level
@@ -34,72 +96,141 @@ class TranslationService:
             logger.info("디버그 모드 활성화됨")
         
         try:
-            logger.info(f"번역 프로세스 시작: {ppt_path}")
+            logger.info(f"번역 프로세스 시작: {', '.join(ppt_paths)} → {', '.join(target_langs)}")
             
             if status_callback:
                 status_callback("번역 프로세스 시작")
             
-            logger.info(f"사용할 모델: {text_model}")
+            logger.info(f"사용할 모델: {', '.join(self.router.models())}")
             if status_callback:
                 status_callback(f"번역 준비 중: {text_model}")
             
-            # 파워포인트 파일 열기
-            ppt = Presentation(ppt_path)
+            # 문서 분석/OCR 동안 모델을 미리 로드 (첫 번역 요청이 모델 로드를 기다리지 않도록)
+            self.backend.reset_timings()
+            preload_stop = threading.Event()
+            preload = threading.Thread(target=self._preload_models, args=(self.router.models(), preload_stop),
+                                       daemon=True)
+            preload.start()
             
             # 임시 폴더 생성
             with tempfile.TemporaryDirectory() as temp_dir:
                 logger.info(f"임시 폴더 생성: {temp_dir}")
                 
-                # 문서 분석
+                # 문서 분석은 한 번만 하고, 대상 언어마다 별도의 Presentation을 준비
                 from services.document_analyzer import DocumentAnalyzer
                 analyzer = DocumentAnalyzer()
-                result = analyzer.analyze_ppt(ppt_path)
+                decks = []
+                for ppt_path in ppt_paths:
+                    with open(ppt_path, "rb") as f:
+                        ppt_bytes = f.read()
+                    ppts = {lang: Presentation(io.BytesIO(ppt_bytes)) for lang in target_langs}
+                    result = analyzer.analyze_ppt(ppt_path, ppts[target_langs[0]])
+                    decks.append({
+                        'path': ppt_path,
+                        'ppts': ppts,
+                        'text_elements': result['text_elements'],
+                        'image_elements': result['image_elements']
+                    })
                 
-                text_elements = result['text_elements']
-                image_elements = result['image_elements']
-                total_elements = result['total_elements']
+                # 증분 번역: 이전 번역 결과에서 바뀌지 않은 텍스트/이미지 재사용
+                if options.get('incremental') or options.get('previous_translated'):
+                    self._apply_previous_translations(decks, source_lang, target_langs, text_model, options)
+                
+                total_elements = len(target_langs) * sum(
+                    len(deck['text_elements']) + len(deck['image_elements']) for deck in decks
+                )
                 
                 # 번역 작업 시작
                 processed_items = 0
                 
-                # 1. 텍스트 요소 번역
-                if status_callback:
-                    status_callback("텍스트 요소 번역 중...")
-                logger.info("텍스트 요소 번역 시작")
+                # 중복을 제외한 고유 문장을 먼저 병렬로 요청 (같은 문장은 한 번만 번역해 모든 위치에 사용)
+                # 실패한 요청은 재시도 대기열에서 다시 실행되고, 서버 장애가 이어지면 요청을 일시 중지
+                # 자동 조절이면 병렬 요청 수를 서버당 최대값 × 서버 수 안에서 처리량과 응답 시간에 따라 조절하고,
+                # 아니면 백엔드의 고정 동시 요청 수 사용
+                max_concurrency = self.backend.max_concurrency
+                controller = None
+                if options.get('adaptive_concurrency', CONCURRENCY_ADAPTIVE):
+                    per_server = options.get('max_concurrency_per_server', CONCURRENCY_MAX_PER_SERVER)
+                    max_concurrency = max(max_concurrency, per_server * self.backend.server_count)
+                    controller = AIMDController(
+                        max_concurrency, token_counter=lambda: self.backend.get_timings()['eval_count']
+                    )
+                self.dispatcher = RetryDispatcher(max_workers=max_concurrency, retry_on=(TranslationError,),
+                                                  controller=controller, request_tokens=self._request_tokens)
+                self.coalescer = RequestCoalescer(executor=self.dispatcher)
+                self._prefetch_text_translations(decks, source_lang, target_langs, text_model)
                 
-                self._translate_text_elements(
-                    ppt, text_elements, source_lang, target_lang, text_model, 
-                    progress_callback, processed_items, total_elements
-                )
-                processed_items += len(text_elements)
+                # 1. 텍스트 요소 번역 (대상 언어별)
+                for target_lang in target_langs:
+                    if status_callback:
+                        status_callback(f"텍스트 요소 번역 중... ({target_lang})" if multi_target
+                                        else "텍스트 요소 번역 중...")
+                    logger.info(f"텍스트 요소 번역 시작: {target_lang}")
+                    
+                    for deck in decks:
+                        self._translate_text_elements(
+                            deck['ppts'][target_lang], deck['text_elements'], source_lang, target_lang, text_model,
+                            progress_callback, processed_items, total_elements
+                        )
+                        processed_items += len(deck['text_elements'])
                 
-                # 2. 이미지 요소 번역
+                dedup = self.coalescer.stats()
+                if dedup['duplicates']:
+                    self.report.record_saved('duplicate', dedup['duplicates'])
+                logger.info(f"중복 문장 병합: 요청 {dedup['requests']}개 → 번역 {dedup['unique']}개 "
+                            f"(중복 {dedup['ratio']:.1%})")
+                
+                # 2. 이미지 요소 번역 (모든 문서의 이미지를 한 번에 OCR, 언어별로 텍스트만 다시 그림)
                 if status_callback:
                     status_callback("이미지 요소 번역 중...")
                 logger.info("이미지 요소 번역 시작")
                 
+                image_items = [(deck_idx, deck['ppts'], image_element)
+                               for deck_idx, deck in enumerate(decks)
+                               for image_element in deck['image_elements']]
+                
                 # 이미지 번역 로직에 temp_files 리스트 전달
                 self._translate_image_elements(
-                    ppt, image_elements, temp_dir, source_lang, target_lang, 
-                    text_model, progress_callback, processed_items, total_elements, 
+                    image_items, temp_dir, source_lang, target_langs,
+                    text_model, progress_callback, processed_items, total_elements,
                     options, temp_files
                 )
                 
-                # 번역된 파일 저장
-                output_path = os.path.splitext(ppt_path)[0] + "_translated.pptx"
-                logger.info(f"번역된 파일 저장: {output_path}")
-                ppt.save(output_path)
+                # 번역된 파일 저장 (여러 언어면 파일 이름에 언어 코드 추가)
+                results = []
+                for deck in decks:
+                    outputs = {}
+                    for target_lang in target_langs:
+                        output_path = self._output_path(deck['path'], target_lang if multi_target else None)
+                        logger.info(f"번역된 파일 저장: {output_path}")
+                        deck['ppts'][target_lang].save(output_path)
+                        outputs[target_lang] = output_path
+                        write_manifest(output_path, deck['path'], source_lang, target_lang, text_model,
+                                       deck['text_elements'], deck['image_elements'])
+                    results.append(outputs)
                 
                 # 파일 저장 후 임시 이미지 파일 삭제
                 logger.info(f"번역 완료 - 임시 파일 {len(temp_files)}개 정리 시작")
                 self._cleanup_temp_files(temp_files)
+                temp_files.clear()
+                
+                # LLM 호출/생략 통계와 모델 로드/생성 시간, 동시 요청 수 조절 결과
+                self.report.record_timings(self.backend.get_timings())
+                if self.dispatcher.controller is not None:
+                    self.report.record_concurrency(self.dispatcher.controller.stats())
+                self.report.log_summary()
+                self.router.log_summary()
                 
+                output_paths = [path for outputs in results for path in outputs.values()]
                 if status_callback:
-                    status_callback(f"번역 완료! 파일 저장됨: {output_path}")
+                    status_callback(f"번역 완료! 파일 저장됨: {', '.join(output_paths)}")
                 
                 logger.info(f"번역 완료")
-                return output_path
-            
+                return results
+        
+        except TranslationCancelled:
+            logger.info("사용자에 의해 번역 중지됨")
+            raise
         except Exception as e:
             logger.exception(f"번역 프로세스 오류: {str(e)}")
             if status_callback:
@@ -110,17 +241,89 @@ class TranslationService:
             if 'temp_files' in locals() and temp_files:
                 logger.info(f"오류 발생 - 임시 파일 정리 시도")
                 self._cleanup_temp_files(temp_files)
-                
+            
+            if self.coalescer is not None:
+                self.coalescer.close(cancel=True)
+                self.coalescer = None
+                self.dispatcher = None
+            
+            # 작업(배치)이 끝나면 모델 언로드
+            if preload is not None:
+                # 중지/오류로 일찍 끝나면 콜드 로드를 끝까지 기다리지 않고 언로드 (남은 모델 로드는 건너뜀)
+                preload_stop.set()
+                preload.join(timeout=OLLAMA_PRELOAD_JOIN_SECONDS)
+                if preload.is_alive():
+                    logger.info("모델 미리 로드가 끝나지 않아 기다리지 않고 언로드 요청")
+                if options.get('release_model', OLLAMA_RELEASE_AFTER_JOB):
+                    for model in self.router.models():
+                        self.backend.release_model(model)
+            
             if debug_mode:
                 logger.setLevel(original_level)
                 logger.info("디버그 모드 비활성화됨")
     
+    def _preload_models(self, models, stop_event):
+        """작업에서 쓸 모델을 차례로 미리 로드 (백그라운드 스레드에서 실행, stop_event가 설정되면 남은 모델은 건너뜀)"""
+        for model in models:
+            if stop_event.is_set():
+                break
+            self.backend.preload_model(model)
+    
+    def _apply_previous_translations(self, decks, source_lang, target_langs, text_model, options):
+        """증분 번역: 이전 번역(매니페스트 또는 원본/번역 파일 쌍)에서 재사용할 번역을 요소에 연결
+        
+        previous_translated(경로 또는 {언어: 경로})가 없으면 이번 실행의 출력 경로에 있는 이전 결과를 사용하고,
+        previous_source가 있으면 매니페스트 대신 이전 원본/번역 파일을 위치별로 대응시킨다.
+        """
+        previous_source = options.get('previous_source')
+        previous_translated = options.get('previous_translated')
+        explicit = len(decks) == 1
+        if not explicit and (previous_source or previous_translated):
+            logger.warning("여러 문서 번역에서는 이전 파일 지정이 무시되고 매니페스트만 사용됩니다.")
+        
+        for deck in decks:
+            for target_lang in target_langs:
+                translated_path = None
+                if explicit and isinstance(previous_translated, dict):
+                    translated_path = previous_translated.get(target_lang)
+                elif explicit and previous_translated:
+                    translated_path = previous_translated
+                if not translated_path:
+                    translated_path = self._output_path(deck['path'], target_lang if len(target_langs) > 1 else None)
+                if not os.path.exists(translated_path):
+                    logger.info(f"이전 번역 파일 없음, 전체 번역: {translated_path}")
+                    continue
+                
+                try:
+                    if explicit and previous_source:
+                        memory = load_memory_from_pair(previous_source, translated_path)
+                    else:
+                        memory = load_memory_from_manifest(translated_path, source_lang, target_lang, text_model)
+                    if memory:
+                        apply_memory(memory, deck['text_elements'], deck['image_elements'], target_lang)
+                except Exception as e:
+                    logger.warning(f"이전 번역 불러오기 실패 ({translated_path}): {e}")
+                    logger.debug(traceback.format_exc())
+    
+    def _output_path(self, ppt_path, target_lang=None):
+        """번역 결과 파일 경로 (대상 언어를 지정하면 언어 코드 추가)"""
+        base = os.path.splitext(ppt_path)[0]
+        if target_lang is None:
+            return base + "_translated.pptx"
+        return f"{base}_translated_{LANGUAGE_CODES.get(target_lang, target_lang)}.pptx"
+    
+    def _check_cancelled(self):
+        """중지 요청이 있으면 TranslationCancelled 발생"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise TranslationCancelled("사용자에 의한 번역 중지")
+    
     def _translate_text_elements(self, ppt, text_elements, source_lang, target_lang, text_model, 
                                progress_callback=None, processed_items=0, total_elements=0):
         """텍스트 요소 번역 처리"""
         for idx, text_element in enumerate(text_elements):
-            slide_idx = text_element['slide_idx']
-            slide = ppt.slides[slide_idx]
+            self._check_cancelled()
+            # 슬라이드 요소 외에 마스터/레이아웃 요소도 같은 방식으로 처리
+            slide = get_element_part(ppt, text_element)
             
             try:
                 # 텍스트 요소 타입에 따라 처리
@@ -142,18 +345,144 @@ class TranslationService:
                 current = processed_items + idx + 1
                 progress_callback(current, total_elements)
     
+    def _translate_segment(self, text_element, text, source_lang, target_lang, text_model):
+        """텍스트 번역 (증분 번역의 이전 번역이나 상위 레이아웃/마스터의 번역이 있으면 LLM 호출 생략)"""
+        cached = text_element.get('cached_translations', {}).get(target_lang)
+        inherited = text_element.get('inherits', {}).get('translations', {}).get(target_lang)
+        glossary = get_glossary(source_lang, target_lang, self.glossary_path)
+        exact = glossary.exact(text) if glossary else None
+        if cached is not None:
+            logger.debug(f"이전 번역 재사용: '{text_element['text']}'")
+            translated_text = cached
+            self.report.record_saved('incremental')
+        elif inherited is not None:
+            logger.debug(f"레이아웃/마스터 번역 재사용: '{text_element['text']}'")
+            translated_text = inherited
+            self.report.record_saved('inherited')
+        elif exact is not None:
+            # 용어집 항목과 정확히 일치하는 문장은 LLM 호출 없이 용어집 번역 사용
+            logger.debug(f"용어집 일치: '{text.strip()}' → '{exact}'")
+            translated_text = exact
+            self.report.record_saved('glossary')
+        else:
+            parts = []
+            failed = False
+            for chunk, future, separator in self._request_translation(text, source_lang, target_lang, text_model):
+                try:
+                    parts.append((future.result(), separator))
+                except (TranslationError, CircuitOpenError) as e:
+                    # 재시도 후에도 실패한 조각은 원문 유지
+                    logger.warning(f"번역 실패, 원문 유지 ({self._element_location(text_element)}): {e}")
+                    self.report.record_fallback('text', self._element_location(text_element), chunk, e)
+                    parts.append((chunk, separator))
+                    failed = True
+            translated_text = join_chunks(parts, target_lang)
+            if failed:
+                # 매니페스트에 남기지 않아 다음 증분 번역에서 다시 요청
+                return translated_text
+        
+        # 매니페스트 기록용으로 언어별 번역 결과 보관
+        text_element.setdefault('translations', {})[target_lang] = translated_text
+        return translated_text
+    
+    def _prefetch_text_translations(self, decks, source_lang, target_langs, text_model):
+        """LLM 번역이 필요한 모든 텍스트 요소의 번역을 미리 요청 (같은 문장은 한 번만)"""
+        for target_lang in target_langs:
+            classifier = get_classifier(source_lang, target_lang)
+            glossary = get_glossary(source_lang, target_lang, self.glossary_path)
+            for deck in decks:
+                for text_element in deck['text_elements']:
+                    text = text_element['text']
+                    if (classifier.classify(text) or 'inherits' in text_element
+                            or target_lang in text_element.get('cached_translations', {})
+                            or (glossary and glossary.exact(text) is not None)):
+                        continue
+                    self._request_translation(text, source_lang, target_lang, text_model, prefetch=True)
+    
+    def _request_translation(self, text, source_lang, target_lang, text_model, prefetch=False):
+        """정규화한 문장 단위로 번역 요청을 합쳐 [(조각, Future, 구분 문자)] 반환 (이미 요청된 문장이면 같은 Future)
+        
+        토큰 한도를 넘는 긴 텍스트는 문장 경계에서 나눈 조각마다 요청해 병렬로 번역한다.
+        번역 모델은 나누기 전 문장 전체의 길이로 정해 한 문장의 조각은 모두 같은 모델로 번역한다.
+        """
+        if self.coalescer is None:
+            self.coalescer = RequestCoalescer()
+        segment = normalize_segment(text)
+        model = self._route_model(segment, source_lang, target_lang, text_model, count=not prefetch)
+        chunks = split_for_budget(segment, SEGMENT_TOKEN_BUDGET)
+        if len(chunks) > 1 and prefetch:
+            logger.info(f"긴 텍스트 분할: 약 {estimate_tokens(segment)}토큰 → {len(chunks)}개 조각")
+        submit = self.coalescer.prefetch if prefetch else self.coalescer.submit
+        return [(chunk, submit((chunk, source_lang, target_lang, model),
+                               self._call_translate_text, chunk, source_lang, target_lang, model), separator)
+                for chunk, separator in chunks]
+    
+    def _route_model(self, text, source_lang, target_lang, text_model, count=True):
+        """문장을 번역할 모델 (작업 밖에서 호출되거나 모델 선택을 쓰지 않으면 text_model)"""
+        if self.router is None or self.router.model != text_model or not self.router.enabled:
+            return text_model
+        glossary = get_glossary(source_lang, target_lang, self.glossary_path)
+        terms = len(glossary.match(text)) if glossary else 0
+        model, reason = self.router.route(text, terms, count)
+        logger.debug(f"모델 선택 ({reason}): {model} ← '{text[:30]}'")
+        return model
+    
+    def _call_translate_text(self, text, source_lang, target_lang, text_model):
+        """번역 백엔드 텍스트 번역 호출 (번역 스레드에서 실행, 문장에 포함된 용어집 용어를 프롬프트에 추가)
+        
+        실패하면 원문 대신 TranslationError를 발생시켜 재시도 대기열로 보낸다.
+        """
+        glossary = get_glossary(source_lang, target_lang, self.glossary_path)
+        self.report.record_call('text')
+        start = time.perf_counter()
+        translated = self.backend.translate_text(
+            text, source_lang, target_lang, text_model,
+            glossary_terms=glossary.match(text) if glossary else None, raise_on_error=True
+        )
+        self.report.record_model(text_model, time.perf_counter() - start, estimate_tokens(text))
+        return translated
+    
+    @staticmethod
+    def _request_tokens(args, kwargs):
+        """번역 요청 원문(문장 또는 {영역 ID: 문장})의 추정 토큰 수"""
+        source = args[0] if args else None
+        if isinstance(source, dict):
+            return sum(estimate_tokens(text) for text in source.values() if text)
+        if isinstance(source, str):
+            return estimate_tokens(source)
+        return 1
+    
+    def _call_with_retry(self, func, *args, **kwargs):
+        """재시도 대기열을 거쳐 요청 실행 (작업 밖에서 호출되면 바로 실행)"""
+        if self.dispatcher is None:
+            return func(*args, **kwargs)
+        return self.dispatcher.call(func, *args, **kwargs)
+    
+    def _element_location(self, element):
+        """실행 보고서에 남기는 요소 위치 (슬라이드 번호 또는 레이아웃/마스터 경로)"""
+        if element.get('part', 'slide') != 'slide':
+            return f"{element['part']} {element.get('slide_id')}"
+        return f"슬라이드 {element['slide_idx'] + 1}"
+    
+    def _skip_reason(self, text, source_lang, target_lang):
+        """번역이 필요 없는 텍스트(숫자, URL, 코드, 이미 대상 언어인 문장 등)면 제외 사유 반환"""
+        reason = get_classifier(source_lang, target_lang).classify(text)
+        if reason:
+            logger.info(f"번역 제외 ({reason}), 원문 유지: '{text.strip()}'")
+            self.report.record_saved(reason)
+        return reason
+    
     def _translate_paragraph(self, slide, text_element, source_lang, target_lang, text_model):
         """문단 번역 처리"""
         shape = slide.shapes[text_element['shape_idx']]
         paragraph = shape.text_frame.paragraphs[text_element['para_idx']]
         
         if paragraph.text.strip() == text_element['text']:
-            if is_numeric_text(paragraph.text):
-                logger.info(f"숫자 텍스트 감지됨, 번역 건너뜀: '{paragraph.text}'")
+            if self._skip_reason(paragraph.text, source_lang, target_lang):
                 text_element['translated'] = True
             else:
-                translated_text = self.ollama_service.translate_text(
-                    paragraph.text, source_lang, target_lang, text_model
+                translated_text = self._translate_segment(
+                    text_element, paragraph.text, source_lang, target_lang, text_model
                 )
                 
                 # 서식 유지를 위한 처리
@@ -178,12 +507,11 @@ class TranslationService:
             cell = table.rows[text_element['row_idx']].cells[text_element['col_idx']]
             
             if cell.text.strip() == text_element['text']:
-                if is_numeric_text(cell.text):
-                    logger.info(f"숫자 텍스트 감지됨, 번역 건너뜀: '{cell.text}'")
+                if self._skip_reason(cell.text, source_lang, target_lang):
                     text_element['translated'] = True
                 else:
-                    translated_text = self.ollama_service.translate_text(
-                        cell.text, source_lang, target_lang, text_model
+                    translated_text = self._translate_segment(
+                        text_element, cell.text, source_lang, target_lang, text_model
                     )
                     
                     # 서식 유지를 위한 처리
@@ -213,130 +541,288 @@ class TranslationService:
         for paragraph in shape.text_frame.paragraphs:
             for run in paragraph.runs:
                 if run.text.strip() == text_element['text']:
-                    if is_numeric_text(run.text):
-                        logger.info(f"숫자 텍스트 감지됨, 번역 건너뜀: '{run.text}'")
+                    if self._skip_reason(run.text, source_lang, target_lang):
                         text_element['translated'] = True
                     else:
-                        translated_text = self.ollama_service.translate_text(
-                            run.text, source_lang, target_lang, text_model
+                        translated_text = self._translate_segment(
+                            text_element, run.text, source_lang, target_lang, text_model
                         )
                         run.text = translated_text
                         text_element['translated'] = True
                     break
     
-    def _translate_image_elements(self, ppt, image_elements, temp_dir, source_lang, target_lang,
+    def _translate_image_elements(self, image_items, temp_dir, source_lang, target_langs,
                                 text_model, progress_callback=None, processed_items=0, total_elements=0,
                                 options=None, temp_files=None):
-        """이미지 요소 번역 처리 (PaddleOCR 전용)"""
+        """이미지 요소 번역 처리 (이미지 준비 → 전체 이미지 OCR → 언어별 번역 → 병렬 렌더링 순서로 진행)
+        
+        image_items는 (문서 번호, {언어: Presentation}, 이미지 요소) 목록이다.
+        OCR과 텍스트 제거(인페인팅)는 이미지당 한 번만 하고 언어별로 번역과 텍스트 삽입만 반복한다.
+        """
         if options is None:
             options = {}
-            
+        
         if temp_files is None:
             temp_files = []
-            
-        debug_mode = options.get('debug_mode', False)
+        
+        if not image_items:
+            return
+        
         source_lang_for_ocr = options.get('source_lang', source_lang)
         
-        for idx, image_element in enumerate(image_elements):
-            slide_idx = image_element['slide_idx']
-            slide = ppt.slides[slide_idx]
+        # 작업별 OCR 백엔드 선택 (엔진은 작업 동안 한 번만 초기화)
+        backend_name = options.get('ocr_backend', DEFAULT_OCR_BACKEND)
+        ocr_backend = get_ocr_backend(backend_name, source_lang_for_ocr)
+        
+        completed = 0
+        
+        def report_progress():
+            if progress_callback:
+                progress_callback(processed_items + completed, total_elements)
+        
+        # 1단계: 모든 이미지 추출 및 전처리
+        jobs = []
+        for deck_idx, ppts, image_element in image_items:
+            self._check_cancelled()
+            # 증분 번역: 이전 결과를 재사용할 수 있는 언어는 OCR 없이 바로 교체
+            cached_images = image_element.get('cached_images', {})
+            pending_langs = [lang for lang in target_langs if lang not in cached_images]
+            for target_lang in target_langs:
+                if target_lang in cached_images:
+                    self._reuse_picture(ppts, image_element, target_lang, cached_images[target_lang])
             
-            try:
-                logger.info(f"이미지 번역 (슬라이드 {slide_idx+1}, 요소 {image_element['shape_idx']})")
-                
-                shape = slide.shapes[image_element['shape_idx']]
-                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    # 이미지 추출 및 임시 저장
-                    image = shape.image
-                    image_bytes = image.blob
-                    
-                    # 이미지 크기 확인 (너무 큰 이미지 건너뛰기)
-                    if len(image_bytes) > 5*1024*1024:  # 5MB 제한
-                        logger.warning(f"이미지 크기가 너무 큽니다 ({len(image_bytes)} 바이트). 건너뜁니다.")
-                        continue
-                    
-                    # 임시 이미지 파일 저장
-                    timestamp = int(time.time() * 1000)
-                    temp_image_path = os.path.join(temp_dir, f"slide_{slide_idx}_image_{image_element['shape_idx']}_{timestamp}.png")
-                    with open(temp_image_path, "wb") as f:
-                        f.write(image_bytes)
-                    
-                    # 임시 파일 추적 목록에 추가
-                    temp_files.append(temp_image_path)
-                    logger.info(f"이미지 저장: {temp_image_path} ({len(image_bytes)} 바이트)")
-                    
-                    # 이미지 처리: 리사이징
-                    resized_image_path = resize_image_if_needed(temp_image_path)
-                    if resized_image_path != temp_image_path:
-                        temp_files.append(resized_image_path)
-                        temp_image_path = resized_image_path
-                    
-                    try:
-                        # PaddleOCR 사용
-                        ocr = PaddleOCR(use_angle_cls=True, lang=map_language_to_paddle(source_lang_for_ocr))
-                        result = ocr.ocr(temp_image_path, cls=True)
-                        
-                        if not result or len(result[0]) == 0:
-                            logger.warning("PaddleOCR: 텍스트를 감지하지 못했습니다.")
-                            continue
-                        
-                        # 추출된 텍스트 결합
-                        extracted_text = '\n'.join([line[1][0] for line in result[0] if line[1][1] > 0.6])
-                        
-                        if not extracted_text or not extracted_text.strip():
-                            logger.warning("PaddleOCR: 유효한 텍스트가 없습니다.")
-                            continue
-                            
-                        logger.info(f"PaddleOCR 추출된 텍스트: '{extracted_text[:100]}'")
-                        
-                        # 텍스트 번역
-                        translated_text = self.ollama_service.translate_text(
-                            extracted_text, source_lang, target_lang, text_model
-                        )
-                        
-                        logger.info(f"번역된 텍스트: '{translated_text[:100]}'")
-                        
-                        if translated_text and translated_text != extracted_text:
-                            # 번역된 텍스트로 이미지 오버레이
-                            translated_image_path = overlay_text_on_image(
-                                temp_image_path, 
-                                translated_text,
-                                source_lang
-                            )
-                            
-                            # 번역된 이미지 파일 추적
-                            if translated_image_path != temp_image_path:
-                                temp_files.append(translated_image_path)
-                            
-                            # 번역된 이미지로 교체
-                            if os.path.exists(translated_image_path) and translated_image_path != temp_image_path:
-                                left, top, width, height = shape.left, shape.top, shape.width, shape.height
-                                try:
-                                    # 기존 이미지 대신 새 이미지 추가
-                                    pic = slide.shapes.add_picture(translated_image_path, left, top, width, height)
-                                    # 위치와 크기 조정
-                                    pic.left, pic.top, pic.width, pic.height = left, top, width, height
-                                    
-                                    image_element['translated'] = True
-                                    logger.info("이미지 교체 완료")
-                                except Exception as e:
-                                    logger.error(f"이미지 교체 오류: {e}")
-                        else:
-                            logger.warning("텍스트가 번역되지 않았거나 원본과 동일합니다.")
+            job = None
+            if pending_langs:
+                job = self._prepare_image_job(deck_idx, ppts, image_element, temp_dir, temp_files)
+            if job is not None:
+                job['target_langs'] = pending_langs
+                jobs.append(job)
+            else:
+                completed += len(target_langs)
+                report_progress()
+        
+        # 2단계: 모든 이미지의 텍스트 조각을 모아 배치 OCR
+        # (워커 프로세스를 쓰면 메모리가 커진 워커는 교체되며 실행)
+        ocr_workers = options.get('ocr_workers', OCR_WORKER_PROCESSES)
+        if ocr_workers > 0:
+            with OCRWorkerPool(ocr_backend, size=ocr_workers) as worker_pool:
+                ocr_results = worker_pool.run({job_idx: job['image'] for job_idx, job in enumerate(jobs)},
+                                              check_cancelled=self._check_cancelled)
+        else:
+            scheduler = OCRScheduler(ocr_backend)
+            for job_idx, job in enumerate(jobs):
+                scheduler.add(job_idx, job['image'])
+            ocr_results = scheduler.run(check_cancelled=self._check_cancelled)
+        
+        # 3단계: 이미지별 영역을 언어마다 번역 (렌더링은 프로세스 풀에서 병렬로 진행)
+        rendered = []
+        with RenderPool() as render_pool:
+            for job_idx, job in enumerate(jobs):
+                self._check_cancelled()
+                try:
+                    regions = self._extract_image_regions(
+                        ocr_results.get(job_idx, []), ocr_backend.name, source_lang_for_ocr
+                    )
+                    variants = {}
+                    for target_lang in (job['target_langs'] if regions else []):
+                        translated = self._translate_image_regions(regions, source_lang, target_lang, text_model,
+                                                                   self._element_location(job['element']) + " 이미지")
+                        if translated:
+                            variants[target_lang] = translated
                     
-                    except Exception as e:
-                        logger.error(f"이미지 OCR 처리 오류: {e}")
-                        logger.debug(traceback.format_exc())
+                    # 매니페스트용 처리 기록 (교체하지 않은 이미지는 None)
+                    outputs = job['element'].setdefault('outputs', {})
+                    for target_lang in job['target_langs']:
+                        outputs.setdefault(target_lang, None)
+                    if variants:
+                        rendered.append((job, render_pool.submit(job['image'], variants)))
+                except Exception as e:
+                    logger.error(f"이미지 번역 오류 (요소 {job_idx+1}/{len(jobs)}): {str(e)}")
+                    logger.debug(traceback.format_exc())
+                job['image'] = None
+                
+                # 진행 상황 업데이트
+                completed += len(target_langs)
+                report_progress()
             
-            except Exception as e:
-                logger.error(f"이미지 번역 오류 (요소 {idx+1}/{len(image_elements)}): {str(e)}")
-                logger.debug(traceback.format_exc())
+            # 4단계: 렌더링된 이미지로 교체 (슬라이드 수정은 현재 스레드에서만)
+            for job, future in rendered:
+                self._check_cancelled()
+                try:
+                    for target_lang, image_bytes in future.result().items():
+                        self._replace_picture(job, target_lang, image_bytes)
+                except Exception as e:
+                    logger.error(f"이미지 렌더링 오류 ({job['path']}): {e}")
+                    logger.debug(traceback.format_exc())
+    
+    def _prepare_image_job(self, deck_idx, ppts, image_element, temp_dir, temp_files):
+        """이미지 요소를 임시 파일로 추출하고 OCR 입력 이미지로 로드 (처리 대상이 아니면 None)"""
+        slide_idx = image_element['slide_idx']
+        shape_idx = image_element['shape_idx']
+        # 원본 이미지는 모든 언어의 Presentation에서 같으므로 첫 번째에서 추출
+        slide = next(iter(ppts.values())).slides[slide_idx]
+        
+        try:
+            logger.info(f"이미지 준비 (슬라이드 {slide_idx+1}, 요소 {shape_idx})")
             
-            # 진행 상황 업데이트
-            if progress_callback:
-                current = processed_items + idx + 1
-                progress_callback(current, total_elements)
-
+            shape = slide.shapes[shape_idx]
+            if shape.shape_type != MSO_SHAPE_TYPE.PICTURE:
+                return None
+            
+            # 이미지 추출 및 임시 저장
+            image_bytes = shape.image.blob
+            
+            # 이미지 크기 확인 (너무 큰 이미지 건너뛰기)
+            if len(image_bytes) > 5*1024*1024:  # 5MB 제한
+                logger.warning(f"이미지 크기가 너무 큽니다 ({len(image_bytes)} 바이트). 건너뜁니다.")
+                return None
+            
+            # 임시 이미지 파일 저장
+            timestamp = int(time.time() * 1000)
+            temp_image_path = os.path.join(
+                temp_dir, f"deck_{deck_idx}_slide_{slide_idx}_image_{shape_idx}_{timestamp}.png"
+            )
+            with open(temp_image_path, "wb") as f:
+                f.write(image_bytes)
+            
+            # 임시 파일 추적 목록에 추가
+            temp_files.append(temp_image_path)
+            logger.info(f"이미지 저장: {temp_image_path} ({len(image_bytes)} 바이트)")
+            
+            # 이미지 처리: 리사이징
+            resized_image_path = resize_image_if_needed(temp_image_path)
+            if resized_image_path != temp_image_path:
+                temp_files.append(resized_image_path)
+                temp_image_path = resized_image_path
+            
+            image = cv2.imread(temp_image_path)
+            if image is None:
+                logger.warning(f"이미지 로드 실패: {temp_image_path}")
+                return None
+            
+            return {
+                'ppts': ppts,
+                'slide_idx': slide_idx,
+                'shape_idx': shape_idx,
+                'element': image_element,
+                'path': temp_image_path,
+                'image': image
+            }
+        
+        except Exception as e:
+            logger.error(f"이미지 준비 오류 (슬라이드 {slide_idx+1}): {str(e)}")
+            logger.debug(traceback.format_exc())
+            return None
+    
+    def _extract_image_regions(self, ocr_lines, ocr_name, source_lang_for_ocr):
+        """OCR 결과를 번역 단위 블록으로 병합 (영역이 없으면 None)"""
+        if not ocr_lines:
+            logger.warning(f"{ocr_name}: 텍스트를 감지하지 못했습니다.")
+            return None
+        
+        # OCR 조각을 줄/블록 단위로 병합 (블록이 번역 및 렌더링 단위)
+        regions = extract_ocr_blocks(ocr_lines, source_lang_for_ocr)
+        
+        if not regions:
+            logger.warning(f"{ocr_name}: 유효한 텍스트가 없습니다.")
+            return None
+        
+        logger.info(f"{ocr_name} 추출된 블록: {len(regions)}개")
+        return regions
+    
+    def _translate_image_regions(self, regions, source_lang, target_lang, text_model, location="이미지"):
+        """블록을 대상 언어로 번역한 영역 목록 반환 (바뀐 영역이 없으면 None)"""
+        # 번역 제외 영역은 원문 유지, 용어집과 정확히 일치하는 영역은 바로 번역하고
+        # 나머지에서 찾은 용어는 프롬프트에 포함
+        classifier = get_classifier(source_lang, target_lang)
+        glossary = get_glossary(source_lang, target_lang, self.glossary_path)
+        translations = {}
+        pending = {}
+        glossary_terms = []
+        skipped = Counter()
+        for region in regions:
+            reason = classifier.classify(region['text'])
+            exact = glossary.exact(region['text']) if glossary and not reason else None
+            if reason:
+                logger.debug(f"번역 제외 영역 ({reason}): '{region['text']}'")
+                translations[region['id']] = region['text']
+                skipped[reason] += 1
+            elif exact is not None:
+                translations[region['id']] = exact
+                skipped['glossary'] += 1
+            else:
+                pending[region['id']] = region['text']
+                if glossary:
+                    glossary_terms.extend(term for term in glossary.match(region['text'])
+                                          if term not in glossary_terms)
+        
+        # 이미지당 1회의 구조화된 요청으로 영역별 번역 (모든 영역이 제외되면 요청 생략)
+        if pending:
+            # 영역 묶음은 JSON 형식을 지켜야 하므로 모델 선택 없이 text_model로 번역
+            self.report.record_call('regions')
+            failed = []
+            start = time.perf_counter()
+            try:
+                translations.update(self._call_with_retry(
+                    self.backend.translate_regions,
+                    pending, source_lang, target_lang, text_model,
+                    glossary_terms=glossary_terms[:GLOSSARY_MAX_PROMPT_TERMS] or None,
+                    raise_on_error=True, failed=failed
+                ))
+            except (TranslationError, CircuitOpenError) as e:
+                logger.warning(f"영역 번역 실패, 원문 유지 ({location}): {e}")
+                failed = list(pending)
+                error = e
+            else:
+                error = "응답에 번역 누락"
+                self.report.record_model(text_model, time.perf_counter() - start,
+                                         sum(estimate_tokens(text) for text in pending.values()))
+            for region_id in failed:
+                self.report.record_fallback('regions', location, pending[region_id], error)
+        elif skipped:
+            self.report.record_saved(skipped.most_common(1)[0][0])
+        translated = [dict(region, translated=translations.get(region['id'], region['text']))
+                      for region in regions]
+        
+        if not any(region['translated'] != region['text'] for region in translated):
+            logger.warning(f"텍스트가 번역되지 않았거나 원본과 동일합니다. ({target_lang})")
+            return None
+        
+        return translated
+    
+    def _replace_picture(self, job, target_lang, image_bytes):
+        """렌더링된 PNG 바이트로 대상 언어 슬라이드의 원본 이미지를 덮어 교체"""
+        slide = job['ppts'][target_lang].slides[job['slide_idx']]
+        shape = slide.shapes[job['shape_idx']]
+        left, top, width, height = shape.left, shape.top, shape.width, shape.height
+        # 기존 이미지 대신 새 이미지 추가
+        pic = slide.shapes.add_picture(io.BytesIO(image_bytes), left, top, width, height)
+        # 위치와 크기 조정
+        pic.left, pic.top, pic.width, pic.height = left, top, width, height
+        
+        job['element']['translated'] = True
+        job['element'].setdefault('outputs', {})[target_lang] = {
+            'slide_idx': job['slide_idx'],
+            'shape_idx': len(slide.shapes) - 1
+        }
+        logger.info(f"이미지 교체 완료 ({target_lang})")
+    
+    def _reuse_picture(self, ppts, image_element, target_lang, image_bytes):
+        """증분 번역: 이전 번역 이미지로 교체 (None이면 이전에도 번역할 텍스트가 없던 이미지)"""
+        if image_bytes is None:
+            image_element.setdefault('outputs', {})[target_lang] = None
+            return
+        try:
+            job = {
+                'ppts': ppts,
+                'slide_idx': image_element['slide_idx'],
+                'shape_idx': image_element['shape_idx'],
+                'element': image_element
+            }
+            self._replace_picture(job, target_lang, image_bytes)
+        except Exception as e:
+            logger.error(f"이전 번역 이미지 교체 오류: {e}")
+    
     def _cleanup_temp_files(self, file_list):
         """임시 파일 정리"""
         count = 0
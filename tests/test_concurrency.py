@@ -0,0 +1,112 @@
+# tests/test_concurrency.py
+import threading
+
+import pytest
+
+import services.concurrency as concurrency
+from services.concurrency import AIMDController
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(concurrency, "time", fake)
+    return fake
+
+def run_round(controller, clock, latency, tokens=None, failures=0, counter=None, sizes=None):
+    """현재 창 크기만큼 요청을 보내고 응답을 받아 라운드 하나를 끝냄 (sizes: 요청별 토큰 수, 응답 시간은 latency × 토큰 수)"""
+    size = max(int(controller.window), controller.min_round)
+    sizes = [sizes[idx % len(sizes)] for idx in range(size)] if sizes else [1] * size
+    for _ in range(size):
+        controller.in_flight += 1
+    clock.now += latency * max(sizes)
+    if counter is not None:
+        counter['tokens'] += tokens if tokens is not None else 100 * size
+    for idx in range(size):
+        controller.release(latency * sizes[idx], failed=idx < failures, tokens=sizes[idx])
+
+def test_window_grows_past_fixed_worker_count_when_server_keeps_up(clock):
+    counter = {'tokens': 0}
+    controller = AIMDController(16, initial=2, token_counter=lambda: counter['tokens'], min_round=1)
+    for _ in range(20):
+        run_round(controller, clock, latency=1.0, counter=counter)
+    assert int(controller.window) == 16
+    assert controller.stats()['decreases'] == 0
+
+def test_window_decreases_on_failures(clock):
+    controller = AIMDController(16, initial=10, min_round=1, decrease=0.5)
+    run_round(controller, clock, latency=1.0, failures=1)
+    assert int(controller.window) == 5
+    assert controller.history[-1]['action'] == 'decrease'
+
+def test_window_decreases_when_latency_rises(clock):
+    controller = AIMDController(16, initial=4, min_round=1, latency_factor=2.0, decrease=0.5)
+    run_round(controller, clock, latency=1.0)
+    window = int(controller.window)
+    run_round(controller, clock, latency=5.0)
+    assert int(controller.window) == window // 2
+
+def test_mixed_segment_lengths_do_not_look_like_congestion(clock):
+    # 서버는 일정한 속도로 토큰을 생성 (처리량 변화 없음)
+    controller = AIMDController(16, initial=2, min_round=1, latency_factor=2.0, token_counter=lambda: 20 * clock.now)
+    # 짧은 라벨만 있는 라운드 다음에 긴 문단이 섞인 라운드 (토큰당 속도는 같음)
+    run_round(controller, clock, latency=0.05, sizes=[2])
+    for _ in range(6):
+        run_round(controller, clock, latency=0.05, sizes=[2, 300, 5, 120])
+    assert controller.stats()['decreases'] == 0
+    assert int(controller.window) == 9
+
+def test_window_decreases_when_per_token_latency_rises(clock):
+    controller = AIMDController(16, initial=4, min_round=1, latency_factor=2.0, decrease=0.5)
+    run_round(controller, clock, latency=0.05, sizes=[100])
+    window = int(controller.window)
+    run_round(controller, clock, latency=0.25, sizes=[10])
+    assert int(controller.window) == window // 2
+
+def test_window_decreases_when_throughput_drops_after_increase(clock):
+    counter = {'tokens': 0}
+    controller = AIMDController(16, initial=4, token_counter=lambda: counter['tokens'], min_round=1,
+                                latency_factor=100, decrease=0.5)
+    run_round(controller, clock, latency=1.0, tokens=1000, counter=counter)
+    assert int(controller.window) == 5
+    run_round(controller, clock, latency=1.0, tokens=500, counter=counter)
+    assert int(controller.window) == 2
+
+def test_window_stays_within_bounds(clock):
+    controller = AIMDController(3, min_window=2, initial=10, min_round=1, decrease=0.1)
+    assert controller.window == 3
+    run_round(controller, clock, latency=1.0, failures=1)
+    assert controller.window == 2
+
+def test_acquire_blocks_at_window():
+    controller = AIMDController(4, initial=2)
+    controller.acquire()
+    controller.acquire()
+    acquired = threading.Event()
+
+    def third():
+        controller.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=third, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.1)
+    controller.release(0.1)
+    assert acquired.wait(1)
+    thread.join(1)
+
+def test_stats_reports_throughput_curve(clock):
+    controller = AIMDController(8, initial=2, min_round=1)
+    for _ in range(3):
+        run_round(controller, clock, latency=1.0)
+    stats = controller.stats()
+    assert stats['unit'] == 'requests'
+    assert stats['rounds'] == 3
+    assert stats['max_window'] == 8
+    assert sorted(stats['curve']) == [2, 3, 4]
@@ -0,0 +1,66 @@
+# tests/test_glossary.py
+import os
+
+from services.glossary import AhoCorasick, Glossary, fold, read_glossary_entries, get_glossary
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    matches = sorted((start, end, automaton.patterns[idx]) for start, end, idx in automaton.iter_matches("ushers"))
+    assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+def test_aho_corasick_without_patterns():
+    assert list(AhoCorasick([]).iter_matches("text")) == []
+
+def test_fold_keeps_length():
+    # 소문자가 두 글자가 되는 문자는 그대로 두어 원문 위치가 어긋나지 않음
+    assert fold("İstanbul ABC") == "İstanbul abc"
+    assert fold("Revenue") == "revenue"
+
+def test_exact_match_ignores_case_and_surrounding_space():
+    glossary = Glossary([("Net Sales", "순매출"), ("  ", "무시"), ("빈 번역", " ")])
+    assert len(glossary) == 1
+    assert glossary.exact("  net sales ") == "순매출"
+    assert glossary.exact("net sales growth") is None
+
+def test_match_prefers_longest_term_from_the_left():
+    glossary = Glossary([("net", "순"), ("net sales", "순매출"), ("sales", "매출"), ("growth", "성장")])
+    assert glossary.match("Net sales growth") == [("net sales", "순매출"), ("growth", "성장")]
+
+def test_match_skips_latin_terms_inside_words():
+    glossary = Glossary([("art", "예술")])
+    assert glossary.match("Smart start") == []
+    assert glossary.match("Modern art.") == [("art", "예술")]
+
+def test_match_finds_cjk_terms_without_spaces():
+    glossary = Glossary([("売上", "매출"), ("四半期", "분기")])
+    assert glossary.match("四半期売上の概要") == [("四半期", "분기"), ("売上", "매출")]
+
+def test_match_respects_limit_and_reports_each_term_once():
+    glossary = Glossary([("a1", "x"), ("b2", "y"), ("c3", "z")])
+    assert glossary.match("a1 b2 a1 c3", limit=2) == [("a1", "x"), ("b2", "y")]
+
+def write_csv(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_read_glossary_entries_by_column_name(tmp_path):
+    path = write_csv(tmp_path / "g.csv", "일본어,한국어,영어\n売上,매출,Sales\n利益,,Profit\n")
+    assert read_glossary_entries(path, "일본어", "한국어") == [("売上", "매출")]
+    assert read_glossary_entries(path, "일본어", "영어") == [("売上", "Sales"), ("利益", "Profit")]
+    assert read_glossary_entries(path, "일본어", "태국어") == []
+
+def test_get_glossary_reloads_when_file_changes(tmp_path):
+    path = write_csv(tmp_path / "g.csv", "영어,한국어\nSales,매출\n")
+    glossary = get_glossary("영어", "한국어", path)
+    assert glossary.exact("sales") == "매출"
+    assert get_glossary("영어", "한국어", path) is glossary
+
+    write_csv(tmp_path / "g.csv", "영어,한국어\nSales,판매\n")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert get_glossary("영어", "한국어", path).exact("sales") == "판매"
+
+def test_get_glossary_missing_file_or_no_entries(tmp_path):
+    assert get_glossary("영어", "한국어", str(tmp_path / "none.csv")) is None
+    path = write_csv(tmp_path / "g.csv", "영어,일본어\nSales,売上\n")
+    assert get_glossary("영어", "한국어", path) is None
@@ -0,0 +1,92 @@
+# tests/test_incremental.py
+import json
+
+import pytest
+from pptx import Presentation
+
+from services.incremental import (content_hash, manifest_path, unit_key, write_manifest, load_memory_from_manifest,
+                                  load_memory_from_pair, apply_memory)
+
+def paragraph(text, slide_id=256, shape_id=2, para_idx=0):
+    return {'slide_idx': 0, 'shape_idx': 0, 'slide_id': slide_id, 'shape_id': shape_id,
+            'para_idx': para_idx, 'type': 'paragraph', 'text': text}
+
+def save_deck(path, title, body):
+    ppt = Presentation()
+    slide = ppt.slides.add_slide(ppt.slide_layouts[1])
+    slide.shapes.title.text = title
+    slide.placeholders[1].text = body
+    ppt.save(str(path))
+    return str(path)
+
+def test_content_hash_accepts_text_and_bytes():
+    assert content_hash("売上") == content_hash("売上".encode("utf-8"))
+    assert content_hash("a") != content_hash("b")
+
+def test_manifest_path_sits_next_to_output():
+    assert manifest_path("/out/deck_translated.pptx") == "/out/deck_translated.manifest.json"
+
+def test_unit_key_uses_stable_ids_and_cell_position():
+    assert unit_key(paragraph("x", para_idx=3)) == "256:2:paragraph:3"
+    cell = {'slide_idx': 1, 'shape_idx': 4, 'type': 'table_cell', 'row_idx': 2, 'col_idx': 0, 'text': 'x'}
+    assert unit_key(cell) == "1:4:table_cell:2:0"
+
+@pytest.fixture
+def translated_deck(tmp_path):
+    return save_deck(tmp_path / "deck_translated.pptx", "안녕", "세계")
+
+def test_manifest_round_trip(tmp_path, translated_deck):
+    elements = [dict(paragraph("Hello"), translations={'한국어': "안녕"}),
+                paragraph("Skipped", shape_id=9)]  # 번역 결과가 없는 요소는 기록하지 않음
+    images = [{'hash': "img1", 'outputs': {'한국어': None}}]
+    path = write_manifest(translated_deck, str(tmp_path / "deck.pptx"), "영어", "한국어", "m", elements, images)
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert [unit['translated'] for unit in manifest['text']] == ["안녕"]
+    assert manifest['images'] == {"img1": None}
+
+    memory = load_memory_from_manifest(translated_deck, "영어", "한국어", "m")
+    assert memory['by_key'] == {"256:2:paragraph:0": (content_hash("Hello"), "안녕")}
+    assert memory['by_hash'] == {content_hash("Hello"): "안녕"}
+    assert memory['images'] == {"img1": None}
+
+@pytest.mark.parametrize("source_lang, target_lang, model", [
+    ("일본어", "한국어", "m"),
+    ("영어", "일본어", "m"),
+    ("영어", "한국어", "other"),
+])
+def test_manifest_is_ignored_when_conditions_change(tmp_path, translated_deck, source_lang, target_lang, model):
+    write_manifest(translated_deck, "deck.pptx", "영어", "한국어", "m", [], [])
+    assert load_memory_from_manifest(translated_deck, source_lang, target_lang, model) is None
+
+def test_missing_or_broken_manifest(tmp_path, translated_deck):
+    assert load_memory_from_manifest(translated_deck) is None
+    with open(manifest_path(translated_deck), "w", encoding="utf-8") as f:
+        f.write("{broken")
+    assert load_memory_from_manifest(translated_deck) is None
+
+def test_apply_memory_reuses_unchanged_and_moved_text_only():
+    memory = {
+        'by_key': {"256:2:paragraph:0": (content_hash("Hello"), "안녕"),
+                   "256:3:paragraph:0": (content_hash("Old text"), "이전 문장")},
+        'by_hash': {content_hash("Hello"): "안녕", content_hash("Old text"): "이전 문장"},
+        'images': {"img1": b"png"}
+    }
+    unchanged = paragraph("Hello")
+    moved = paragraph("Hello", shape_id=7)
+    changed = paragraph("New text", shape_id=3)
+    images = [{'hash': "img1"}, {'hash': "img2"}]
+
+    assert apply_memory(memory, [unchanged, moved, changed], images, "한국어") == (2, 1)
+    assert unchanged['cached_translations'] == {'한국어': "안녕"}
+    assert moved['cached_translations'] == {'한국어': "안녕"}
+    assert 'cached_translations' not in changed
+    assert images[0]['cached_images'] == {'한국어': b"png"}
+    assert 'cached_images' not in images[1]
+
+def test_load_memory_from_pair_matches_positions(tmp_path):
+    source = save_deck(tmp_path / "source.pptx", "Hello", "World")
+    translated = save_deck(tmp_path / "translated.pptx", "안녕", "세계")
+    memory = load_memory_from_pair(source, translated)
+    assert memory['by_hash'][content_hash("Hello")] == "안녕"
+    assert memory['by_hash'][content_hash("World")] == "세계"
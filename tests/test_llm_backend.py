@@ -0,0 +1,58 @@
+# tests/test_llm_backend.py
+import pytest
+
+from services.llm.base import TranslationBackend, TranslationError
+from services.resilience import RetryDispatcher
+
+class FakeResponse:
+    status_code = 200
+
+    def close(self):
+        pass
+
+class ScriptedBackend(TranslationBackend):
+    """요청마다 정해 둔 응답을 차례로 스트리밍하는 백엔드"""
+    def __init__(self, replies):
+        super().__init__("http://stub")
+        self.replies = list(replies)
+        self.calls = 0
+
+    def _post_chat(self, model, messages, num_predict, options=None, stream=False, json_format=False, timeout=None):
+        self.calls += 1
+        return FakeResponse()
+
+    def _stream_events(self, response):
+        yield self.replies.pop(0), None
+        yield "", {"done_reason": "stop", "eval_count": 1, "eval_duration": 1_000_000}
+
+def test_translate_text_returns_translation():
+    backend = ScriptedBackend(["  안녕하세요  "])
+    assert backend.translate_text("Hello", "English", "Korean", "m") == "안녕하세요"
+
+@pytest.mark.parametrize("reply", ["", "   \n "])
+def test_empty_output_raises_when_requested(reply):
+    backend = ScriptedBackend([reply])
+    with pytest.raises(TranslationError):
+        backend.translate_text("Hello", "English", "Korean", "m", raise_on_error=True)
+
+def test_empty_output_keeps_source_without_raise():
+    backend = ScriptedBackend([""])
+    assert backend.translate_text("Hello", "English", "Korean", "m") == "Hello"
+
+def test_empty_output_is_retried_by_dispatcher():
+    backend = ScriptedBackend(["", "안녕하세요"])
+    dispatcher = RetryDispatcher(max_workers=1, retry_on=(TranslationError,), backoff=0.01, backoff_max=0.01)
+    try:
+        result = dispatcher.call(backend.translate_text, "Hello", "English", "Korean", "m", raise_on_error=True)
+    finally:
+        dispatcher.shutdown()
+    assert result == "안녕하세요"
+    assert backend.calls == 2
+
+def test_empty_region_reply_is_reported_as_failed():
+    backend = ScriptedBackend(["", "B"])
+    backend.batch_regions = False
+    failed = []
+    result = backend.translate_regions({"1": "a", "2": "b"}, "English", "Korean", "m", failed=failed)
+    assert result == {"1": "a", "2": "B"}
+    assert failed == ["1"]
@@ -0,0 +1,82 @@
+# tests/test_ocr_layout.py
+import numpy as np
+
+from utils.ocr_layout import (boxes_to_array, rects_to_array, box_geometry, union_box, GridIndex, reading_order,
+                              cluster_layout, merge_text_blocks)
+
+def rect(x, y, w, h):
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+def test_boxes_to_array_shapes():
+    assert boxes_to_array([]).shape == (0, 4, 2)
+    assert boxes_to_array([rect(0, 0, 10, 5)]).shape == (1, 4, 2)
+
+def test_rects_to_array_matches_four_point_boxes():
+    boxes = rects_to_array([0, 10], [0, 20], [10, 5], [5, 5])
+    np.testing.assert_array_equal(boxes, boxes_to_array([rect(0, 0, 10, 5), rect(10, 20, 5, 5)]))
+
+def test_box_geometry_of_rotated_box():
+    # 가로 20, 세로 10 상자를 90도 회전
+    geom = box_geometry([[[10, 0], [10, 20], [0, 20], [0, 0]]])
+    assert geom['width'][0] == 20
+    assert geom['height'][0] == 10
+    assert geom['angle'][0] == 90
+    assert (geom['x_min'][0], geom['y_max'][0]) == (0, 20)
+
+def test_union_box():
+    np.testing.assert_array_equal(union_box([rect(0, 0, 10, 10), rect(20, 5, 10, 10)]), rect(0, 0, 30, 15))
+
+def test_grid_index_query_returns_overlapping_boxes_only():
+    index = GridIndex([0, 100], [0, 100], [10, 110], [10, 110], cell_size=20)
+    assert sorted(index.query(5, 5, 15, 15)) == [0]
+    assert sorted(index.query(0, 0, 200, 200)) == [0, 1]
+    assert len(index.query(50, 50, 60, 60)) == 0
+
+def test_reading_order_reads_rows_then_columns():
+    # 제목 아래 두 단 (단 사이 블록 높이가 어긋나 가로로 나뉘지 않음)
+    rects = [(0, 0, 200, 20),      # 제목
+             (110, 30, 200, 60),   # 오른쪽 단 위
+             (0, 30, 90, 50),      # 왼쪽 단 위
+             (0, 55, 90, 80),      # 왼쪽 단 아래
+             (110, 65, 200, 80)]   # 오른쪽 단 아래
+    x_min, y_min, x_max, y_max = zip(*rects)
+    assert reading_order(x_min, y_min, x_max, y_max) == [0, 2, 3, 1, 4]
+
+    # 두 단을 가로지르는 빈 줄이 있으면 행 단위로 읽음
+    rows = [(0, 0, 90, 20), (110, 0, 200, 20), (0, 30, 90, 50), (110, 30, 200, 50)]
+    x_min, y_min, x_max, y_max = zip(*rows)
+    assert reading_order(x_min, y_min, x_max, y_max) == [0, 1, 2, 3]
+    assert reading_order([], [], [], []) == []
+
+def test_fragments_on_one_line_merge_in_left_to_right_order():
+    boxes = [rect(60, 0, 40, 20), rect(0, 0, 50, 20), rect(110, 2, 30, 18)]
+    assert cluster_layout(boxes) == [[[1, 0, 2]]]
+
+def test_distant_fragments_and_different_sizes_stay_apart():
+    wide_gap = [rect(0, 0, 40, 20), rect(200, 0, 40, 20)]
+    assert len(cluster_layout(wide_gap)) == 2
+    # 제목(큰 글자)과 본문(작은 글자)은 같은 블록이 아님
+    title_and_body = [rect(0, 0, 200, 40), rect(0, 45, 200, 12)]
+    assert len(cluster_layout(title_and_body)) == 2
+
+def test_lines_merge_into_paragraph_blocks():
+    boxes = [rect(0, 0, 100, 20), rect(0, 25, 80, 20), rect(0, 200, 100, 20)]
+    layout = cluster_layout(boxes)
+    assert layout == [[[0], [1]], [[2]]]
+
+def test_merge_text_blocks_builds_translation_units():
+    boxes = [rect(0, 0, 50, 20), rect(55, 0, 50, 20), rect(0, 25, 100, 20), rect(0, 300, 60, 20)]
+    texts = ["Quarterly", "results", "overview", "Contact"]
+    blocks = merge_text_blocks(boxes, texts, confidences=[0.9, 0.7, 0.8, 1.0])
+    assert [block['id'] for block in blocks] == ["b1", "b2"]
+    assert blocks[0]['lines'] == ["Quarterly results", "overview"]
+    assert blocks[0]['text'] == "Quarterly results overview"
+    assert abs(blocks[0]['conf'] - 0.8) < 1e-6
+    assert blocks[0]['line_height'] == 20
+    np.testing.assert_array_equal(blocks[0]['bbox'], rect(0, 0, 105, 45))
+    assert blocks[1]['text'] == "Contact"
+    assert merge_text_blocks([], []) == []
+
+def test_merge_text_blocks_uses_separator_for_cjk():
+    boxes = [rect(0, 0, 40, 20), rect(42, 0, 40, 20)]
+    assert merge_text_blocks(boxes, ["四半期", "業績"], separator="")[0]['text'] == "四半期業績"
@@ -0,0 +1,155 @@
+# tests/test_ollama_pool.py
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config import OLLAMA_DRAIN_FAILURES
+from services.llm.base import TranslationBackend, TranslationError
+from services.ollama_pool import OllamaPool
+
+class StubOllama:
+    """/api/tags, /api/ps, /api/chat, /api/generate에 응답하는 로컬 Ollama 대역 서버"""
+    def __init__(self, available=("m1",), loaded=(), fail_chat=False):
+        self.available = list(available)
+        self.loaded = list(loaded)
+        self.fail_chat = fail_chat
+        self.hits = Counter()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body, content_type="application/json"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                stub.hits[self.path] += 1
+                names = stub.available if self.path == "/api/tags" else stub.loaded
+                self._reply(200, json.dumps({"models": [{"name": name} for name in names]}))
+
+            def do_POST(self):
+                stub.hits[self.path] += 1
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path == "/api/generate":
+                    self._reply(200, json.dumps({"done": True, "load_duration": 1_000_000}))
+                    return
+                if stub.fail_chat:
+                    self._reply(500, json.dumps({"error": "boom"}))
+                    return
+                source = payload["messages"][-1]["content"]
+                final = {"message": {"content": ""}, "done": True, "done_reason": "stop",
+                         "eval_count": 4, "eval_duration": 40_000_000}
+                if payload.get("stream"):
+                    lines = [{"message": {"content": f"T({source})"}, "done": False}, final]
+                    self._reply(200, "\n".join(json.dumps(line) for line in lines) + "\n", "application/x-ndjson")
+                else:
+                    regions = json.loads(source)
+                    content = json.dumps({key: f"T({value})" for key, value in regions.items()})
+                    self._reply(200, json.dumps(dict(final, message={"content": content})))
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    @property
+    def chats(self):
+        return self.hits["/api/chat"]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def make_pool():
+    stubs, pools = [], []
+
+    def make(*specs):
+        stubs.extend(StubOllama(**spec) for spec in specs)
+        # 상태 확인 스레드 없이 check_health를 직접 호출
+        pool = OllamaPool([stub.url for stub in stubs], health_interval=0)
+        pools.append(pool)
+        return pool, stubs
+
+    yield make
+    for pool in pools:
+        pool.close()
+    for stub in stubs:
+        stub.stop()
+
+def test_pool_is_translation_backend(make_pool):
+    pool, _ = make_pool({}, {})
+    assert isinstance(pool, TranslationBackend)
+    assert pool.server_count == 2
+    assert pool.max_concurrency == 2 * TranslationBackend.max_concurrency
+    assert pool.generation_timeout(100) > 0
+
+def test_routes_to_server_with_model(make_pool):
+    pool, (a, b) = make_pool({"available": ["m1"]}, {"available": ["m1", "m2"]})
+    assert pool.get_text_models() == ["m1", "m2"]
+    for _ in range(3):
+        assert pool.translate_text("hello", "English", "Korean", "m2") == "T(hello)"
+    assert (a.chats, b.chats) == (0, 3)
+
+def test_prefers_server_with_model_loaded(make_pool):
+    pool, (a, b) = make_pool({"loaded": []}, {"loaded": ["m1"]})
+    pool.translate_text("hello", "English", "Korean", "m1")
+    assert (a.chats, b.chats) == (0, 1)
+
+def test_unknown_model_raises(make_pool):
+    pool, _ = make_pool({}, {})
+    with pytest.raises(TranslationError):
+        pool.translate_text("hello", "English", "Korean", "missing", raise_on_error=True)
+    # raise_on_error가 없으면 원문 유지
+    assert pool.translate_text("hello", "English", "Korean", "missing") == "hello"
+
+def test_fails_over_to_another_server(make_pool):
+    pool, (bad, good) = make_pool({"fail_chat": True}, {})
+    assert pool.translate_text("hello", "English", "Korean", "m1", raise_on_error=True) == "T(hello)"
+    assert (bad.chats, good.chats) == (1, 1)
+    assert pool.get_timings()["endpoints"][bad.url]["errors"] == 1
+
+def test_failover_tries_at_most_two_servers(make_pool):
+    pool, stubs = make_pool({"fail_chat": True}, {"fail_chat": True}, {"fail_chat": True})
+    with pytest.raises(TranslationError):
+        pool.translate_text("hello", "English", "Korean", "m1", raise_on_error=True)
+    assert sum(stub.chats for stub in stubs) == 2
+
+def test_regions_fail_over(make_pool):
+    pool, (bad, good) = make_pool({"fail_chat": True}, {})
+    result = pool.translate_regions({"1": "a", "2": "b"}, "English", "Korean", "m1", raise_on_error=True)
+    assert result == {"1": "T(a)", "2": "T(b)"}
+    assert good.chats == 1
+
+def test_drains_server_after_repeated_failures(make_pool):
+    # 모델이 로드된 서버가 먼저 선택되도록 해 실패가 같은 서버에 쌓이게 함
+    pool, (bad, good) = make_pool({"fail_chat": True, "loaded": ["m1"]}, {})
+    for _ in range(OLLAMA_DRAIN_FAILURES + 3):
+        pool.translate_text("hello", "English", "Korean", "m1", raise_on_error=True)
+    # 연속 실패 한도에 도달한 뒤로는 요청을 보내지 않음
+    assert bad.chats == OLLAMA_DRAIN_FAILURES
+    assert pool.get_timings()["endpoints"][bad.url]["drained"]
+
+def test_skips_server_that_went_down(make_pool):
+    pool, (a, b) = make_pool({}, {})
+    a.stop()
+    pool.check_health()
+    for _ in range(3):
+        assert pool.translate_text("hello", "English", "Korean", "m1", raise_on_error=True) == "T(hello)"
+    assert b.chats == 3
+
+def test_preload_and_release_reach_every_server(make_pool):
+    pool, stubs = make_pool({}, {})
+    assert pool.preload_model("m1") is not None
+    assert all(stub.hits["/api/generate"] == 1 for stub in stubs)
+    assert pool.release_model("m1")
+    assert all(stub.hits["/api/generate"] == 2 for stub in stubs)
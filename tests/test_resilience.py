@@ -0,0 +1,164 @@
+# tests/test_resilience.py
+import time
+
+import pytest
+
+from services.resilience import CircuitBreaker, CircuitOpenError, RetryDispatcher
+
+class ServerError(Exception):
+    pass
+
+def make_dispatcher(breaker=None, **kwargs):
+    return RetryDispatcher(max_workers=2, retry_on=(ServerError,), breaker=breaker,
+                           backoff=0.01, backoff_max=0.01, **kwargs)
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+def test_breaker_opens_after_threshold_and_closes_on_probe_success():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05, give_up_seconds=5)
+    open_breaker(breaker)
+    assert breaker.state == 'open'
+    assert breaker.trips == 1
+
+    start = time.monotonic()
+    assert breaker.before_call() is True  # 대기 후 시험 요청
+    assert time.monotonic() - start >= 0.04
+    assert breaker.state == 'half_open'
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.before_call() is False
+
+def test_breaker_reopens_when_probe_fails():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01, give_up_seconds=5)
+    open_breaker(breaker)
+    assert breaker.before_call() is True
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+def test_breaker_gives_up_after_long_outage():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, give_up_seconds=0.05)
+    open_breaker(breaker)
+    time.sleep(0.06)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+def test_released_probe_lets_next_call_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01, give_up_seconds=5)
+    open_breaker(breaker)
+    assert breaker.before_call() is True
+    breaker.release_probe()
+    start = time.monotonic()
+    assert breaker.before_call() is True
+    assert time.monotonic() - start < 1
+
+def test_dispatcher_retries_transient_failures():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ServerError("일시 오류")
+        return "ok"
+
+    dispatcher = make_dispatcher(max_attempts=3)
+    try:
+        assert dispatcher.call(flaky) == "ok"
+        assert dispatcher.stats()['retries'] == 2
+        assert dispatcher.stats()['failures'] == 0
+    finally:
+        dispatcher.shutdown()
+
+def test_dispatcher_raises_last_error_after_max_attempts():
+    def broken():
+        raise ServerError("계속 실패")
+
+    dispatcher = make_dispatcher(max_attempts=2)
+    try:
+        with pytest.raises(ServerError):
+            dispatcher.call(broken)
+        assert dispatcher.stats()['failures'] == 1
+    finally:
+        dispatcher.shutdown()
+
+def test_dispatcher_does_not_retry_other_errors():
+    calls = []
+
+    def bad_input():
+        calls.append(1)
+        raise ValueError("잘못된 입력")
+
+    dispatcher = make_dispatcher(max_attempts=3)
+    try:
+        with pytest.raises(ValueError):
+            dispatcher.call(bad_input)
+        assert len(calls) == 1
+        assert dispatcher.breaker.failures == 0
+    finally:
+        dispatcher.shutdown()
+
+def test_probe_with_non_retryable_error_does_not_block_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01, give_up_seconds=0.5)
+    open_breaker(breaker)
+    time.sleep(0.02)
+
+    def bad_input():
+        raise ValueError("서버와 무관한 오류")
+
+    dispatcher = make_dispatcher(breaker=breaker, max_attempts=1)
+    try:
+        with pytest.raises(ValueError):
+            dispatcher.call(bad_input)
+        assert breaker.probe_in_flight is False
+
+        # 다음 요청이 시험 요청으로 바로 실행되어 차단기를 닫아야 함
+        start = time.monotonic()
+        assert dispatcher.call(lambda: "ok") == "ok"
+        assert time.monotonic() - start < 0.4
+        assert breaker.state == 'closed'
+    finally:
+        dispatcher.shutdown()
+
+def test_shutdown_cancels_queued_retries():
+    def broken():
+        raise ServerError("실패")
+
+    dispatcher = RetryDispatcher(max_workers=1, retry_on=(ServerError,), backoff=10, backoff_max=10, max_attempts=3)
+    future = dispatcher.submit(broken)
+    time.sleep(0.05)
+    dispatcher.shutdown(cancel_futures=True)
+    assert future.cancelled()
+
+def test_cancel_shutdown_wakes_calls_waiting_on_open_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, give_up_seconds=60)
+    open_breaker(breaker)
+    dispatcher = make_dispatcher(breaker=breaker)
+    futures = [dispatcher.submit(lambda: "ok") for _ in range(2)]
+    time.sleep(0.05)
+
+    # 차단기 대기(30초)를 기다리지 않고 바로 종료
+    start = time.monotonic()
+    dispatcher.shutdown(cancel_futures=True)
+    assert time.monotonic() - start < 2
+    assert all(future.cancelled() for future in futures)
+
+def test_dispatcher_reports_request_size_to_controller():
+    class RecordingController:
+        def __init__(self):
+            self.released = []
+
+        def acquire(self):
+            pass
+
+        def release(self, latency, failed=False, tokens=1):
+            self.released.append(tokens)
+
+    controller = RecordingController()
+    dispatcher = make_dispatcher(controller=controller, request_tokens=lambda args, kwargs: len(args[0]))
+    try:
+        assert dispatcher.call(str.upper, "abcd") == "ABCD"
+    finally:
+        dispatcher.shutdown()
+    assert controller.released == [4]
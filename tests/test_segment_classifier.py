@@ -0,0 +1,100 @@
+# tests/test_segment_classifier.py
+import pytest
+
+from services.segment_classifier import SegmentClassifier, char_script, text_scripts, get_classifier
+
+@pytest.fixture
+def classifier():
+    return SegmentClassifier("일본어", "한국어")
+
+@pytest.mark.parametrize("text, skipped", [
+    ("2024-03-01", True),
+    ("2024.03", True),
+    ("03/15/2024", True),
+    ("2024/3/1 9:00", True),
+    ("14:30", True),
+    ("1/2", False),      # 분수
+    ("3-4", False),      # 범위
+    ("25:00", False),
+])
+def test_date(classifier, text, skipped):
+    assert (classifier.checks['date'](text)) is skipped
+
+@pytest.mark.parametrize("text, skipped", [
+    ("obj.method()", True),
+    ("package.module", True),
+    ("std::vector", True),
+    ("print(x)", True),
+    ("len(a, b)", True),
+    ("snake_case_name", True),
+    ("getValue2X", True),
+    ("--verbose", True),
+    ("./run.sh", True),
+    ("<div>", True),
+    ("iPhone", False),
+    ("YouTube", False),
+    ("getElementById", False),  # 코드 표시 없음
+    ("Revenue(estimated)", False),
+])
+def test_code(classifier, text, skipped):
+    assert (classifier.checks['code'](text)) is skipped
+
+@pytest.mark.parametrize("text, skipped", [
+    ("ABC-1234", True),
+    ("SKU_12A/B", True),
+    ("ABC1234", True),
+    ("Q3", False),
+    ("FY2024", False),
+    ("4K", False),
+    ("MP3", False),
+])
+def test_part_number(classifier, text, skipped):
+    assert (classifier.checks['part_number'](text)) is skipped
+
+@pytest.mark.parametrize("text, skipped", [
+    ("https://example.com/a", True),
+    ("www.example.com", True),
+    ("example.co.jp", True),
+    ("example", False),
+])
+def test_url(classifier, text, skipped):
+    assert (classifier.checks['url'](text)) is skipped
+
+def test_email(classifier):
+    assert classifier.checks['email']("sales@example.com")
+    assert not classifier.checks['email']("@sales")
+
+def test_symbol(classifier):
+    assert classifier.checks['symbol']("→ ・ ★")
+    assert not classifier.checks['symbol']("→ A")
+
+def test_target_script(classifier):
+    assert classifier.classify("안녕하세요") == 'target_script'
+    assert classifier.classify("안녕 こんにちは") is None
+    # 같은 문자 체계를 쓰는 언어 쌍은 판별하지 않음
+    assert SegmentClassifier("영어", "프랑스어").classify("Bonjour") is None
+
+def test_classify_returns_first_matching_rule_or_none(classifier):
+    assert classifier.classify("  ") == 'empty'
+    assert classifier.classify("12,345") == 'numeric'
+    assert classifier.classify("Q3の売上") is None
+    assert classifier.classify("1/2") is None
+    assert classifier.classify("iPhone") is None
+
+def test_custom_rules_and_unknown_rules_are_ignored():
+    classifier = SegmentClassifier("일본어", "영어", rules=["url", "no_such_rule"])
+    assert classifier.rules == ["url"]
+    assert classifier.classify("ABC-1234") is None
+    assert classifier.classify("https://example.com") == 'url'
+
+def test_char_script():
+    assert char_script("한") == "hangul"
+    assert char_script("カ") == "kana"
+    assert char_script("漢") == "han"
+    assert char_script("ก") == "thai"
+    assert char_script("a") == "latin"
+    assert char_script("1") is None
+    assert text_scripts("漢字とカナ 123") == {"han", "kana"}
+
+def test_get_classifier_is_cached():
+    assert get_classifier("일본어", "한국어") is get_classifier("일본어", "한국어")
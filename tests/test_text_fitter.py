@@ -0,0 +1,119 @@
+# tests/test_text_fitter.py
+import pytest
+
+from utils.text_fitter import (
+    MIN_FONT_SIZE, REFERENCE_SIZE, break_opportunities, fit_text, get_glyph_metrics,
+    split_graphemes, wrap_lines,
+)
+
+# 폰트 파일 없이 Pillow 기본 폰트 사용
+FONT = None
+
+def _width(line, size):
+    """주어진 크기에서의 줄 폭"""
+    metrics = get_glyph_metrics(FONT)
+    return sum(metrics.advance(c) for c in split_graphemes(line)) * size / REFERENCE_SIZE
+
+@pytest.mark.parametrize("text, expected", [
+    ("abc", ["a", "b", "c"]),
+    ("e\u0301x", ["e\u0301", "x"]),                               # 결합 악센트
+    ("\U0001F44D\U0001F3FD!", ["\U0001F44D\U0001F3FD", "!"]),     # 피부색 수정자
+    ("\U0001F468\u200d\U0001F469\u200d\U0001F467a",
+     ["\U0001F468\u200d\U0001F469\u200d\U0001F467", "a"]),        # ZWJ 이모지
+    ("\u2764\ufe0f", ["\u2764\ufe0f"]),                           # 이체자 선택자
+    ("\u1100\u1161\u11a8\u1100", ["\u1100\u1161\u11a8", "\u1100"]),  # 한글 조합형 자모
+    ("", []),
+])
+def test_split_graphemes(text, expected):
+    assert split_graphemes(text) == expected
+
+def test_split_graphemes_roundtrip():
+    text = "Cafe\u0301 \U0001F44D\U0001F3FD 한국어 ข\u0e49าม"
+    assert "".join(split_graphemes(text)) == text
+
+def test_break_after_space_not_before():
+    breaks = break_opportunities(split_graphemes("ab cd"))
+    # 공백 앞(2)은 안 되고 공백 뒤(3)에서만 가능
+    assert breaks == [False, False, False, True, False]
+
+def test_break_between_ideographs():
+    breaks = break_opportunities(split_graphemes("한국어"))
+    assert breaks == [False, True, True]
+
+def test_no_break_inside_latin_word():
+    assert not any(break_opportunities(split_graphemes("translation")))
+
+@pytest.mark.parametrize("text, forbidden", [
+    ("日本。語", 2),   # 마침표는 줄 맨 앞에 올 수 없음
+    ("日「本」", 2),   # 여는 괄호 뒤에서 끊지 않음
+    ("日本ー", 2),     # 장음 기호는 줄 맨 앞에 올 수 없음
+])
+def test_kinsoku_rules(text, forbidden):
+    breaks = break_opportunities(split_graphemes(text))
+    assert breaks[forbidden] is False
+
+def test_break_after_hyphen():
+    clusters = split_graphemes("state-of-art")
+    breaks = break_opportunities(clusters)
+    assert breaks[clusters.index("-") + 1] is True
+
+def test_wrap_lines_fits_width():
+    text = "The quick brown fox jumps over the lazy dog " * 3
+    size, max_width = 20, 150
+    lines = wrap_lines(text, FONT, size, max_width)
+    assert len(lines) > 1
+    assert all(_width(line, size) <= max_width for line in lines)
+    # 단어 중간에서 끊지 않고 공백도 잃지 않음
+    assert " ".join(lines).split() == text.split()
+
+def test_wrap_lines_keeps_explicit_newlines():
+    lines = wrap_lines("first\n\nsecond", FONT, 20, 1000)
+    assert lines == ["first", "", "second"]
+
+def test_wrap_lines_cjk_without_spaces():
+    text = "가나다라마바사아자차카타파하" * 2
+    size, max_width = 20, 100
+    lines = wrap_lines(text, FONT, size, max_width)
+    assert "".join(lines) == text
+    assert all(_width(line, size) <= max_width for line in lines)
+
+def test_wrap_lines_forces_split_of_long_word():
+    text = "a" * 80
+    lines = wrap_lines(text, FONT, 20, 100)
+    assert len(lines) > 1
+    assert "".join(lines) == text
+
+def test_wrap_lines_does_not_split_clusters():
+    text = "\U0001F44D\U0001F3FD" * 20
+    lines = wrap_lines(text, FONT, 20, 60)
+    assert all(len(split_graphemes(line)) * 2 == len(line) for line in lines)
+
+@pytest.mark.parametrize("text", ["", "   ", "\n"])
+def test_wrap_lines_empty(text):
+    assert wrap_lines(text, FONT, 20, 100) == []
+
+def test_fit_text_uses_max_size_when_it_fits():
+    size, lines, _ = fit_text("Hi", 1000, 1000, FONT, 40)
+    assert size == 40
+    assert lines == ["Hi"]
+
+def test_fit_text_shrinks_to_fit_box():
+    text = "The quick brown fox jumps over the lazy dog"
+    box_width, box_height = 200, 60
+    size, lines, line_height = fit_text(text, box_width, box_height, FONT, 72)
+    assert MIN_FONT_SIZE <= size < 72
+    assert len(lines) * line_height <= box_height
+    assert all(_width(line, size) <= box_width for line in lines)
+    # 한 단계 큰 크기는 상자를 넘침
+    bigger, _, _ = fit_text(text, box_width, box_height, FONT, size + 1)
+    assert bigger == size
+
+def test_fit_text_falls_back_to_min_size():
+    text = "word " * 200
+    size, lines, _ = fit_text(text, 50, 10, FONT, 40, min_size=10)
+    assert size == 10
+    assert lines
+
+def test_fit_text_max_below_min_size():
+    size, _, _ = fit_text("Hi", 1000, 1000, FONT, 4, min_size=MIN_FONT_SIZE)
+    assert size == MIN_FONT_SIZE
@@ -0,0 +1,106 @@
+# tests/test_token_budget.py
+from config import NUM_PREDICT_MIN
+from services.token_budget import (estimate_tokens, num_predict_budget, count_sentences, split_for_budget,
+                                   join_chunks, find_repetition, find_trailer, strip_preamble, _fit_pieces)
+
+def test_estimate_tokens_counts_wide_characters_individually():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    assert estimate_tokens("목차") == 2
+    assert estimate_tokens("四半期") == 3
+
+def test_num_predict_budget_has_minimum_and_strict_is_smaller():
+    assert num_predict_budget("Hi", "영어", "한국어") == NUM_PREDICT_MIN
+    text = "word " * 200
+    assert num_predict_budget(text, "영어", "한국어", strict=True) < num_predict_budget(text, "영어", "한국어")
+
+def test_count_sentences():
+    assert count_sentences("A. B! C?\nD") == 4
+    assert count_sentences("Version 1.5 is out") == 1
+    assert count_sentences("終わり。次へ") == 2
+
+def test_split_for_budget_keeps_short_text_whole():
+    assert split_for_budget("Short text.", 100) == [("Short text.", "")]
+
+def test_split_for_budget_splits_at_sentences_and_join_restores_separators():
+    text = "First sentence here. Second one follows.\nThird line!"
+    parts = split_for_budget(text, 6)
+    assert parts == [("First sentence here.", " "), ("Second one follows.", "\n"), ("Third line!", "")]
+    assert join_chunks(parts, "영어") == text
+
+def test_split_for_budget_splits_long_sentence_at_words():
+    text = " ".join(f"word{idx}" for idx in range(40))
+    parts = split_for_budget(text, 8)
+    assert len(parts) > 1
+    assert all(estimate_tokens(chunk) <= 8 for chunk, _ in parts)
+    # 단어 중간에서 자르지 않음
+    assert all(word.startswith("word") for chunk, _ in parts for word in chunk.split())
+    assert join_chunks(parts, "영어") == text
+
+def test_fit_pieces_sizes_character_slices_by_token_estimate():
+    pieces = _fit_pieces("a" * 100, 10)
+    assert "".join(pieces) == "a" * 100
+    assert [len(piece) for piece in pieces] == [40, 40, 20]
+    pieces = _fit_pieces("가" * 25, 10)
+    assert [len(piece) for piece in pieces] == [10, 10, 5]
+
+def test_fit_pieces_keeps_grapheme_clusters_together():
+    decomposed = "e\u0301" * 30  # e + 결합 악센트
+    pieces = _fit_pieces(decomposed, 4)
+    assert "".join(pieces) == decomposed
+    assert all(not piece.startswith("\u0301") for piece in pieces)
+
+    family = "\U0001F468\u200d\U0001F469\u200d\U0001F467" * 6  # ZWJ 이모지
+    pieces = _fit_pieces(family, 3)
+    assert "".join(pieces) == family
+    assert all(piece == "\U0001F468\u200d\U0001F469\u200d\U0001F467" for piece in pieces)
+
+    thumbs = "\U0001F44D\U0001F3FD" * 5  # 피부색 수정자
+    assert all(piece.startswith("\U0001F44D") for piece in _fit_pieces(thumbs, 2))
+
+    jamo = "\u1100\u1161\u11a8" * 10  # 조합형 한글 (초성+중성+종성)
+    assert all(piece.startswith("\u1100") for piece in _fit_pieces(jamo, 6))
+
+def test_join_chunks_drops_spaces_for_no_space_languages():
+    parts = [("最初の文。", " "), ("次の文。", "")]
+    assert join_chunks(parts, "일본어") == "最初の文。次の文。"
+
+def test_find_repetition_cuts_runaway_loops():
+    text = "회사 소개 " + "회사 " * 6
+    cut = find_repetition(text)
+    assert cut >= 0
+    assert text[:cut] == "회사 소개 회사 "
+    assert find_repetition("하" * 20) == 1
+
+def test_find_repetition_ignores_normal_text():
+    assert find_repetition("분기 실적 개요") == -1
+    assert find_repetition("") == -1
+
+def test_find_repetition_keeps_large_numbers():
+    assert find_repetition("Revenue reached 1,000,000,000,000") == -1
+    assert find_repetition("매출 1,000,000,000,000원 달성", "Revenue reached 1,000,000,000,000") == -1
+    assert find_repetition("1,000,000,000,000", "1,000,000,000,000") == -1
+
+def test_find_repetition_keeps_leaders_and_ellipses():
+    assert find_repetition("目次 ............") == -1
+    assert find_repetition("목차 ............", "目次 ............") == -1
+    assert find_repetition("잠시만요......") == -1
+    assert find_repetition("1장 개요 ---------------- 3") == -1
+
+def test_find_repetition_cuts_symbol_runs_well_beyond_source():
+    source = "目次 ............"
+    assert find_repetition("목차 " + "." * 40, source) >= 0
+    assert find_repetition("1" + ",000" * 15, "1,000,000") >= 0
+    assert find_repetition("." * 60) >= 0
+
+def test_find_trailer_only_for_single_line_source():
+    assert find_trailer("안녕하세요\nNote: greeting", "Hello") == 5
+    assert find_trailer("안녕하세요\n※ 인사말", "Hello") == 5
+    assert find_trailer("안녕하세요\nNote: greeting", "Hello\nNote: greeting") == -1
+    assert find_trailer("안녕하세요", "Hello") == -1
+
+def test_strip_preamble():
+    assert strip_preamble("Here is the translation:\n안녕", "Hello") == ("안녕", True)
+    assert strip_preamble("번역:\n", "Hello") == ("번역:\n", False)
+    assert strip_preamble("안녕", "Hello") == ("안녕", False)
@@ -15,8 +15,9 @@ from ui.components import (
     create_buttons_frame, create_progress_bar_frame, create_log_frame
 )
 from services.ollama_service import OllamaService
+from services.llm import get_translation_backend
 from services.document_analyzer import DocumentAnalyzer
-from services.translation import TranslationService
+from services.engine_process import EngineProcess
 from utils.logging_utils import TextHandler
 from utils.paddle_ocr_utils import check_paddleocr, show_paddleocr_install_guide
 
@@ -32,10 +33,13 @@ class PowerPointTranslatorApp:
         
         # 서비스 초기화
         self.ollama_service = OllamaService()
+        self.translation_backend = None  # Ollama 서버 하나면 ollama_service, 아니면 첫 사용 시 생성
         
         # 변수 초기화
         self.ppt_path = None
-        self.translation_thread = None
+        self.engine = None  # 번역 중인 EngineProcess
+        self.engine_poll_id = None
+        self.cancel_deadline = None  # 중지 요청 후 강제 종료할 시각
         self.translation_running = False
         self.start_time = 0
         self.translated_items_count = 0
@@ -52,6 +56,7 @@ class PowerPointTranslatorApp:
         
         # UI 초기화
         self.init_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # 초기 상태 확인
         self.check_ollama_status()
@@ -102,7 +107,11 @@ class PowerPointTranslatorApp:
         self.source_lang = options_components["source_lang"]
         self.target_lang = options_components["target_lang"]
         self.text_model_var = options_components["text_model_var"]
-        self.text_model_combo = options_components["text_model_combo"]        
+        self.text_model_combo = options_components["text_model_combo"]
+        self.ocr_backend_var = options_components["ocr_backend_var"]
+        self.extra_target_vars = options_components["extra_target_vars"]
+        self.incremental_var = options_components["incremental_var"]
+
         # 번역 시작/중지 버튼
         self.buttons_frame, self.start_button, self.stop_button = create_buttons_frame(
             self.root, self.start_translation, self.stop_translation
@@ -288,6 +297,14 @@ class PowerPointTranslatorApp:
         
         return installed and running
     
+    def get_translation_backend(self):
+        """번역에 사용할 백엔드 (TRANSLATION_BACKEND 설정)"""
+        if TRANSLATION_BACKEND == "ollama" and len(OLLAMA_URLS) == 1:
+            return self.ollama_service
+        if self.translation_backend is None:
+            self.translation_backend = get_translation_backend(TRANSLATION_BACKEND)
+        return self.translation_backend
+    
     def show_ollama_install_guide(self):
         """Ollama 설치 가이드 표시"""
         response = messagebox.askquestion(
@@ -306,8 +323,8 @@ class PowerPointTranslatorApp:
             # 현재 선택된 모델 저장
             current_text_model = self.text_model_var.get()
             
-            # 모델 목록 가져오기
-            text_models = self.ollama_service.get_text_models()
+            # 모델 목록 가져오기 (OpenAI 호환 서버는 서버가 제공하는 모델)
+            text_models = self.get_translation_backend().get_text_models()
             
             # UI 업데이트
             if text_models:
@@ -414,13 +431,10 @@ class PowerPointTranslatorApp:
         self.translated_items_count = current
         self.translated_items_label.config(text=f"번역된 요소: {current}/{total}")
         self.remaining_items_label.config(text=f"남은 요소: {total - current}")
-        
-        self.root.update_idletasks()
     
     def update_status(self, status_text):
         """상태 메시지 업데이트"""
         self.status_label.config(text=status_text)
-        self.root.update_idletasks()
     
     def start_translation(self):
         """번역 프로세스 시작"""
@@ -483,87 +497,124 @@ class PowerPointTranslatorApp:
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         
-        # 번역 서비스 초기화
-        translation_service = TranslationService(self.ollama_service)
-        
-        # 번역 스레드 시작
+        # 번역 작업 (Tk 변수는 UI 스레드에서 읽어 번역 프로세스에 값으로 전달)
+        source_lang = self.source_lang.get()
+        target_lang = self.target_lang.get()
+        ocr_backend = self.ocr_backend_var.get()
+        target_langs = [target_lang] + [lang for lang, var in self.extra_target_vars.items()
+                                        if var.get() and lang not in (target_lang, source_lang)]
+        self.logger.info(f"번역 설정: {source_lang} → {', '.join(target_langs)}, 모델: {text_model}, OCR: {ocr_backend}")
+        job = {
+            "ppt_path": self.ppt_path,
+            "source_lang": source_lang,
+            "target_langs": target_langs,
+            "text_model": text_model,
+            "ocr_backend": ocr_backend,
+            "incremental": self.incremental_var.get(),
+            "debug_mode": self.debug_mode
+        }
+        
+        # 번역 프로세스 시작 (설정한 번역 백엔드 사용, Ollama 서버가 여러 개면 서버 풀로 요청 분산)
         self.translation_running = True
         self.start_time = time.time()
+        self.cancel_deadline = None
         
         # 타이머 시작
         self.timer_running = True
         self.update_timer()
         
-        # 번역 스레드 시작
-        self.translation_thread = threading.Thread(
-            target=self.translation_process,
-            args=(translation_service, self.debug_mode)
-        )
-        self.translation_thread.daemon = True
-        self.translation_thread.start()
+        try:
+            self.engine = EngineProcess()
+            self.engine.start(job)
+        except Exception as e:
+            self.logger.exception(f"번역 프로세스 시작 오류: {e}")
+            self.finish_translation()
+            self.show_error_message(str(e))
+            return
+        
+        # 번역 프로세스 메시지를 일정 주기로 반영
+        self.engine_poll_id = self.root.after(UI_REFRESH_MS, self.poll_engine)
     
     def stop_translation(self):
-        """번역 프로세스 중지"""
-        self.translation_running = False
-        self.timer_running = False  # 타이머 중지
+        """번역 프로세스 중지 (다음 진행 보고 시점에 중단, 유예 시간이 지나면 강제 종료)"""
+        if not self.translation_running or self.engine is None:
+            return
+        self.engine.cancel()
+        self.cancel_deadline = time.time() + ENGINE_CANCEL_GRACE_SECONDS
+        self.stop_button.config(state=tk.DISABLED)
         self.status_label.config(text="번역 중지 중...")
         self.logger.info("사용자에 의한 번역 중지")
     
-    def translation_process(self, translation_service, debug_mode=False):
-        """번역 프로세스 실행"""
-        output_path = None
+    def poll_engine(self):
+        """번역 프로세스 메시지 반영 (UI_REFRESH_MS마다 메인 스레드에서 실행)"""
+        self.engine_poll_id = None
+        if self.engine is None:
+            return
         
-        try:
-            # 옵션 가져오기
-            source_lang = self.source_lang.get()
-            target_lang = self.target_lang.get()
-            text_model = self.text_model_var.get()
-            
-            self.logger.info(f"번역 설정: {source_lang} → {target_lang}, 모델: {text_model}")
-            
-            # 번역 옵션
-            options = {
-                "source_lang": source_lang,
-                "debug_mode": debug_mode
-            }
-            
-            # 번역 서비스 호출
-            output_path = translation_service.translate_ppt(
-                self.ppt_path, 
-                source_lang, 
-                target_lang, 
-                text_model,
-                self.update_progress,
-                self.update_status,
-                options
-            )
-            
-            # 타이머 중지
-            self.timer_running = False
-            
-            # 완료 메시지 - 메인 스레드에서 실행
-            elapsed_time = time.time() - self.start_time
-            final_elapsed_time = elapsed_time
-            
-            # 메인 스레드에서 메시지 박스 표시
-            self.root.after(0, lambda: self.show_completion_message(output_path, final_elapsed_time))
-            
-        except Exception as e:
-            # 타이머 중지
-            self.timer_running = False
-            self.logger.exception(f"번역 프로세스 오류: {str(e)}")
-            
-            # 오류 메시지 - 메인 스레드에서 실행
-            error_msg = str(e)
-            self.root.after(0, lambda: self.show_error_message(error_msg))
-            
-        finally:
-            self.translation_running = False
-            self.timer_running = False
-            
-            # 버튼 상태 변경 - 메인 스레드에서 실행
-            self.root.after(0, self.reset_ui_after_translation)
-            
+        result = self.drain_engine_messages()
+        if result is None and not self.engine.is_alive():
+            # 마지막 확인과 종료 사이에 보낸 메시지('done' 등)가 남아 있을 수 있어 한 번 더 가져옴
+            self.engine.join()
+            result = self.drain_engine_messages()
+            if result is None:
+                exitcode = self.engine.process.exitcode
+                if exitcode:
+                    # 결과를 보내지 못하고 종료된 경우 (메모리 부족 등)
+                    result = ('error', f"번역 프로세스가 비정상 종료됨 (종료 코드 {exitcode})")
+                else:
+                    result = ('error', "번역 프로세스가 결과를 보내지 않고 종료됨")
+        elif result is None and self.cancel_deadline is not None and time.time() > self.cancel_deadline:
+            self.engine.terminate()
+            result = ('cancelled',)
+        elif result is None:
+            self.engine_poll_id = self.root.after(UI_REFRESH_MS, self.poll_engine)
+            return
+        
+        elapsed_time = time.time() - self.start_time
+        self.engine.join(timeout=5)
+        self.finish_translation()
+        if result[0] == 'done':
+            self.show_completion_message(result[1], elapsed_time)
+        elif result[0] == 'error':
+            self.show_error_message(result[1])
+        else:
+            self.status_label.config(text="번역 중지됨")
+    
+    def drain_engine_messages(self):
+        """쌓인 메시지를 반영하고 마지막 결과 메시지(done, error, cancelled)를 반환 (없으면 None)"""
+        progress = None
+        result = None
+        for message in self.engine.poll():
+            kind = message[0]
+            if kind == 'progress':
+                # 한 주기 동안 쌓인 진행률은 마지막 값만 반영
+                progress = message[1:]
+            elif kind == 'status':
+                self.update_status(message[1])
+            elif kind == 'log':
+                record = message[1]
+                logging.getLogger(record.name).handle(record)
+            elif kind in ('done', 'error', 'cancelled'):
+                result = message
+        if progress is not None:
+            self.update_progress(*progress)
+        return result
+    
+    def finish_translation(self):
+        """번역 종료 후 상태 정리"""
+        self.translation_running = False
+        self.timer_running = False
+        self.engine = None
+        self.cancel_deadline = None
+        self.reset_ui_after_translation()
+    
+    def on_close(self):
+        """창 닫기 (번역 중이면 번역 프로세스도 종료)"""
+        if self.engine is not None:
+            self.engine.cancel()
+            self.engine.terminate()
+        self.root.destroy()
+    
     def show_completion_message(self, output_path, elapsed_time):
         """번역 완료 메시지 표시 (메인 스레드에서 실행)"""
         self.progress_label.config(text=f"100% (총 소요시간: {self.format_time(elapsed_time)})")
@@ -1,7 +1,7 @@
 # ui/components.py
 import tkinter as tk
 from tkinter import ttk
-from config import DEFAULT_PADDING
+from config import DEFAULT_PADDING, OCR_BACKENDS, DEFAULT_OCR_BACKEND
 import logging
 
 def create_top_frame(root):
@@ -212,6 +212,35 @@ def create_options_frame(root, languages):
                                   state="readonly", width=40)
     text_model_combo.grid(row=1, column=1, columnspan=4, padx=2, pady=3, sticky="ew")
     
+    # OCR 엔진 (작업별 선택)
+    ocr_backend_label = tk.Label(options_frame, text="OCR 엔진:")
+    ocr_backend_label.grid(row=2, column=0, padx=5, pady=3, sticky="e")
+    
+    ocr_backend_var = tk.StringVar(value=DEFAULT_OCR_BACKEND)
+    ocr_backend_combo = ttk.Combobox(options_frame, textvariable=ocr_backend_var,
+                                   values=OCR_BACKENDS, state="readonly", width=10)
+    ocr_backend_combo.grid(row=2, column=1, padx=2, pady=3, sticky="w")
+    
+    # 추가 번역 언어 (선택한 언어마다 결과 파일을 하나씩 생성)
+    extra_targets_label = tk.Label(options_frame, text="추가 번역 언어:")
+    extra_targets_label.grid(row=3, column=0, padx=5, pady=3, sticky="ne")
+    
+    extra_targets_frame = tk.Frame(options_frame)
+    extra_targets_frame.grid(row=3, column=1, columnspan=4, padx=2, pady=3, sticky="w")
+    
+    extra_target_vars = {}
+    for idx, lang in enumerate(languages):
+        var = tk.BooleanVar(value=False)
+        tk.Checkbutton(extra_targets_frame, text=lang, variable=var).grid(
+            row=idx // 4, column=idx % 4, padx=2, sticky="w")
+        extra_target_vars[lang] = var
+    
+    # 증분 번역 (이전 번역 결과에서 바뀐 부분만 다시 번역)
+    incremental_var = tk.BooleanVar(value=False)
+    incremental_check = tk.Checkbutton(options_frame, text="변경된 부분만 번역 (이전 번역 결과 재사용)",
+                                       variable=incremental_var)
+    incremental_check.grid(row=4, column=1, columnspan=4, padx=2, pady=3, sticky="w")
+    
     # Ollama URL 부분 삭제
     
     components = {
@@ -219,6 +248,9 @@ def create_options_frame(root, languages):
         "target_lang": target_lang,
         "text_model_var": text_model_var,
         "text_model_combo": text_model_combo,
+        "ocr_backend_var": ocr_backend_var,
+        "extra_target_vars": extra_target_vars,
+        "incremental_var": incremental_var,
         "swap_button": arrow_button
     }
     
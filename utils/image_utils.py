@@ -4,24 +4,21 @@ import numpy as np
 import os
 import logging
 import time
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
-import pytesseract
-from collections import defaultdict
-import math
-
-from config import MAX_IMAGE_SIZE, MAX_IMAGE_FILESIZE, OCR_LANG_MAPPING
+import importlib.util
+from config import MAX_IMAGE_SIZE, MAX_IMAGE_FILESIZE, OCR_LANG_MAPPING, NO_SPACE_LANGUAGES
+from utils.text_fitter import load_font, wrap_lines, fit_text
+from utils.ocr_layout import boxes_to_array, rects_to_array, box_geometry, cluster_layout, merge_text_blocks
 
 logger = logging.getLogger(__name__)
 
-# PaddleOCR 가용성 확인
-PADDLE_AVAILABLE = False
-try:
-    import paddle
-    import paddleocr
-    from paddleocr import PaddleOCR
-    PADDLE_AVAILABLE = True
+# PaddleOCR 가용성 확인 (무거운 엔진 import는 실제로 사용할 때까지 미룸)
+PADDLE_AVAILABLE = (importlib.util.find_spec("paddle") is not None and
+                    importlib.util.find_spec("paddleocr") is not None)
+if PADDLE_AVAILABLE:
     logger.info("PaddleOCR을 이미지 처리에 사용할 수 있습니다.")
-except ImportError:
+else:
     logger.warning("PaddleOCR을 사용할 수 없어 기본 Tesseract OCR을 사용합니다.")
 
 def resize_image_if_needed(image_path):
@@ -81,8 +78,9 @@ def is_numeric_text(text):
     except ValueError:
         return False
 
-def get_multilingual_font(font_size=24, bold=False):
-    """다국어를 지원하는 폰트 가져오기"""
+@lru_cache(maxsize=2)
+def find_multilingual_font_path(bold=False):
+    """다국어를 지원하는 폰트 경로 찾기 (없으면 None)"""
     # 프로젝트 루트 기준 폰트 경로 계산
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
@@ -124,9 +122,9 @@ def get_multilingual_font(font_size=24, bold=False):
     for path in font_paths:
         if os.path.exists(path):
             try:
-                font = ImageFont.truetype(path, font_size)
-                logger.info(f"폰트 로드 성공: {path} (크기: {font_size}, 볼드: {bold})")
-                return font
+                ImageFont.truetype(path, 12)
+                logger.info(f"폰트 로드 성공: {path} (볼드: {bold})")
+                return path
             except Exception as e:
                 logger.debug(f"폰트 로드 실패: {path}, 오류: {e}")
                 continue
@@ -134,11 +132,15 @@ def get_multilingual_font(font_size=24, bold=False):
     # 볼드 폰트를 찾지 못했는데 볼드를 요청한 경우, 일반 폰트 시도
     if bold:
         logger.warning("볼드 폰트를 찾지 못했습니다. 일반 폰트로 시도합니다.")
-        return get_multilingual_font(font_size, False)
+        return find_multilingual_font_path(False)
     
     # 폰트를 찾지 못한 경우 기본 폰트 사용
     logger.warning("다국어 폰트를 찾을 수 없음, 기본 폰트 사용")
-    return ImageFont.load_default()
+    return None
+
+def get_multilingual_font(font_size=24, bold=False):
+    """다국어를 지원하는 폰트 가져오기"""
+    return load_font(find_multilingual_font_path(bold), font_size)
 
 def estimate_text_properties(block, img_height):
     """OCR 텍스트 블록에서 속성 추정 (폰트 크기, 볼드 여부 등)"""
@@ -179,65 +181,27 @@ def estimate_text_properties(block, img_height):
         'is_bold': is_bold
     }
 
-def group_text_blocks(blocks, min_y_diff=10):
-    """인접한 텍스트 블록을 그룹화하여 문단 형성"""
+def group_text_blocks(blocks):
+    """인접한 텍스트 블록을 그룹화하여 문단 형성 (격자 공간 인덱스 기반, 읽기 순서 유지)"""
     # 블록이 없거나 하나뿐인 경우
     if not blocks or len(blocks) <= 1:
         return [blocks] if blocks else []
-
-    # y좌표(top)에 따라 정렬
-    sorted_blocks = sorted(blocks, key=lambda b: b['top'])
-    
-    groups = []
-    current_group = [sorted_blocks[0]]
-    
-    # 인접한 블록 그룹화 (y좌표 기준)
-    for i in range(1, len(sorted_blocks)):
-        current_block = sorted_blocks[i]
-        previous_block = sorted_blocks[i - 1]
-        
-        # y좌표 차이가 임계값 이하면 같은 그룹
-        if abs(current_block['top'] - previous_block['top']) <= min_y_diff:
-            current_group.append(current_block)
-        else:
-            # 새 그룹 시작
-            groups.append(current_group)
-            current_group = [current_block]
-    
-    # 마지막 그룹 추가
-    if current_group:
-        groups.append(current_group)
     
-    # 각 그룹 내에서 x좌표(left)에 따라 정렬
-    for i in range(len(groups)):
-        groups[i] = sorted(groups[i], key=lambda b: b['left'])
+    boxes = rects_to_array(
+        [block['left'] for block in blocks],
+        [block['top'] for block in blocks],
+        [block['width'] for block in blocks],
+        [block['height'] for block in blocks]
+    )
     
-    return groups
+    # 줄 → 문단 순서로 묶인 인덱스를 단어 블록 목록으로 변환
+    return [[blocks[idx] for line in block_lines for idx in line]
+            for block_lines in cluster_layout(boxes)]
 
 def wrap_text(text, font, max_width):
-    """텍스트를 주어진 폭에 맞게 줄바꿈"""
-    if not text:
-        return []
-        
-    lines = []
-    words = text.split()
-    current_line = words[0]
-    
-    for word in words[1:]:
-        # 현재 줄에 단어를 추가했을 때의 폭 계산
-        test_line = current_line + " " + word
-        test_width = font.getlength(test_line)
-        
-        if test_width <= max_width:
-            current_line = test_line
-        else:
-            lines.append(current_line)
-            current_line = word
-    
-    if current_line:
-        lines.append(current_line)
-    
-    return lines
+    """텍스트를 주어진 폭에 맞게 줄바꿈 (한중일/태국어 등 띄어쓰기 없는 문자 지원)"""
+    font_path = font.path if isinstance(getattr(font, 'path', None), str) else None
+    return wrap_lines(text, font_path, getattr(font, 'size', 10), max_width)
 
 def map_language_to_paddle(lang):
     """언어 코드를 PaddleOCR 언어 코드로 변환"""
@@ -281,106 +245,84 @@ def match_original_and_translated(original_texts, translated_lines):
     
     return mapping
 
-def extract_text_style(img, bbox, text):
+def extract_text_style(img, bbox, text, line_height=None):
     """텍스트 스타일 속성 추출 (폰트 크기, 회전, 색상)"""
-    # 경계 상자에서 높이를 기반으로 폰트 크기 추정
-    x1, y1 = bbox[0]
-    x2, y2 = bbox[2]
-    width = int(math.sqrt((x2 - x1)**2 + (y2 - y1)**2))
-    height = int(math.sqrt((bbox[1][0] - bbox[0][0])**2 + (bbox[1][1] - bbox[0][1])**2))
-    
-    # 텍스트 길이와 높이를 기반으로 대략적인 폰트 크기 추정
-    char_count = len(text)
-    if char_count > 0:
+    geom = box_geometry([bbox])
+    
+    # 텍스트 길이와 높이(블록이면 줄 높이)를 기반으로 대략적인 폰트 크기 추정
+    height = line_height if line_height else float(geom['height'][0])
+    if len(text) > 0:
         font_size = max(12, min(72, int(height * 0.7)))
     else:
         font_size = 16  # 기본 폰트 크기
     
-    # 회전 계산 (bbox 포인트의 각도)
-    dx = bbox[1][0] - bbox[0][0]
-    dy = bbox[1][1] - bbox[0][1]
-    rotation = math.degrees(math.atan2(dy, dx)) if dx != 0 else 0
+    # 회전 계산 (상단 변의 각도)
+    rotation = float(geom['angle'][0])
     
     # 텍스트 영역에서 가장 많이 사용된 색상 추출
-    roi = img[
-        max(0, int(min(p[1] for p in bbox))):min(img.shape[0], int(max(p[1] for p in bbox) + 1)),
-        max(0, int(min(p[0] for p in bbox))):min(img.shape[1], int(max(p[0] for p in bbox) + 1))
-    ]
-    
-    # 색상 샘플링
-    if roi.size > 0:
-        # 이미지 가장자리 영역의 색상은 제외
-        if roi.shape[0] > 4 and roi.shape[1] > 4:
-            inner_roi = roi[2:-2, 2:-2]
-            if inner_roi.size > 0:
-                # 가장 많이 사용된 색상 찾기 (BGR)
-                pixels = inner_roi.reshape(-1, 3)
-                color_count = defaultdict(int)
-                for pixel in pixels:
-                    color_count[tuple(pixel)] += 1
-                
-                # 가장 많이 사용된 색상 선택
-                dominant_color = max(color_count.items(), key=lambda x: x[1])[0]
-                
-                # 검은색이나 흰색이 지배적이면 텍스트 색상일 가능성이 높음
-                black_like = sum(c < 50 for c in dominant_color) >= 2
-                white_like = sum(c > 200 for c in dominant_color) >= 2
-                
-                if black_like:
-                    color = (0, 0, 0)  # 검은색
-                elif white_like:
-                    color = (255, 255, 255)  # 흰색
-                else:
-                    color = dominant_color
-            else:
-                color = (0, 0, 0)  # 기본 검은색
+    y1 = max(0, int(geom['y_min'][0]))
+    y2 = min(img.shape[0], int(geom['y_max'][0]) + 1)
+    x1 = max(0, int(geom['x_min'][0]))
+    x2 = min(img.shape[1], int(geom['x_max'][0]) + 1)
+    roi = img[y1:y2, x1:x2]
+    
+    color = (0, 0, 0)  # 기본 검은색
+    
+    # 이미지 가장자리 영역의 색상은 제외
+    if roi.ndim == 3 and roi.shape[0] > 4 and roi.shape[1] > 4:
+        pixels = roi[2:-2, 2:-2].reshape(-1, 3).astype(np.int32)
+        
+        # BGR 픽셀을 정수 키로 묶어 가장 많이 사용된 색상 찾기
+        keys = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+        values, counts = np.unique(keys, return_counts=True)
+        dominant = int(values[np.argmax(counts)])
+        b, g, r = (dominant >> 16) & 0xFF, (dominant >> 8) & 0xFF, dominant & 0xFF
+        
+        # 검은색이나 흰색이 지배적이면 텍스트 색상일 가능성이 높음
+        black_like = sum(c < 50 for c in (b, g, r)) >= 2
+        white_like = sum(c > 200 for c in (b, g, r)) >= 2
+        
+        if black_like:
+            color = (0, 0, 0)  # 검은색
+        elif white_like:
+            color = (255, 255, 255)  # 흰색
         else:
-            color = (0, 0, 0)  # 기본 검은색
-    else:
-        color = (0, 0, 0)  # 기본 검은색
+            color = (r, g, b)  # PIL 렌더링용 RGB
     
     return font_size, rotation, color
 
-def insert_text_with_style(img, text, bbox, font_size, rotation, color):
-    """스타일을 유지하면서 번역된 텍스트 삽입"""
-    # 텍스트 영역 중심점 계산
-    center_x = sum(p[0] for p in bbox) / 4
-    center_y = sum(p[1] for p in bbox) / 4
+def draw_text_in_box(pil_img, text, bbox, font_size, rotation, color, max_font_size=None):
+    """PIL 이미지의 텍스트 영역에 번역된 텍스트를 그림 (상자에 맞는 최대 크기, 중앙 정렬, 회전 지원)"""
+    geom = box_geometry([bbox])
+    center_x = float(geom['cx'][0])
+    center_y = float(geom['cy'][0])
     
-    # 텍스트 영역 크기 계산
-    width = max(p[0] for p in bbox) - min(p[0] for p in bbox)
-    height = max(p[1] for p in bbox) - min(p[1] for p in bbox)
-    
-    # 이미지를 PIL Image로 변환
-    pil_img = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-    draw = ImageDraw.Draw(pil_img)
-    
-    # 폰트 로드
-    font = get_multilingual_font(font_size, False)
+    # 회전된 상자는 변의 길이, 그 외에는 축 정렬 크기 사용
+    if abs(rotation) > 0.5:
+        width, height = float(geom['width'][0]), float(geom['height'][0])
+    else:
+        width = float(geom['x_max'][0] - geom['x_min'][0])
+        height = float(geom['y_max'][0] - geom['y_min'][0])
     
-    # 텍스트 줄 나누기
-    lines = text.split('\n')
+    # 원본 상자에 들어가는 가장 큰 폰트 크기와 줄바꿈 계산
+    font_path = find_multilingual_font_path(False)
+    font_size, lines, line_height = fit_text(text, max(width, 1.0), max(height, 1.0), font_path,
+                                             max_font_size or font_size)
+    font = load_font(font_path, font_size)
+    text_height = line_height * len(lines)
     
     # 회전 이미지 준비
     if abs(rotation) > 0.5:
         # 투명한 이미지 생성
-        txt_img = Image.new('RGBA', (int(width * 1.5), int(height * 1.5)), (255, 255, 255, 0))
+        txt_img = Image.new('RGBA', (int(max(width, 1) * 1.5), int(max(height, text_height) * 1.5)), (255, 255, 255, 0))
         txt_draw = ImageDraw.Draw(txt_img)
         
-        # 텍스트 그리기
-        text_width, text_height = 0, 0
-        for i, line in enumerate(lines):
-            w, h = txt_draw.textsize(line, font=font)
-            text_width = max(text_width, w)
-            text_height += h
-        
         # 텍스트 중앙 정렬하여 그리기
-        y_offset = (txt_img.height - text_height) // 2
+        y_offset = (txt_img.height - text_height) / 2
         for line in lines:
-            w, h = txt_draw.textsize(line, font=font)
-            x_pos = (txt_img.width - w) // 2
+            x_pos = (txt_img.width - font.getlength(line)) / 2
             txt_draw.text((x_pos, y_offset), line, fill=color, font=font)
-            y_offset += h
+            y_offset += line_height
         
         # 회전
         txt_img = txt_img.rotate(-rotation, expand=True, resample=Image.BICUBIC)
@@ -391,14 +333,21 @@ def insert_text_with_style(img, text, bbox, font_size, rotation, color):
         pil_img.paste(txt_img, (x_pos, y_pos), txt_img)
     else:
         # 회전이 없는 경우 직접 그리기
-        total_height = sum(draw.textsize(line, font=font)[1] for line in lines)
-        y_offset = center_y - total_height // 2
+        draw = ImageDraw.Draw(pil_img)
+        y_offset = center_y - text_height / 2
         
         for line in lines:
-            w, h = draw.textsize(line, font=font)
-            x_pos = center_x - w // 2
+            x_pos = center_x - font.getlength(line) / 2
             draw.text((x_pos, y_offset), line, fill=color, font=font)
-            y_offset += h
+            y_offset += line_height
+    
+    return pil_img
+
+def insert_text_with_style(img, text, bbox, font_size, rotation, color):
+    """스타일을 유지하면서 번역된 텍스트 삽입"""
+    # 이미지를 PIL Image로 변환
+    pil_img = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+    draw_text_in_box(pil_img, text, bbox, font_size, rotation, color)
     
     # PIL 이미지를 다시 OpenCV 이미지로 변환
     result_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
@@ -421,75 +370,33 @@ def enhanced_overlay_text(image_path, translated_text, source_lang=None):
             return basic_overlay_text(image_path, translated_text)
         
         # 1. PaddleOCR로 텍스트 영역 감지
-        ocr = PaddleOCR(use_angle_cls=True, lang=map_language_to_paddle(source_lang))
-        result = ocr.ocr(image_path, cls=True)
+        from services.ocr import get_ocr_backend
+        ocr_lines = get_ocr_backend("paddle", source_lang).ocr(img)
         
-        logger.debug(f"PaddleOCR 결과: {result}")
+        logger.debug(f"PaddleOCR 결과: {ocr_lines}")
         
         # 텍스트 블록 없으면 기본 방식 사용
-        if not result or len(result[0]) == 0:
+        if not ocr_lines:
             logger.warning("PaddleOCR: 텍스트 블록을 찾을 수 없습니다.")
             return basic_overlay_text(image_path, translated_text)
         
-        # 2. 추출된 텍스트와 번역된 텍스트 매핑
-        original_texts = []
-        text_regions = []
-        
-        for line in result[0]:
-            bbox = line[0]  # 텍스트 경계 상자
-            text = line[1][0]  # 텍스트 내용
-            confidence = line[1][1]  # 신뢰도
-            
-            logger.debug(f"감지된 텍스트: '{text}', 신뢰도: {confidence}, 위치: {bbox}")
-            
-            if confidence > 0.6 and len(text.strip()) > 1:
-                # 숫자만 있는 텍스트는 제외
-                if not is_numeric_text(text):
-                    original_texts.append(text)
-                    text_regions.append(bbox)
+        # 2. 유효한 텍스트 영역 추출
+        regions = extract_ocr_regions(ocr_lines)
         
         # 감지된 텍스트가 없으면 기본 방식 사용
-        if not original_texts:
+        if not regions:
             logger.warning("PaddleOCR: 유효한 텍스트가 감지되지 않았습니다.")
             return basic_overlay_text(image_path, translated_text)
         
         # 번역된 텍스트 분할 (원본 텍스트 블록 수에 맞게)
+        original_texts = [region['text'] for region in regions]
         translated_lines = translated_text.split('\n')
         text_mapping = match_original_and_translated(original_texts, translated_lines)
-        
-        # 결과 이미지 준비
-        result_img = img.copy()
+        for region in regions:
+            region['translated'] = text_mapping.get(region['text'], "")
         
         # 3. 각 텍스트 영역 처리
-        for i, bbox in enumerate(text_regions):
-            if i >= len(original_texts):
-                continue
-            
-            # 원본 텍스트
-            original_text = original_texts[i]
-            # 번역된 텍스트
-            translated_text = text_mapping.get(original_text, "")
-            
-            if not translated_text:
-                continue
-            
-            logger.debug(f"텍스트 번역: '{original_text}' -> '{translated_text}'")
-            
-            # 텍스트 영역 마스크 생성
-            mask = np.zeros(img.shape[:2], dtype=np.uint8)
-            points = np.array([[int(p[0]), int(p[1])] for p in bbox], dtype=np.int32)
-            cv2.fillPoly(mask, [points], 255)
-            
-            # 4. 인페인팅으로 원본 텍스트 제거
-            result_img = cv2.inpaint(result_img, mask, 3, cv2.INPAINT_TELEA)
-            
-            # 5. 텍스트 스타일 속성 추출 (색상, 크기, 각도)
-            font_size, rotation, color = extract_text_style(img, bbox, original_text)
-            logger.debug(f"추출된 스타일: 폰트 크기 {font_size}, 회전 {rotation}, 색상 {color}")
-            
-            # 6. 번역된 텍스트 삽입 (스타일 보존)
-            result_img = insert_text_with_style(result_img, translated_text, bbox, 
-                                             font_size, rotation, color)
+        result_img = render_translated_regions(img, regions)
         
         # 결과 저장
         timestamp = int(time.time() * 1000)
@@ -503,6 +410,132 @@ def enhanced_overlay_text(image_path, translated_text, source_lang=None):
         logger.exception(f"고급 이미지 번역 오류: {e}")
         return basic_overlay_text(image_path, translated_text)
 
+def extract_ocr_regions(ocr_lines, min_confidence=0.6):
+    """PaddleOCR 결과에서 번역 대상 텍스트 영역 추출 (영역마다 고유 ID 부여)"""
+    regions = []
+    
+    for line in ocr_lines or []:
+        bbox = line[0]  # 텍스트 경계 상자
+        text = line[1][0]  # 텍스트 내용
+        confidence = line[1][1]  # 신뢰도
+        
+        logger.debug(f"감지된 텍스트: '{text}', 신뢰도: {confidence}, 위치: {bbox}")
+        
+        if confidence <= min_confidence or len(text.strip()) <= 1:
+            continue
+        
+        # 숫자만 있는 텍스트는 제외
+        if is_numeric_text(text):
+            continue
+        
+        regions.append({
+            'id': f"r{len(regions) + 1}",
+            'bbox': bbox,
+            'text': text,
+            'conf': confidence
+        })
+    
+    return regions
+
+def extract_ocr_blocks(ocr_lines, source_lang=None, min_confidence=0.6):
+    """PaddleOCR 결과를 줄/블록(문단) 단위로 병합하여 번역 대상 영역 추출"""
+    fragments = extract_ocr_regions(ocr_lines, min_confidence)
+    if not fragments:
+        return []
+    
+    # 띄어쓰기가 없는 언어는 조각을 공백 없이 연결
+    separator = "" if source_lang in NO_SPACE_LANGUAGES else " "
+    return merge_text_blocks(
+        [fragment['bbox'] for fragment in fragments],
+        [fragment['text'] for fragment in fragments],
+        [fragment['conf'] for fragment in fragments],
+        separator
+    )
+
+def _is_changed(region):
+    """번역 결과가 원문과 달라 다시 그려야 하는 영역인지 확인"""
+    return bool(region.get('translated')) and region['translated'] != region['text']
+
+def _region_mask(shape, regions):
+    """영역들의 텍스트 상자를 하나로 합친 마스크"""
+    mask = np.zeros(shape[:2], dtype=np.uint8)
+    for region in regions:
+        boxes = boxes_to_array(region.get('boxes', [region['bbox']]))
+        cv2.fillPoly(mask, list(np.rint(boxes).astype(np.int32)), 255)
+    return mask
+
+def remove_text_regions(img, regions):
+    """모든 영역을 하나의 마스크로 합쳐 한 번만 인페인팅한 배경 이미지 반환"""
+    if not regions:
+        return img.copy()
+    return cv2.inpaint(img, _region_mask(img.shape, regions), 3, cv2.INPAINT_TELEA)
+
+def draw_translated_regions(img, background, regions):
+    """텍스트가 지워진 배경에 번역된 텍스트를 삽입 (번역되지 않은 영역은 원본 픽셀 복원)"""
+    result_img = background.copy()
+    
+    # 배경을 여러 언어가 공유하므로 이 언어에서 바뀌지 않은 영역은 원본으로 되돌림
+    unchanged = [region for region in regions if not _is_changed(region)]
+    if unchanged:
+        mask = _region_mask(img.shape, unchanged).astype(bool)
+        result_img[mask] = img[mask]
+    
+    targets = [region for region in regions if _is_changed(region)]
+    if not targets:
+        return result_img
+    
+    # 스타일은 원본에서 추출하고, 번역된 텍스트는 한 번의 PIL 변환으로 모두 삽입
+    pil_img = Image.fromarray(cv2.cvtColor(result_img, cv2.COLOR_BGR2RGB))
+    for region in targets:
+        font_size, rotation, color = extract_text_style(img, region['bbox'], region['text'],
+                                                        region.get('line_height'))
+        rotation = region.get('angle', rotation)
+        logger.debug(f"텍스트 번역 ({region.get('id')}): '{region['text']}' -> '{region['translated']}' "
+                     f"(폰트 크기 {font_size}, 회전 {rotation:.1f}, 색상 {color})")
+        draw_text_in_box(pil_img, region['translated'], region['bbox'], font_size, rotation, color,
+                         max_font_size=region.get('line_height'))
+    
+    return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+
+def render_translated_variants(img, regions_by_lang):
+    """여러 번역 언어의 결과를 한 번의 인페인팅으로 렌더링 → {언어: 결과 이미지}"""
+    # 어느 언어에서든 바뀌는 영역을 모아 배경은 한 번만 생성
+    erase = {}
+    for regions in regions_by_lang.values():
+        for region in regions:
+            if _is_changed(region):
+                erase.setdefault(region.get('id', id(region)), region)
+    background = remove_text_regions(img, list(erase.values()))
+    
+    return {lang: draw_translated_regions(img, background, regions)
+            for lang, regions in regions_by_lang.items()}
+
+def render_translated_regions(img, regions):
+    """영역별 번역 결과를 이미지에 적용 (인페인팅 + 스타일 보존 삽입)"""
+    return render_translated_variants(img, {None: regions})[None]
+
+def overlay_translated_regions(image_path, regions):
+    """영역별로 번역된 텍스트를 이미지에 적용하고 결과 경로 반환"""
+    try:
+        img = cv2.imread(image_path)
+        if img is None:
+            logger.error(f"이미지 로드 실패: {image_path}")
+            return image_path
+        
+        result_img = render_translated_regions(img, regions)
+        
+        # 결과 저장
+        timestamp = int(time.time() * 1000)
+        output_path = f"enhanced_translated_{timestamp}_{os.path.basename(image_path)}"
+        cv2.imwrite(output_path, result_img)
+        logger.info(f"영역 번역 이미지 저장: {output_path}")
+        
+        return output_path
+        
+    except Exception as e:
+        logger.exception(f"영역 번역 이미지 처리 오류: {e}")
+        return image_path
+
 def overlay_text_on_image(image_path, translated_text, source_lang=None):
     """이미지의 텍스트를 번역된 텍스트로 정확히 대체 (위치, 크기, 스타일 유지)"""
     try:
@@ -510,12 +543,6 @@ def overlay_text_on_image(image_path, translated_text, source_lang=None):
         if PADDLE_AVAILABLE:
             return enhanced_overlay_text(image_path, translated_text, source_lang)
 
-        # OCR 언어 설정
-        ocr_lang = 'eng'  # 기본값
-        if source_lang in OCR_LANG_MAPPING:
-            ocr_lang_list = OCR_LANG_MAPPING[source_lang]
-            ocr_lang = '+'.join(ocr_lang_list)
-        
         # 이미지 로드 (PIL 및 OpenCV)
         pil_img = Image.open(image_path)
         cv_img = cv2.imread(image_path)
@@ -525,37 +552,35 @@ def overlay_text_on_image(image_path, translated_text, source_lang=None):
         
         img_height, img_width = cv_img.shape[:2]
         
-        # 텍스트 추출 (세부 정보 포함)
+        # 텍스트 추출 (Tesseract 백엔드, 단어 단위)
         try:
-            import pytesseract
-            custom_config = r'--oem 3 --psm 11'
-            ocr_data = pytesseract.image_to_data(
-                cv_img, lang=ocr_lang, config=custom_config, output_type=pytesseract.Output.DICT
-            )
+            from services.ocr import get_ocr_backend
+            ocr_words = get_ocr_backend("tesseract", source_lang).ocr(cv_img)
         except Exception as e:
             logger.error(f"OCR 오류: {e}")
             return basic_overlay_text(image_path, translated_text)
         
         # 유효한 텍스트 블록 추출
         valid_blocks = []
-        for i in range(len(ocr_data['text'])):
+        for bbox, (text, confidence) in ocr_words:
             # 빈 텍스트나 짧은 텍스트는 제외
-            if not ocr_data['text'][i] or len(ocr_data['text'][i].strip()) < 2:
+            if not text or len(text.strip()) < 2:
                 continue
             
             # 숫자만 있는 텍스트는 제외
-            if is_numeric_text(ocr_data['text'][i]):
+            if is_numeric_text(text):
                 continue
             
             # 유효한 텍스트 블록 필터링 (신뢰도 기준)
-            if int(ocr_data['conf'][i]) > 50:
+            if confidence > 0.5:
+                left, top = int(bbox[0][0]), int(bbox[0][1])
                 block = {
-                    'text': ocr_data['text'][i],
-                    'left': ocr_data['left'][i],
-                    'top': ocr_data['top'][i],
-                    'width': ocr_data['width'][i],
-                    'height': ocr_data['height'][i],
-                    'conf': ocr_data['conf'][i]
+                    'text': text,
+                    'left': left,
+                    'top': top,
+                    'width': int(bbox[2][0]) - left,
+                    'height': int(bbox[2][1]) - top,
+                    'conf': confidence * 100
                 }
                 valid_blocks.append(block)
         
@@ -605,27 +630,26 @@ def overlay_text_on_image(image_path, translated_text, source_lang=None):
             
             # 텍스트 속성 추정 (첫 번째 블록 기준)
             text_props = estimate_text_properties(group[0], img_height)
-            font_size = text_props['font_size']
             is_bold = text_props['is_bold']
             
-            # 적절한 폰트 로드
-            font = get_multilingual_font(font_size, is_bold)
-            
             # 텍스트 영역 지우기 (흰색 또는 배경색으로)
             # PIL에서 직사각형 채우기
             draw.rectangle([left, top, right, bottom], fill=(255, 255, 255))
             
-            # 텍스트가 영역에 맞게 줄바꿈이 필요한지 계산
-            max_width = right - left
-            wrapped_text = wrap_text(translated_text_for_group, font, max_width)
+            # 원본 영역에 들어가는 가장 큰 폰트 크기와 줄바꿈 계산 (원본 단어 높이가 상한)
+            font_path = find_multilingual_font_path(is_bold)
+            max_font_size = max(block['height'] for block in group)
+            font_size, wrapped_text, line_height = fit_text(
+                translated_text_for_group, max(right - left, 1), max(bottom - top, 1), font_path, max_font_size
+            )
+            font = load_font(font_path, font_size)
             
             # 번역된 텍스트 렌더링
             y_offset = top
             for line in wrapped_text:
                 # PIL로 텍스트 그리기 (검정색)
                 draw.text((left, y_offset), line, font=font, fill=(0, 0, 0))
-                # 다음 줄로 이동 (줄 간격은 폰트 크기의 1.2배 정도)
-                y_offset += int(font_size * 1.2)
+                y_offset += line_height
         
         # 결과 저장
         timestamp = int(time.time() * 1000)
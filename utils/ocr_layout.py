@@ -0,0 +1,275 @@
+# utils/ocr_layout.py
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 줄 병합 기준 (박스 높이 대비 비율)
+LINE_BASELINE_TOLERANCE = 0.5  # 기준선(하단) 차이 허용치
+LINE_HEIGHT_RATIO = 1.6        # 같은 줄로 볼 최대 높이 비율
+LINE_GAP_RATIO = 1.5           # 같은 줄로 볼 최대 가로 간격
+
+# 문단(블록) 병합 기준 (줄 높이 대비 비율)
+BLOCK_GAP_RATIO = 0.8          # 같은 블록으로 볼 최대 세로 간격
+BLOCK_HEIGHT_RATIO = 1.4       # 같은 블록으로 볼 최대 줄 높이 비율
+
+def boxes_to_array(bboxes):
+    """OCR 경계 상자 목록을 (N, 4, 2) NumPy 배열로 변환"""
+    if len(bboxes) == 0:
+        return np.zeros((0, 4, 2), dtype=np.float32)
+    return np.asarray(bboxes, dtype=np.float32).reshape(-1, 4, 2)
+
+def rects_to_array(lefts, tops, widths, heights):
+    """(left, top, width, height) 사각형을 (N, 4, 2) 상자 배열로 변환"""
+    x1 = np.asarray(lefts, dtype=np.float32)
+    y1 = np.asarray(tops, dtype=np.float32)
+    x2 = x1 + np.asarray(widths, dtype=np.float32)
+    y2 = y1 + np.asarray(heights, dtype=np.float32)
+    return np.stack([
+        np.stack([x1, y1], axis=-1),
+        np.stack([x2, y1], axis=-1),
+        np.stack([x2, y2], axis=-1),
+        np.stack([x1, y2], axis=-1)
+    ], axis=1)
+
+def box_geometry(boxes):
+    """상자 배열의 기하 속성을 벡터 연산으로 계산 (좌상, 우상, 우하, 좌하 순서 기준)"""
+    boxes = boxes_to_array(boxes)
+    xs = boxes[:, :, 0]
+    ys = boxes[:, :, 1]
+    top_edge = boxes[:, 1] - boxes[:, 0]
+    left_edge = boxes[:, 3] - boxes[:, 0]
+
+    return {
+        'x_min': xs.min(axis=1),
+        'y_min': ys.min(axis=1),
+        'x_max': xs.max(axis=1),
+        'y_max': ys.max(axis=1),
+        'cx': xs.mean(axis=1),
+        'cy': ys.mean(axis=1),
+        'width': np.hypot(top_edge[:, 0], top_edge[:, 1]),
+        'height': np.hypot(left_edge[:, 0], left_edge[:, 1]),
+        'baseline': (boxes[:, 2, 1] + boxes[:, 3, 1]) / 2,
+        'angle': np.degrees(np.arctan2(top_edge[:, 1], top_edge[:, 0]))
+    }
+
+def union_box(boxes):
+    """여러 상자를 감싸는 축 정렬 사각형을 4점 상자로 반환"""
+    boxes = boxes_to_array(boxes)
+    x_min, y_min = boxes[:, :, 0].min(), boxes[:, :, 1].min()
+    x_max, y_max = boxes[:, :, 0].max(), boxes[:, :, 1].max()
+    return np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]], dtype=np.float32)
+
+def _connected_components(count, pairs):
+    """인접 쌍 목록으로 연결 요소 라벨 계산 (Union-Find)"""
+    parent = np.arange(count)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    return np.array([find(i) for i in range(count)])
+
+class GridIndex:
+    """균일 격자 기반 공간 인덱스 (사각형 범위 질의용)"""
+    def __init__(self, x_min, y_min, x_max, y_max, cell_size):
+        self.cell_size = max(float(cell_size), 1.0)
+        self.cells = {}
+
+        # 각 상자를 겹치는 모든 격자 칸에 등록
+        col1 = np.floor(np.asarray(x_min) / self.cell_size).astype(np.int64)
+        row1 = np.floor(np.asarray(y_min) / self.cell_size).astype(np.int64)
+        col2 = np.floor(np.asarray(x_max) / self.cell_size).astype(np.int64)
+        row2 = np.floor(np.asarray(y_max) / self.cell_size).astype(np.int64)
+        for idx in range(len(col1)):
+            for row in range(row1[idx], row2[idx] + 1):
+                for col in range(col1[idx], col2[idx] + 1):
+                    self.cells.setdefault((row, col), []).append(idx)
+
+    def query(self, x1, y1, x2, y2):
+        """사각형 범위와 겹치는 칸에 등록된 상자 인덱스 반환"""
+        col1, col2 = int(x1 // self.cell_size), int(x2 // self.cell_size)
+        row1, row2 = int(y1 // self.cell_size), int(y2 // self.cell_size)
+        found = set()
+        for row in range(row1, row2 + 1):
+            for col in range(col1, col2 + 1):
+                found.update(self.cells.get((row, col), ()))
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+def _build_index(geom):
+    """상자 높이의 중앙값을 칸 크기로 하는 격자 인덱스 생성"""
+    cell_size = 2 * float(np.median(np.maximum(geom['height'], 1.0)))
+    return GridIndex(geom['x_min'], geom['y_min'], geom['x_max'], geom['y_max'], cell_size)
+
+def _neighbor_pairs(geom, reach_x, reach_y, is_adjacent):
+    """격자 인덱스로 주변 후보만 골라 인접 쌍 계산"""
+    index = _build_index(geom)
+    pairs = []
+    for i in range(len(geom['x_min'])):
+        candidates = index.query(geom['x_min'][i] - reach_x[i], geom['y_min'][i] - reach_y[i],
+                                 geom['x_max'][i] + reach_x[i], geom['y_max'][i] + reach_y[i])
+        candidates = candidates[candidates > i]
+        if len(candidates) == 0:
+            continue
+        matched = candidates[is_adjacent(i, candidates)]
+        pairs.extend((i, int(j)) for j in matched)
+    return pairs
+
+def _same_line_pairs(geom):
+    """같은 줄에 속하는 상자 쌍 계산 (기준선, 높이, 가로 간격 기준)"""
+    height = np.maximum(geom['height'], 1.0)
+
+    def is_adjacent(i, js):
+        min_h = np.minimum(height[i], height[js])
+        max_h = np.maximum(height[i], height[js])
+        baseline_diff = np.abs(geom['baseline'][js] - geom['baseline'][i])
+        gap = np.maximum(geom['x_min'][js] - geom['x_max'][i], geom['x_min'][i] - geom['x_max'][js])
+        return ((baseline_diff <= LINE_BASELINE_TOLERANCE * min_h) &
+                (max_h / min_h <= LINE_HEIGHT_RATIO) &
+                (gap <= LINE_GAP_RATIO * max_h))
+
+    # 같은 줄 후보는 좌우로 최대 간격, 위아래로 높이만큼만 탐색
+    reach_x = LINE_GAP_RATIO * LINE_HEIGHT_RATIO * height
+    return _neighbor_pairs(geom, reach_x, height, is_adjacent)
+
+def _same_block_pairs(geom):
+    """같은 블록(문단)에 속하는 줄 쌍 계산 (세로 간격, 줄 높이, 가로 겹침 기준)"""
+    height = np.maximum(geom['height'], 1.0)
+
+    def is_adjacent(i, js):
+        min_h = np.minimum(height[i], height[js])
+        max_h = np.maximum(height[i], height[js])
+        # 위아래 줄 사이의 세로 간격 (겹치면 음수)
+        v_gap = np.maximum(geom['y_min'][js] - geom['y_max'][i], geom['y_min'][i] - geom['y_max'][js])
+        # 가로 범위 겹침
+        h_overlap = np.minimum(geom['x_max'][i], geom['x_max'][js]) - np.maximum(geom['x_min'][i], geom['x_min'][js])
+        return ((v_gap <= BLOCK_GAP_RATIO * min_h) &
+                (max_h / min_h <= BLOCK_HEIGHT_RATIO) &
+                (h_overlap > 0))
+
+    # 같은 블록 후보는 위아래로 최대 줄 간격만큼만 탐색
+    reach_y = BLOCK_GAP_RATIO * BLOCK_HEIGHT_RATIO * height
+    return _neighbor_pairs(geom, np.zeros_like(height), reach_y, is_adjacent)
+
+def _split_by_gaps(indices, start, end):
+    """한 축의 구간 목록을 빈 틈 기준으로 나눔 (XY-cut 한 단계)"""
+    order = indices[np.argsort(start[indices], kind='stable')]
+    groups = [[order[0]]]
+    reach = end[order[0]]
+    for idx in order[1:]:
+        if start[idx] > reach:
+            groups.append([idx])
+        else:
+            groups[-1].append(idx)
+        reach = max(reach, end[idx])
+    return [np.array(group) for group in groups]
+
+def reading_order(x_min, y_min, x_max, y_max):
+    """재귀 XY-cut으로 영역의 읽기 순서 계산 (행 → 단 → 위에서 아래)"""
+    x_min, y_min = np.asarray(x_min), np.asarray(y_min)
+    x_max, y_max = np.asarray(x_max), np.asarray(y_max)
+    ordered = []
+
+    def visit(indices, horizontal):
+        if len(indices) == 1:
+            ordered.append(int(indices[0]))
+            return
+
+        if horizontal:
+            groups = _split_by_gaps(indices, y_min, y_max)
+        else:
+            groups = _split_by_gaps(indices, x_min, x_max)
+
+        if len(groups) == 1:
+            # 반대 축으로도 나뉘지 않으면 위→아래, 왼쪽→오른쪽 순서로 정렬
+            other = _split_by_gaps(indices, x_min, x_max) if horizontal else _split_by_gaps(indices, y_min, y_max)
+            if len(other) == 1:
+                ordered.extend(int(i) for i in sorted(indices, key=lambda i: (y_min[i], x_min[i])))
+                return
+            groups = other
+            horizontal = not horizontal
+
+        for group in groups:
+            visit(group, not horizontal)
+
+    if len(x_min) > 0:
+        visit(np.arange(len(x_min)), True)
+    return ordered
+
+def _group_indices(labels, order_key):
+    """라벨별 인덱스 묶음을 정렬 키 순서대로 반환"""
+    groups = {}
+    for idx in np.argsort(order_key, kind='stable'):
+        groups.setdefault(labels[idx], []).append(int(idx))
+    return list(groups.values())
+
+def cluster_layout(boxes):
+    """OCR 상자를 줄과 블록으로 묶어 읽기 순서대로 반환 (블록 → 줄 → 상자 인덱스)"""
+    boxes = boxes_to_array(boxes)
+    count = len(boxes)
+    if count == 0:
+        return []
+
+    # 1. 조각 → 줄 병합
+    geom = box_geometry(boxes)
+    line_labels = _connected_components(count, _same_line_pairs(geom))
+    line_members = _group_indices(line_labels, geom['x_min'])
+
+    line_boxes = np.stack([union_box(boxes[members]) for members in line_members])
+    line_geom = box_geometry(line_boxes)
+    # 회전된 줄은 구성 상자의 평균 높이를 줄 높이로 사용
+    line_geom['height'] = np.array([geom['height'][members].mean() for members in line_members])
+
+    # 2. 줄 → 블록 병합
+    block_labels = _connected_components(len(line_members), _same_block_pairs(line_geom))
+    block_line_groups = _group_indices(block_labels, line_geom['y_min'])
+
+    # 3. 블록 읽기 순서 계산 (다단 레이아웃 대응)
+    block_rects = np.array([[line_geom['x_min'][lines].min(), line_geom['y_min'][lines].min(),
+                             line_geom['x_max'][lines].max(), line_geom['y_max'][lines].max()]
+                            for lines in block_line_groups])
+    order = reading_order(block_rects[:, 0], block_rects[:, 1], block_rects[:, 2], block_rects[:, 3])
+
+    return [[line_members[line_idx] for line_idx in block_line_groups[block_idx]] for block_idx in order]
+
+def merge_text_blocks(boxes, texts, confidences=None, separator=" "):
+    """OCR 조각을 줄과 블록(문단)으로 병합하여 번역/렌더링 단위 생성"""
+    boxes = boxes_to_array(boxes)
+    count = len(boxes)
+    if count == 0:
+        return []
+
+    if confidences is None:
+        confidences = np.ones(count, dtype=np.float32)
+    confidences = np.asarray(confidences, dtype=np.float32)
+    geom = box_geometry(boxes)
+
+    blocks = []
+    line_count = 0
+    for block_lines in cluster_layout(boxes):
+        members = [idx for line in block_lines for idx in line]
+        line_texts = [separator.join(texts[idx] for idx in line) for line in block_lines]
+        line_heights = [geom['height'][line].mean() for line in block_lines]
+        member_boxes = boxes[members]
+        line_count += len(block_lines)
+
+        blocks.append({
+            'id': f"b{len(blocks) + 1}",
+            'bbox': member_boxes[0] if len(members) == 1 else union_box(member_boxes),
+            'boxes': member_boxes,
+            'text': separator.join(line_texts),
+            'lines': line_texts,
+            'conf': float(confidences[members].mean()),
+            'line_height': float(np.median(line_heights)),
+            'angle': float(np.median(geom['angle'][members]))
+        })
+
+    logger.debug(f"OCR 병합: 조각 {count}개 → 줄 {line_count}개 → 블록 {len(blocks)}개")
+    return blocks
@@ -0,0 +1,107 @@
+# utils/render_pool.py
+import logging
+import multiprocessing
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+import cv2
+import numpy as np
+
+from config import RENDER_POOL_SIZE
+from utils.image_utils import render_translated_variants
+
+logger = logging.getLogger(__name__)
+
+def encode_png(img):
+    """BGR 이미지를 PNG 바이트로 인코딩"""
+    ok, buffer = cv2.imencode('.png', img)
+    if not ok:
+        raise ValueError("PNG 인코딩 실패")
+    return buffer.tobytes()
+
+def render_variants_png(img, regions_by_lang):
+    """언어별 번역 결과를 렌더링해 PNG 바이트로 인코딩 → {언어: PNG 바이트}"""
+    rendered = render_translated_variants(img, regions_by_lang)
+    return {lang: encode_png(result) for lang, result in rendered.items()}
+
+def _render_shared(shm_name, shape, dtype, regions_by_lang):
+    """워커 프로세스: 공유 메모리의 프레임을 복사 없이 읽어 렌더링 후 언어별 PNG 바이트 반환"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    error = None
+    try:
+        frame = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        outputs = render_variants_png(frame, regions_by_lang)
+        del frame
+    except Exception as e:
+        # 예외 추적 정보가 공유 메모리 뷰를 잡고 있으면 close할 수 없으므로 문자열로만 보관
+        error = f"{e}\n{traceback.format_exc()}"
+        outputs = None
+    shm.close()
+    if error:
+        raise RuntimeError(error)
+    return outputs
+
+def _release(shm):
+    """공유 메모리 블록 해제"""
+    try:
+        shm.close()
+        shm.unlink()
+    except Exception as e:
+        logger.warning(f"공유 메모리 해제 실패 ({shm.name}): {e}")
+
+class RenderPool:
+    """인페인팅, 스타일 분석, 텍스트 삽입, PNG 인코딩을 여러 프로세스에서 실행하는 렌더링 풀
+
+    프레임은 공유 메모리로 전달하고(피클 복사 없음) 결과는 PNG 바이트로 돌려받는다.
+    크기가 0이면 현재 스레드에서 바로 렌더링한다.
+    """
+    def __init__(self, size=RENDER_POOL_SIZE):
+        self.size = max(0, size)
+        self.executor = None
+        if self.size > 0:
+            # 번역 스레드들이 실행 중인 프로세스를 fork하지 않도록 forkserver(없으면 spawn) 사용
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload([__name__])
+            else:
+                context = multiprocessing.get_context("spawn")
+            self.executor = ProcessPoolExecutor(max_workers=self.size, mp_context=context)
+        logger.info(f"렌더링 풀 시작: 프로세스 {self.size}개")
+
+    def submit(self, image, regions_by_lang):
+        """이미지와 언어별 번역 영역으로 렌더링 작업 등록 → {언어: PNG 바이트}를 돌려주는 Future
+
+        인페인팅은 이미지당 한 번만 수행하고 언어별로 텍스트만 다시 그린다.
+        """
+        if self.executor is None:
+            future = Future()
+            try:
+                future.set_result(render_variants_png(image, regions_by_lang))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        image = np.ascontiguousarray(image)
+        shm = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1))
+        np.ndarray(image.shape, dtype=image.dtype, buffer=shm.buf)[...] = image
+        try:
+            future = self.executor.submit(_render_shared, shm.name, image.shape, image.dtype.str,
+                                          regions_by_lang)
+        except Exception:
+            _release(shm)
+            raise
+        future.add_done_callback(lambda _: _release(shm))
+        return future
+
+    def close(self, cancel=False):
+        """대기 중인 작업을 마치고 워커 프로세스 종료 (cancel이면 시작하지 않은 작업은 취소)"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=cancel)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 오류나 중지로 빠져나가면 남은 렌더링을 기다리지 않음
+        self.close(cancel=exc_type is not None)
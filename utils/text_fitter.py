@@ -0,0 +1,223 @@
+# utils/text_fitter.py
+import bisect
+import itertools
+import logging
+import threading
+import unicodedata
+from functools import lru_cache
+from PIL import ImageFont
+
+logger = logging.getLogger(__name__)
+
+# 글리프 폭은 기준 크기에서 한 번만 측정하고 크기에 비례해 환산
+REFERENCE_SIZE = 100
+MIN_FONT_SIZE = 8
+
+# 줄 맨 앞에 올 수 없는 문자 (닫는 괄호, 구두점, 작은 가나 등)
+NO_BREAK_BEFORE = set("、。，．,.!?！？:;：；)]}）］｝」』】〕〉》〙〗’”々ゝゞーぁぃぅぇぉっゃゅょゎァィゥェォッャュョヮヵヶ…‥・%％")
+# 줄 맨 끝에 올 수 없는 문자 (여는 괄호, 따옴표 등)
+NO_BREAK_AFTER = set("([{（［｛「『【〔〈《〘〖‘“")
+# 라틴 문자 뒤에서 줄바꿈 가능한 기호
+BREAK_AFTER = set("-/‐–—")
+
+@lru_cache(maxsize=256)
+def load_font(font_path, font_size):
+    """폰트 객체 로드 (경로/크기별 캐시, 경로가 없으면 기본 폰트)"""
+    if font_path:
+        return ImageFont.truetype(font_path, font_size)
+    return ImageFont.load_default(font_size)
+
+def _is_cluster_extender(char):
+    """앞 글자와 하나의 자소 묶음(grapheme)을 이루는 문자인지 확인"""
+    code = ord(char)
+    return (unicodedata.category(char) in ('Mn', 'Mc', 'Me') or
+            code == 0x200D or                    # ZWJ
+            0xFE00 <= code <= 0xFE0F or          # 이체자 선택자
+            0x1F3FB <= code <= 0x1F3FF or        # 피부색 수정자
+            0x1160 <= code <= 0x11FF or          # 한글 중성/종성 자모
+            code == 0x0E33)                      # 태국어 SARA AM
+
+def split_graphemes(text):
+    """텍스트를 자소 묶음(화면상 한 글자) 단위로 분할"""
+    clusters = []
+    for char in text:
+        if clusters and (_is_cluster_extender(char) or clusters[-1].endswith('\u200d')):
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+    return clusters
+
+def _is_ideographic(cluster):
+    """글자 사이 어디서나 줄바꿈이 가능한 문자(한중일 문자, 한글 음절 등)인지 확인"""
+    code = ord(cluster[0])
+    return (0x3040 <= code <= 0x30FF or          # 히라가나, 가타카나
+            0x3400 <= code <= 0x4DBF or          # 한자 확장 A
+            0x4E00 <= code <= 0x9FFF or          # 한자
+            0xAC00 <= code <= 0xD7A3 or          # 한글 음절
+            0xF900 <= code <= 0xFAFF or          # 한자 호환
+            0xFF00 <= code <= 0xFFEF or          # 전각 문자
+            0x3000 <= code <= 0x303F or          # 한중일 기호
+            0x20000 <= code <= 0x2FFFF)          # 한자 확장 B 이후
+
+def _is_southeast_asian(cluster):
+    """띄어쓰기 없이 쓰는 동남아 문자(태국어, 라오어, 크메르어, 미얀마어)인지 확인"""
+    code = ord(cluster[0])
+    return 0x0E00 <= code <= 0x0EFF or 0x1000 <= code <= 0x109F or 0x1780 <= code <= 0x17FF
+
+def break_opportunities(clusters):
+    """각 자소 묶음 앞에서 줄바꿈이 가능한지 여부 계산"""
+    breaks = [False] * len(clusters)
+    for i in range(1, len(clusters)):
+        prev, cur = clusters[i - 1], clusters[i]
+
+        # 공백 앞에서는 끊지 않고 공백 뒤에서 끊음
+        if cur.isspace():
+            continue
+        if prev.isspace():
+            breaks[i] = True
+            continue
+
+        # 금칙 처리
+        if cur[0] in NO_BREAK_BEFORE or prev[0] in NO_BREAK_AFTER:
+            continue
+
+        if (_is_ideographic(prev) or _is_ideographic(cur) or
+                (_is_southeast_asian(prev) and _is_southeast_asian(cur)) or
+                prev[0] in BREAK_AFTER):
+            breaks[i] = True
+    return breaks
+
+class GlyphMetrics:
+    """폰트별 자소 묶음 폭 캐시 (기준 크기에서 측정)"""
+    def __init__(self, font_path):
+        self.font_path = font_path
+        self.font = load_font(font_path, REFERENCE_SIZE)
+        ascent, descent = self.font.getmetrics()
+        self.line_height = ascent + descent
+        self.advances = {}
+        self.lock = threading.Lock()
+
+    def advance(self, cluster):
+        """기준 크기에서의 자소 묶음 폭"""
+        width = self.advances.get(cluster)
+        if width is None:
+            width = self.font.getlength(cluster)
+            with self.lock:
+                self.advances[cluster] = width
+        return width
+
+@lru_cache(maxsize=16)
+def get_glyph_metrics(font_path):
+    """폰트 경로별 글리프 폭 캐시 반환"""
+    return GlyphMetrics(font_path)
+
+class _PreparedText:
+    """줄바꿈 계산용으로 전처리된 문단 (자소 묶음, 줄바꿈 위치, 폭 누적합)"""
+    def __init__(self, paragraph, metrics):
+        self.clusters = split_graphemes(paragraph)
+        breaks = break_opportunities(self.clusters)
+
+        # 각 위치 이하에서 가장 가까운 줄바꿈 가능 위치
+        self.last_break = []
+        last = 0
+        for i, can_break in enumerate(breaks):
+            if can_break:
+                last = i
+            self.last_break.append(last)
+
+        self.prefix = list(itertools.accumulate((metrics.advance(c) for c in self.clusters), initial=0.0))
+
+    def wrap(self, max_width):
+        """기준 크기 단위 폭으로 줄바꿈 (줄 목록, 최대 줄 폭, 강제 분할로도 넘친 경우 여부)"""
+        clusters, prefix = self.clusters, self.prefix
+        count = len(clusters)
+        lines = []
+        widest = 0.0
+        overflow = False
+        start = 0
+
+        while start < count:
+            # 줄 앞 공백 건너뛰기
+            while start < count and clusters[start].isspace():
+                start += 1
+            if start >= count:
+                break
+
+            # 폭 누적합에서 이분 탐색으로 들어갈 수 있는 마지막 위치 찾기
+            end = bisect.bisect_right(prefix, prefix[start] + max_width, lo=start + 1) - 1
+            if end >= count:
+                cut = count
+            elif clusters[end].isspace():
+                cut = end  # 넘치는 위치가 공백이면 공백에서 끊음
+            elif self.last_break[end] > start:
+                cut = self.last_break[end]
+            else:
+                cut = max(end, start + 1)  # 줄바꿈 위치가 없으면 강제 분할
+
+            # 줄 끝 공백은 폭 계산에서 제외
+            stop = cut
+            while stop > start and clusters[stop - 1].isspace():
+                stop -= 1
+            line = "".join(clusters[start:stop])
+            line_width = prefix[stop] - prefix[start]
+            if line_width > max_width:
+                overflow = True
+            widest = max(widest, line_width)
+            lines.append(line)
+            start = cut
+
+        return lines, widest, overflow
+
+def _prepare(text, metrics):
+    """텍스트를 문단(명시적 줄바꿈) 단위로 전처리"""
+    return [_PreparedText(paragraph, metrics) for paragraph in text.split('\n')]
+
+def _wrap_prepared(prepared, max_width):
+    """전처리된 문단들을 줄바꿈하여 합침"""
+    lines = []
+    overflow = False
+    for paragraph in prepared:
+        paragraph_lines, _, paragraph_overflow = paragraph.wrap(max_width)
+        lines.extend(paragraph_lines or [""])
+        overflow = overflow or paragraph_overflow
+    return lines, overflow
+
+def wrap_lines(text, font_path, font_size, max_width):
+    """주어진 폰트 크기에서 텍스트를 폭에 맞게 줄바꿈"""
+    if not text or not text.strip():
+        return []
+    metrics = get_glyph_metrics(font_path)
+    scale = font_size / REFERENCE_SIZE
+    lines, _ = _wrap_prepared(_prepare(text, metrics), max_width / scale)
+    return lines
+
+def fit_text(text, box_width, box_height, font_path, max_size, min_size=MIN_FONT_SIZE):
+    """상자에 들어가는 가장 큰 폰트 크기를 이분 탐색 (폰트 크기, 줄 목록, 줄 높이)"""
+    metrics = get_glyph_metrics(font_path)
+    prepared = _prepare(text, metrics)
+    max_size = max(int(max_size), min_size)
+
+    def layout(size):
+        scale = size / REFERENCE_SIZE
+        lines, overflow = _wrap_prepared(prepared, box_width / scale)
+        line_height = metrics.line_height * scale
+        fits = not overflow and len(lines) * line_height <= box_height
+        return fits, lines, line_height
+
+    # 가장 큰 크기가 맞으면 바로 사용
+    fits, lines, line_height = layout(max_size)
+    if fits:
+        return max_size, lines, line_height
+
+    best = (min_size, *layout(min_size)[1:])
+    low, high = min_size, max_size - 1
+    while low <= high:
+        size = (low + high) // 2
+        fits, lines, line_height = layout(size)
+        if fits:
+            best = (size, lines, line_height)
+            low = size + 1
+        else:
+            high = size - 1
+
+    return best